@@ -1,19 +1,30 @@
 """Aluvia SDK for Python - local smart proxy for automation workloads and AI agents."""
 
 from aluvia_sdk.api.aluvia_api import AluviaApi
+from aluvia_sdk.client.admission import AdmissionControl
 from aluvia_sdk.client.aluvia_client import AluviaClient
+from aluvia_sdk.client.gateway_pool import GatewayPool
+from aluvia_sdk.client.playwright_pool import BrowserContextPool
+from aluvia_sdk.client.proxy_server import SharedProxyServer
 from aluvia_sdk.errors import (
     ApiError,
     InvalidApiKeyError,
     MissingApiKeyError,
     ProxyStartError,
 )
+from aluvia_sdk.sync import SyncAluviaApi, SyncAluviaClient
 
 __version__ = "1.0.0"
 
 __all__ = [
     "AluviaClient",
     "AluviaApi",
+    "SharedProxyServer",
+    "BrowserContextPool",
+    "GatewayPool",
+    "AdmissionControl",
+    "SyncAluviaClient",
+    "SyncAluviaApi",
     "MissingApiKeyError",
     "InvalidApiKeyError",
     "ApiError",
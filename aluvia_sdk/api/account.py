@@ -2,14 +2,33 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Protocol, Union
+import asyncio
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+)
 
+from aluvia_sdk import codec
+from aluvia_sdk.api.models import AccountRecord, ConnectionRecord, R
 from aluvia_sdk.api.types import (
     Account,
     AccountConnection,
     AccountConnectionDeleteResult,
+    AccountConnectionSpec,
     AccountPayment,
     AccountUsage,
+    BulkItemResult,
 )
 from aluvia_sdk.errors import ApiError, InvalidApiKeyError
 
@@ -17,6 +36,8 @@ from aluvia_sdk.errors import ApiError, InvalidApiKeyError
 class ApiContext(Protocol):
     """Protocol for API request context."""
 
+    records: bool
+
     async def request(
         self,
         method: str,
@@ -25,24 +46,43 @@ class ApiContext(Protocol):
         body: Optional[Any] = None,
         headers: Optional[Dict[str, str]] = None,
         etag: Optional[str] = None,
+        coalesce: bool = False,
     ) -> Dict[str, Any]:
         """Make an API request."""
         ...
 
+    def stream(
+        self, path: str, query: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[Any, None]:
+        """Stream the items of a list endpoint."""
+        ...
+
 
 def _is_dict(value: Any) -> bool:
     """Check if value is a dictionary."""
     return isinstance(value, dict)
 
 
+def _to_record(ctx: ApiContext, cls: Type[R], data: Any) -> Union[R, Dict[str, Any]]:
+    """Convert response data to a record if enabled, treating a missing object as empty."""
+    if not _is_dict(data):
+        data = {}
+    return cls.from_json(data) if ctx.records else data
+
+
+def _to_records(ctx: ApiContext, cls: Type[R], items: Any) -> List[Any]:
+    """Convert a response list to records if enabled."""
+    if ctx.records:
+        return cls.from_json_list(items)
+    return items if isinstance(items, list) else []
+
+
 def _format_error_details(details: Any) -> str:
     """Format error details for display."""
     if details is None:
         return ""
     try:
-        import json
-
-        json_str = json.dumps(details)
+        json_str = codec.dumps(details).decode("utf-8")
         return json_str[:500] + "…" if len(json_str) > 500 else json_str
     except Exception:
         return str(details)
@@ -65,9 +105,12 @@ def _throw_for_non_2xx(result: Dict[str, Any]) -> None:
         raise ApiError(
             f"API request failed (HTTP {status}) code={code} message={message}{details_suffix}",
             status_code=status,
+            attempts=result.get("attempts"),
         )
 
-    raise ApiError(f"API request failed (HTTP {status})", status_code=status)
+    raise ApiError(
+        f"API request failed (HTTP {status})", status_code=status, attempts=result.get("attempts")
+    )
 
 
 async def _request_and_unwrap(
@@ -78,9 +121,10 @@ async def _request_and_unwrap(
     body: Optional[Any] = None,
     headers: Optional[Dict[str, str]] = None,
     etag: Optional[str] = None,
+    coalesce: bool = False,
 ) -> Dict[str, Any]:
     """Make a request and unwrap the response envelope."""
-    result = await ctx.request(method, path, query, body, headers, etag)
+    result = await ctx.request(method, path, query, body, headers, etag, coalesce=coalesce)
 
     if result["status"] < 200 or result["status"] >= 300:
         _throw_for_non_2xx(result)
@@ -99,17 +143,67 @@ async def _request_and_unwrap(
     return {"data": data, "etag": etag_result}
 
 
+T = TypeVar("T")
+
+
+async def _bounded_map(
+    items: Iterable[T], fn: Callable[[T], Awaitable[Any]], concurrency: int
+) -> AsyncGenerator[BulkItemResult, None]:
+    """
+    Run fn over items with at most `concurrency` calls in flight.
+
+    Items are consumed lazily and results are yielded in completion order; an
+    exception from fn is reported on its item instead of stopping the batch.
+    Closing the iterator early cancels the calls still in flight.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    async def run(index: int, item: T) -> BulkItemResult:
+        try:
+            return {"index": index, "item": item, "result": await fn(item), "error": None}
+        except Exception as e:
+            return {"index": index, "item": item, "result": None, "error": e}
+
+    iterator = enumerate(items)
+    pending: Set["asyncio.Task[BulkItemResult]"] = set()
+    try:
+        for index, item in iterator:
+            pending.add(asyncio.ensure_future(run(index, item)))
+            if len(pending) >= concurrency:
+                break
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                # Refill the freed slot before handing the result to the caller
+                next_item = next(iterator, None)
+                if next_item is not None:
+                    pending.add(asyncio.ensure_future(run(*next_item)))
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
 class ConnectionsApi:
     """Account connections API."""
 
     def __init__(self, ctx: ApiContext) -> None:
         self.ctx = ctx
 
-    async def list(self) -> List[AccountConnection]:
-        """List all account connections."""
-        result = await _request_and_unwrap(self.ctx, "GET", "/account/connections")
-        data = result["data"]
-        return data if isinstance(data, list) else []
+    async def list(
+        self, coalesce: bool = False
+    ) -> List[Union[AccountConnection, ConnectionRecord]]:
+        """
+        List all account connections.
+
+        Args:
+            coalesce: Share the response of an identical request already in flight
+        """
+        result = await _request_and_unwrap(
+            self.ctx, "GET", "/account/connections", coalesce=coalesce
+        )
+        return _to_records(self.ctx, ConnectionRecord, result["data"])
 
     async def create(
         self,
@@ -117,7 +211,7 @@ class ConnectionsApi:
         rules: Optional[List[str]] = None,
         session_id: Optional[str] = None,
         target_geo: Optional[str] = None,
-    ) -> AccountConnection:
+    ) -> Union[AccountConnection, ConnectionRecord]:
         """Create a new account connection."""
         body: Dict[str, Any] = {}
         if description is not None:
@@ -130,12 +224,22 @@ class ConnectionsApi:
             body["target_geo"] = target_geo
 
         result = await _request_and_unwrap(self.ctx, "POST", "/account/connections", body=body)
-        return result["data"] or {}
-
-    async def get(self, connection_id: Union[int, str]) -> AccountConnection:
-        """Get a specific connection by ID."""
-        result = await _request_and_unwrap(self.ctx, "GET", f"/account/connections/{connection_id}")
-        return result["data"] or {}
+        return _to_record(self.ctx, ConnectionRecord, result["data"])  # type: ignore[return-value]
+
+    async def get(
+        self, connection_id: Union[int, str], coalesce: bool = False
+    ) -> Union[AccountConnection, ConnectionRecord]:
+        """
+        Get a specific connection by ID.
+
+        Args:
+            connection_id: Connection ID
+            coalesce: Share the response of an identical request already in flight
+        """
+        result = await _request_and_unwrap(
+            self.ctx, "GET", f"/account/connections/{connection_id}", coalesce=coalesce
+        )
+        return _to_record(self.ctx, ConnectionRecord, result["data"])  # type: ignore[return-value]
 
     async def patch(
         self,
@@ -145,7 +249,7 @@ class ConnectionsApi:
         session_id: Optional[str] = None,
         target_geo: Optional[str] = None,
         **kwargs: Any,
-    ) -> AccountConnection:
+    ) -> Union[AccountConnection, ConnectionRecord]:
         """Update a connection."""
         body: Dict[str, Any] = {}
         if description is not None:
@@ -162,7 +266,7 @@ class ConnectionsApi:
         result = await _request_and_unwrap(
             self.ctx, "PATCH", f"/account/connections/{connection_id}", body=body
         )
-        return result["data"] or {}
+        return _to_record(self.ctx, ConnectionRecord, result["data"])  # type: ignore[return-value]
 
     async def delete(self, connection_id: Union[int, str]) -> AccountConnectionDeleteResult:
         """Delete a connection."""
@@ -171,6 +275,50 @@ class ConnectionsApi:
         )
         return result["data"] or {"connection_id": str(connection_id), "deleted": False}
 
+    def create_many(
+        self, specs: Iterable[AccountConnectionSpec], concurrency: int = 16
+    ) -> AsyncGenerator[BulkItemResult, None]:
+        """
+        Create connections with bounded parallelism.
+
+        Requests share the API client's connection pool, rate limiter and retry
+        policy. Results are yielded as they complete; a failed item carries its
+        exception in 'error' instead of aborting the batch.
+
+        Args:
+            specs: Connection fields per connection (consumed lazily)
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Async iterator of BulkItemResult, with the created connection in 'result'
+
+        Example:
+            >>> specs = [{"description": f"agent-{i}"} for i in range(1000)]
+            >>> async for item in api.account.connections.create_many(specs, concurrency=32):
+            ...     if item["error"] is None:
+            ...         print(item["result"]["connection_id"])
+        """
+
+        async def create(spec: AccountConnectionSpec) -> Union[AccountConnection, ConnectionRecord]:
+            return await self.create(**spec)
+
+        return _bounded_map(specs, create, concurrency)
+
+    def delete_many(
+        self, connection_ids: Iterable[Union[int, str]], concurrency: int = 16
+    ) -> AsyncGenerator[BulkItemResult, None]:
+        """
+        Delete connections with bounded parallelism.
+
+        Args:
+            connection_ids: Connection IDs to delete (consumed lazily)
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Async iterator of BulkItemResult, with the delete result in 'result'
+        """
+        return _bounded_map(connection_ids, self.delete, concurrency)
+
 
 class AccountApi:
     """Account API namespace."""
@@ -179,18 +327,65 @@ class AccountApi:
         self.ctx = ctx
         self.connections = ConnectionsApi(ctx)
 
-    async def get(self) -> Account:
-        """Get account information."""
-        result = await _request_and_unwrap(self.ctx, "GET", "/account")
-        return result["data"] or {}
+    async def get(self, coalesce: bool = False) -> Union[Account, AccountRecord]:
+        """
+        Get account information.
 
-    async def usage(self) -> AccountUsage:
-        """Get account usage."""
-        result = await _request_and_unwrap(self.ctx, "GET", "/account/usage")
+        Args:
+            coalesce: Share the response of an identical request already in flight
+        """
+        result = await _request_and_unwrap(self.ctx, "GET", "/account", coalesce=coalesce)
+        return _to_record(self.ctx, AccountRecord, result["data"])  # type: ignore[return-value]
+
+    async def usage(self, coalesce: bool = False) -> AccountUsage:
+        """
+        Get account usage.
+
+        Args:
+            coalesce: Share the response of an identical request already in flight
+        """
+        result = await _request_and_unwrap(self.ctx, "GET", "/account/usage", coalesce=coalesce)
         return result["data"] or {}
 
-    async def payments(self) -> List[AccountPayment]:
-        """Get account payments."""
-        result = await _request_and_unwrap(self.ctx, "GET", "/account/payments")
+    async def payments(self, coalesce: bool = False) -> List[AccountPayment]:
+        """
+        Get account payments.
+
+        Args:
+            coalesce: Share the response of an identical request already in flight
+        """
+        result = await _request_and_unwrap(self.ctx, "GET", "/account/payments", coalesce=coalesce)
         data = result["data"]
         return data if isinstance(data, list) else []
+
+    async def iter_connections(
+        self,
+    ) -> AsyncGenerator[Union[AccountConnection, ConnectionRecord], None]:
+        """
+        Iterate over all account connections as the response arrives.
+
+        Unlike connections.list(), items are parsed one at a time from the response
+        stream, so memory use stays constant and processing starts with the first
+        item.
+
+        Example:
+            >>> async for connection in api.account.iter_connections():
+            ...     print(connection["connection_id"])
+        """
+        stream = self.ctx.stream("/account/connections")
+        try:
+            async for item in stream:
+                if _is_dict(item):
+                    yield ConnectionRecord.from_json(item) if self.ctx.records else item
+        finally:
+            # Release the response if the caller stops early
+            await stream.aclose()
+
+    async def iter_payments(self) -> AsyncGenerator[AccountPayment, None]:
+        """Iterate over account payments as the response arrives (see iter_connections())."""
+        stream = self.ctx.stream("/account/payments")
+        try:
+            async for item in stream:
+                yield item
+        finally:
+            await stream.aclose()
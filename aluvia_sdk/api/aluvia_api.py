@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, AsyncGenerator, Dict, Optional, Union
 
 import httpx
 
 from aluvia_sdk.api.account import AccountApi
+from aluvia_sdk.api.cache import ApiResponseCache
 from aluvia_sdk.api.geos import GeosApi
-from aluvia_sdk.api.request import request_core
+from aluvia_sdk.api.rate_limit import RateLimiter
+from aluvia_sdk.api.request import request_core, stream_core
+from aluvia_sdk.api.retry import RetryPolicy
+from aluvia_sdk.api.singleflight import SingleFlight
 from aluvia_sdk.errors import MissingApiKeyError
 
 
@@ -27,6 +31,12 @@ class AluviaApi:
         api_key: str,
         api_base_url: str = "https://api.aluvia.io/v1",
         timeout_ms: Optional[int] = None,
+        response_cache: Union[bool, ApiResponseCache] = False,
+        geos_ttl: float = 3600.0,
+        retry_policy: Union[bool, RetryPolicy] = False,
+        rate_limiter: Union[bool, RateLimiter] = False,
+        http2: bool = False,
+        records: bool = False,
     ) -> None:
         """
         Initialize the API wrapper.
@@ -35,6 +45,21 @@ class AluviaApi:
             api_key: Aluvia API key (required)
             api_base_url: Base URL for the API (default: https://api.aluvia.io/v1)
             timeout_ms: Request timeout in milliseconds (default: 30000)
+            response_cache: Cache GET responses and revalidate them with ETags.
+                True uses an ApiResponseCache that revalidates on every call; pass
+                one with TTLs to skip requests entirely. Off by default.
+            geos_ttl: Seconds the geo catalogue is reused; it is shared by all
+                AluviaApi instances in the process with the same base URL
+            retry_policy: Retry transient failures (see RetryPolicy). True uses the
+                default policy. Off by default.
+            rate_limiter: Rate and concurrency limit shared by all requests, adapting
+                to 429s and rate-limit headers (see RateLimiter). True uses the
+                default limiter. Off by default.
+            http2: Negotiate HTTP/2 so concurrent requests are multiplexed over one
+                connection instead of opening one connection each. Requires the
+                'h2' package (pip install aluvia-sdk[http2]).
+            records: Return connections, geos and account details as compact,
+                read-only records (see aluvia_sdk.api.models) instead of dicts
         """
         api_key = str(api_key or "").strip()
         if not api_key:
@@ -43,13 +68,28 @@ class AluviaApi:
         self.api_key = api_key
         self.api_base_url = api_base_url
         self.timeout_ms = timeout_ms or 30000
-        self._client = httpx.AsyncClient()
+        self.http2 = http2
+        self._client = httpx.AsyncClient(http2=http2)
+        if response_cache is True:
+            response_cache = ApiResponseCache()
+        self.response_cache: Optional[ApiResponseCache] = response_cache or None
+        self._in_flight = SingleFlight()
+        if retry_policy is True:
+            retry_policy = RetryPolicy()
+        self.retry_policy: Optional[RetryPolicy] = retry_policy or None
+        if rate_limiter is True:
+            rate_limiter = RateLimiter()
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter or None
 
         # Create context for endpoint implementations
-        ctx = type("ApiContext", (), {"request": self._request})()
+        ctx = type(
+            "ApiContext",
+            (),
+            {"request": self._request, "stream": self._stream, "records": records},
+        )()
 
         self.account = AccountApi(ctx)
-        self.geos = GeosApi(ctx)
+        self.geos = GeosApi(ctx, cache_key=api_base_url, ttl=geos_ttl)
 
     async def _request(
         self,
@@ -59,19 +99,56 @@ class AluviaApi:
         body: Optional[Any] = None,
         headers: Optional[Dict[str, str]] = None,
         etag: Optional[str] = None,
+        coalesce: bool = False,
     ) -> Dict[str, Any]:
-        """Internal request method."""
-        return await request_core(
+        """
+        Internal request method.
+
+        With coalesce=True, identical GETs (same path, query, headers and etag)
+        issued while one is in flight share its response instead of sending their own.
+        """
+
+        async def send() -> Dict[str, Any]:
+            return await request_core(
+                api_base_url=self.api_base_url,
+                api_key=self.api_key,
+                method=method,
+                path=path,
+                query=query,
+                body=body,
+                headers=headers,
+                if_none_match=etag,
+                timeout_ms=self.timeout_ms,
+                client=self._client,
+                cache=self.response_cache,
+                retry=self.retry_policy,
+                limiter=self.rate_limiter,
+            )
+
+        if not coalesce or method.upper() != "GET":
+            return await send()
+
+        key = (
+            path,
+            repr(sorted((k, v) for k, v in (query or {}).items() if v is not None)),
+            tuple(sorted((headers or {}).items())),
+            etag,
+        )
+        result: Dict[str, Any] = await self._in_flight.do(key, send)
+        return result
+
+    def _stream(
+        self, path: str, query: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[Any, None]:
+        """Internal streaming GET of a list endpoint."""
+        return stream_core(
             api_base_url=self.api_base_url,
             api_key=self.api_key,
-            method=method,
             path=path,
             query=query,
-            body=body,
-            headers=headers,
-            if_none_match=etag,
             timeout_ms=self.timeout_ms,
             client=self._client,
+            limiter=self.rate_limiter,
         )
 
     async def request(
@@ -81,14 +158,23 @@ class AluviaApi:
         query: Optional[Dict[str, Any]] = None,
         body: Optional[Any] = None,
         headers: Optional[Dict[str, str]] = None,
+        coalesce: bool = False,
     ) -> Dict[str, Any]:
         """
         Low-level request method for custom API calls.
 
+        Args:
+            coalesce: Share the response of an identical GET already in flight
+
         Returns:
-            Dictionary with 'status', 'etag', and 'body' keys.
+            Dictionary with 'status', 'etag', 'body' and 'attempts' keys.
         """
-        return await self._request(method, path, query, body, headers)
+        return await self._request(method, path, query, body, headers, coalesce=coalesce)
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """The HTTP client (and connection pool) used for all requests."""
+        return self._client
 
     async def close(self) -> None:
         """Close the underlying HTTP client."""
@@ -0,0 +1,127 @@
+"""ETag-aware response cache for AluviaApi GET requests."""
+
+from __future__ import annotations
+
+import fnmatch
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# (method, path, encoded query string)
+CacheKey = Tuple[str, str, str]
+
+
+class ApiCacheEntry:
+    """A cached API response body and its validator."""
+
+    __slots__ = ("status", "etag", "content", "stored_at")
+
+    def __init__(self, status: int, etag: Optional[str], content: bytes) -> None:
+        self.status = status
+        self.etag = etag
+        self.content = content
+        self.stored_at = time.monotonic()
+
+
+class ApiResponseCache:
+    """
+    Response cache for AluviaApi GET endpoints.
+
+    Responses are stored as raw bytes with their ETag. Within an endpoint's TTL
+    the cached body is returned without a request; after that the request is sent
+    with If-None-Match and a 304 returns the cached body. Writes (POST, PATCH,
+    DELETE) to a path invalidate cached responses for that path and its parents.
+
+    Example:
+        >>> cache = ApiResponseCache(ttls={"/account/connections*": 5.0})
+        >>> api = AluviaApi(api_key="...", response_cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 8 * 1024 * 1024,
+        default_ttl: float = 0.0,
+        ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Upper bound for the total size of cached bodies; least
+                recently used entries are evicted first
+            default_ttl: Seconds a response is used without revalidation (0 means
+                every call revalidates with If-None-Match)
+            ttls: Per-endpoint TTLs keyed by path or shell-style path pattern,
+                e.g. {"/geos": 3600, "/account/connections/*": 5}
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[CacheKey, ApiCacheEntry]" = OrderedDict()
+        self._size = 0
+
+    def ttl_for(self, path: str) -> float:
+        """Get the TTL of an endpoint."""
+        ttl = self.ttls.get(path)
+        if ttl is not None:
+            return ttl
+        for pattern, pattern_ttl in self.ttls.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return pattern_ttl
+        return self.default_ttl
+
+    def get(self, key: CacheKey) -> Optional[ApiCacheEntry]:
+        """Look up an entry and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def is_fresh(self, key: CacheKey, entry: ApiCacheEntry) -> bool:
+        """Check whether an entry can be used without revalidation."""
+        return time.monotonic() - entry.stored_at < self.ttl_for(key[1])
+
+    def put(self, key: CacheKey, status: int, etag: Optional[str], content: bytes) -> None:
+        """
+        Store a response.
+
+        Responses without an ETag are only stored for endpoints with a TTL, since
+        they cannot be revalidated.
+        """
+        if (not etag and self.ttl_for(key[1]) <= 0) or len(content) > self.max_bytes:
+            self._remove(key)
+            return
+        self._remove(key)
+        self._entries[key] = ApiCacheEntry(status, etag, content)
+        self._size += len(content)
+        while self._size > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.content)
+
+    def touch(self, entry: ApiCacheEntry) -> None:
+        """Restart an entry's TTL after a successful revalidation."""
+        entry.stored_at = time.monotonic()
+
+    def invalidate(self, path: str) -> None:
+        """Drop cached responses for a path and its parent paths."""
+        paths = {path}
+        while "/" in path.rstrip("/"):
+            path = path.rstrip("/").rsplit("/", 1)[0]
+            if path:
+                paths.add(path)
+        for key in [k for k in self._entries if k[1] in paths]:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.content)
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Protocol
+import time
+from collections.abc import Mapping
+from typing import Any, AsyncGenerator, Dict, List, Optional, Protocol, Union
 
+from aluvia_sdk.api.models import GeoRecord
 from aluvia_sdk.api.types import Geo
 
 
 class ApiContext(Protocol):
     """Protocol for API request context."""
 
+    records: bool
+
     async def request(
         self,
         method: str,
@@ -18,26 +23,128 @@ class ApiContext(Protocol):
         body: Optional[Any] = None,
         headers: Optional[Dict[str, str]] = None,
         etag: Optional[str] = None,
+        coalesce: bool = False,
     ) -> Dict[str, Any]:
         """Make an API request."""
         ...
 
+    def stream(
+        self, path: str, query: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[Any, None]:
+        """Stream the items of a list endpoint."""
+        ...
+
 
-async def _request_and_unwrap(ctx: ApiContext, method: str, path: str) -> Dict[str, Any]:
+async def _request_and_unwrap(
+    ctx: ApiContext, method: str, path: str, coalesce: bool = False
+) -> Dict[str, Any]:
     """Make a request and unwrap the response envelope."""
     from aluvia_sdk.api.account import _request_and_unwrap as unwrap
 
-    return await unwrap(ctx, method, path)
+    return await unwrap(ctx, method, path, coalesce=coalesce)
+
+
+class GeoCatalog:
+    """
+    Snapshot of the available geos with an index by code.
+
+    Example:
+        >>> catalog = await api.geos.catalog()
+        >>> catalog.validate("us_ca")
+        True
+    """
+
+    def __init__(self, geos: List[GeoRecord]) -> None:
+        self.geos = geos
+        self.fetched_at = time.monotonic()
+        self._by_code: Dict[str, GeoRecord] = {}
+        for geo in geos:
+            code = geo.get("code") if isinstance(geo, Mapping) else None
+            if isinstance(code, str) and code.strip():
+                self._by_code[code.strip().lower()] = geo
+
+    def get(self, code: str) -> Optional[GeoRecord]:
+        """Look up a geo by code (case-insensitive)."""
+        return self._by_code.get(code.strip().lower())
+
+    def validate(self, code: str) -> bool:
+        """Check whether a geo code is available."""
+        return code.strip().lower() in self._by_code
+
+    @property
+    def codes(self) -> List[str]:
+        """All available geo codes."""
+        return list(self._by_code)
+
+    def age(self) -> float:
+        """Seconds since the catalogue was fetched."""
+        return time.monotonic() - self.fetched_at
+
+
+# Geo catalogues shared by all AluviaApi instances in the process, by API base URL
+_catalogs: Dict[str, GeoCatalog] = {}
 
 
 class GeosApi:
     """Geos API namespace."""
 
-    def __init__(self, ctx: ApiContext) -> None:
+    def __init__(self, ctx: ApiContext, cache_key: str = "", ttl: float = 3600.0) -> None:
+        """
+        Initialize the namespace.
+
+        Args:
+            ctx: API request context
+            cache_key: Key of the process-wide geo catalogue (the API base URL)
+            ttl: Seconds a fetched catalogue is reused (0 disables caching)
+        """
         self.ctx = ctx
+        self.cache_key = cache_key
+        self.ttl = ttl
+
+    async def list(self, refresh: bool = False) -> List[Union[Geo, GeoRecord]]:
+        """
+        List available geo-targeting options.
+
+        Args:
+            refresh: Fetch the catalogue even if a cached one is still fresh
+        """
+        catalog = await self.catalog(refresh=refresh)
+        if self.ctx.records:
+            return list(catalog.geos)
+        return [geo.to_dict() for geo in catalog.geos]  # type: ignore[misc]
+
+    async def catalog(self, refresh: bool = False) -> GeoCatalog:
+        """
+        Get the geo catalogue, fetching it if the cached one is missing or expired.
+
+        Args:
+            refresh: Fetch the catalogue even if a cached one is still fresh
+        """
+        if not refresh:
+            cached = self.cached_catalog()
+            if cached is not None:
+                return cached
+
+        # Concurrent first calls share one fetch of the catalogue
+        result = await _request_and_unwrap(self.ctx, "GET", "/geos", coalesce=True)
+        catalog = GeoCatalog(GeoRecord.from_json_list(result["data"]))
+        if self.ttl > 0:
+            _catalogs[self.cache_key] = catalog
+        return catalog
+
+    def cached_catalog(self) -> Optional[GeoCatalog]:
+        """Get the cached geo catalogue without a network call (None if missing or expired)."""
+        catalog = _catalogs.get(self.cache_key)
+        if catalog is None or catalog.age() >= self.ttl:
+            return None
+        return catalog
+
+    def validate(self, code: str) -> Optional[bool]:
+        """
+        Check a geo code against the cached catalogue without a network call.
 
-    async def list(self) -> List[Geo]:
-        """List available geo-targeting options."""
-        result = await _request_and_unwrap(self.ctx, "GET", "/geos")
-        data = result["data"]
-        return data if isinstance(data, list) else []
+        Returns:
+            True or False, or None if no fresh catalogue is cached
+        """
+        catalog = self.cached_catalog()
+        return catalog.validate(code) if catalog is not None else None
@@ -0,0 +1,198 @@
+"""Compact read-only models for API response records."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+R = TypeVar("R", bound="Record")
+
+# Key tuples shared by records with the same JSON shape, so each record holds a
+# reference instead of its own copy. Bounded in case the API returns varied shapes.
+_shapes: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+_MAX_SHAPES = 1024
+
+
+def _intern_shape(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the shared tuple for a set of keys."""
+    shape = _shapes.get(keys)
+    if shape is not None:
+        return shape
+    if len(_shapes) < _MAX_SHAPES:
+        _shapes[keys] = keys
+    return keys
+
+
+class Record(Mapping):  # type: ignore[type-arg]
+    """
+    Immutable API record with one slot per known field.
+
+    Records are read-only mappings, so existing code that indexes results like
+    dicts (record["connection_id"], record.get("rules"), "session_id" in record)
+    keeps working. Known fields are also attributes (None when absent); fields
+    the model does not know are kept and available through the mapping view.
+    """
+
+    __slots__ = ("_keys", "_extra")
+
+    _fields: Tuple[str, ...] = ()
+    _field_set: FrozenSet[str] = frozenset()
+    _setters: Tuple[Tuple[str, Callable[[Any, Any], None]], ...] = ()
+
+    _keys: Tuple[str, ...]
+    _extra: Optional[Dict[str, Any]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls._fields)
+        # Slot descriptors set values directly, bypassing the immutable __setattr__
+        cls._setters = tuple((name, getattr(cls, name).__set__) for name in cls._fields)
+
+    def __init__(self, **fields: Any) -> None:
+        self._load(fields)
+
+    @classmethod
+    def from_json(cls: Type[R], data: Mapping) -> R:  # type: ignore[type-arg]
+        """
+        Build a record from a decoded JSON object.
+
+        Args:
+            data: Decoded JSON object
+
+        Returns:
+            The record
+
+        Raises:
+            TypeError: If data is not a JSON object
+        """
+        if not isinstance(data, Mapping):
+            raise TypeError(f"{cls.__name__} expects a JSON object, got {type(data).__name__}")
+        record = cls.__new__(cls)
+        record._load(data)
+        return record
+
+    @classmethod
+    def from_json_list(cls: Type[R], items: Any) -> List[R]:
+        """
+        Build records from a decoded JSON array, skipping non-object items.
+
+        Args:
+            items: Decoded JSON array (anything else yields an empty list)
+        """
+        if not isinstance(items, list):
+            return []
+        from_json = cls.from_json
+        return [from_json(item) for item in items if isinstance(item, Mapping)]
+
+    def _load(self, data: Mapping) -> None:  # type: ignore[type-arg]
+        """Populate the slots from a mapping."""
+        get = data.get
+        for name, set_slot in self._setters:
+            set_slot(self, get(name))
+        keys = tuple(data)
+        _set_keys(self, _intern_shape(keys))
+        field_set = self._field_set
+        if field_set.issuperset(keys):
+            _set_extra(self, None)
+        else:
+            _set_extra(self, {key: data[key] for key in keys if key not in field_set})
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._keys:
+            if key in self._field_set:
+                return getattr(self, key)
+            if self._extra is not None:
+                return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self).from_json, (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the record as a new dict (values are not copied)."""
+        return {key: self[key] for key in self._keys}
+
+
+_set_keys = Record.__dict__["_keys"].__set__
+_set_extra = Record.__dict__["_extra"].__set__
+
+
+class ConnectionRecord(Record):
+    """
+    Account connection returned by the connections API.
+
+    Example:
+        >>> connection = await api.account.connections.get(42)
+        >>> connection.proxy_username == connection["proxy_username"]
+        True
+    """
+
+    __slots__ = (
+        "id",
+        "connection_id",
+        "description",
+        "proxy_username",
+        "proxy_password",
+        "rules",
+        "session_id",
+        "target_geo",
+    )
+    _fields = __slots__
+
+    id: Union[str, int, None]
+    connection_id: Union[str, int, None]
+    description: Optional[str]
+    proxy_username: Optional[str]
+    proxy_password: Optional[str]
+    rules: Any  # List of patterns, or {"type": ..., "items": ...}
+    session_id: Optional[str]
+    target_geo: Optional[str]
+
+
+class GeoRecord(Record):
+    """Geo-targeting option returned by the geos API."""
+
+    __slots__ = ("code", "name")
+    _fields = __slots__
+
+    code: Optional[str]
+    name: Optional[str]
+
+
+class AccountRecord(Record):
+    """Account information returned by the account API."""
+
+    __slots__ = ("balance_gb",)
+    _fields = __slots__
+
+    balance_gb: Optional[float]
@@ -0,0 +1,166 @@
+"""Client-side rate limiting for Aluvia REST API requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Mapping, Optional, Tuple
+
+from aluvia_sdk.api.retry import parse_retry_after
+
+
+def _header_float(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    """Read the first numeric header among names."""
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value.split(",")[0].strip())
+        except ValueError:
+            continue
+    return None
+
+
+class RateLimiter:
+    """
+    Token bucket plus concurrency cap shared by all requests of an AluviaApi.
+
+    Requests wait for a free slot and a token in FIFO order instead of failing.
+    The rate adapts to the server: a 429 halves it and pauses requests for the
+    Retry-After delay, rate-limit headers (RateLimit-Remaining/-Reset or their
+    X-RateLimit- forms) cap it to what the current window allows, and each
+    successful response raises it again by `increase` up to the configured rate.
+
+    The rate is shared by every event loop that uses the limiter; the concurrency
+    cap applies per event loop, since asyncio primitives cannot be shared.
+
+    Example:
+        >>> api = AluviaApi(api_key="...", rate_limiter=RateLimiter(rate=20, max_concurrency=8))
+    """
+
+    def __init__(
+        self,
+        rate: float = 50.0,
+        burst: int = 50,
+        max_concurrency: int = 16,
+        min_rate: float = 1.0,
+        increase: float = 0.5,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Maximum requests per second
+            burst: Token bucket capacity (requests that may start at once)
+            max_concurrency: Maximum number of requests in flight
+            min_rate: Lower bound when backing off
+            increase: Requests per second added after each successful response
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_rate = min_rate
+        self.increase = increase
+        self.throttled = 0
+        self.waiting = 0
+
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        # Created per event loop on first use, since they bind to the running loop
+        self._loop_primitives: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Tuple[asyncio.Semaphore, asyncio.Lock]
+        ] = weakref.WeakKeyDictionary()
+
+    def _primitives(self) -> Tuple[asyncio.Semaphore, asyncio.Lock]:
+        loop = asyncio.get_running_loop()
+        primitives = self._loop_primitives.get(loop)
+        if primitives is None:
+            primitives = (asyncio.Semaphore(self.max_concurrency), asyncio.Lock())
+            self._loop_primitives[loop] = primitives
+        return primitives
+
+    async def acquire(self) -> None:
+        """Wait for a concurrency slot and a token; pair with release()."""
+        semaphore, lock = self._primitives()
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+            try:
+                # The lock queues waiters in arrival order, so tokens are handed out fairly
+                async with lock:
+                    await self._take_token()
+            except BaseException:
+                semaphore.release()
+                raise
+        finally:
+            self.waiting -= 1
+
+    def release(self) -> None:
+        """Free the concurrency slot taken by acquire()."""
+        semaphore, _ = self._primitives()
+        semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a concurrency slot and a token for the duration of a request."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def observe(self, status: int, headers: Mapping[str, str]) -> None:
+        """
+        Adapt the rate to a response.
+
+        Args:
+            status: Response status code
+            headers: Response headers (case-insensitive mapping)
+        """
+        if status == 429:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
+            delay = parse_retry_after(headers.get("Retry-After"))
+            if delay:
+                self._block(delay)
+            return
+
+        remaining = _header_float(headers, "RateLimit-Remaining", "X-RateLimit-Remaining")
+        reset = _header_float(headers, "RateLimit-Reset", "X-RateLimit-Reset")
+        if remaining is not None and reset is not None:
+            if reset > 1e9:
+                # Some servers send the reset time as a Unix timestamp
+                reset = max(0.0, reset - time.time())
+            if remaining < 1:
+                self._block(reset)
+                return
+            if reset > 0 and remaining / reset < self.rate:
+                self.rate = max(self.min_rate, remaining / reset)
+                return
+
+        if 200 <= status < 300:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def _block(self, seconds: float) -> None:
+        """Pause all requests for a number of seconds."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    async def _take_token(self) -> None:
+        while True:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                await asyncio.sleep(self._blocked_until - now)
+                continue
+            elapsed = now - self._updated_at
+            self._updated_at = now
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            await asyncio.sleep((1.0 - self._tokens) / self.rate)
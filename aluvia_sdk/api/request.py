@@ -3,14 +3,61 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple, Union
 from urllib.parse import urlencode
 
 import httpx
 
+from aluvia_sdk import codec
+from aluvia_sdk.api.cache import ApiCacheEntry, ApiResponseCache
+from aluvia_sdk.api.rate_limit import RateLimiter
+from aluvia_sdk.api.retry import RetryPolicy
+from aluvia_sdk.api.stream import iter_json_array
 from aluvia_sdk.errors import ApiError, InvalidApiKeyError
 
 
+def _build_url(api_base_url: str, path: str, query: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+    """Build the request URL; also returns the encoded query string."""
+    url = f"{api_base_url}{path}"
+    query_string = ""
+    if query:
+        # Filter out None values
+        filtered_query = {k: v for k, v in query.items() if v is not None}
+        if filtered_query:
+            query_string = urlencode(filtered_query)
+            url = f"{url}?{query_string}"
+    return url, query_string
+
+
+def _build_headers(api_key: str, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Build the request headers."""
+    req_headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "User-Agent": "aluvia-sdk-python/1.0.0",
+    }
+
+    if headers:
+        req_headers.update(headers)
+    return req_headers
+
+
+def _build_result(
+    status: int, etag: Optional[str], content: bytes, attempts: int = 1
+) -> Dict[str, Any]:
+    """Build the result dictionary from a raw response body."""
+    # Handle empty responses
+    if status == 204 or not content:
+        return {"status": status, "etag": etag, "body": None, "attempts": attempts}
+
+    try:
+        body_data = codec.loads(content)
+    except Exception:
+        body_data = None
+
+    return {"status": status, "etag": etag, "body": body_data, "attempts": attempts}
+
+
 async def request_core(
     api_base_url: str,
     api_key: str,
@@ -22,28 +69,46 @@ async def request_core(
     if_none_match: Optional[str] = None,
     timeout_ms: Optional[int] = None,
     client: Optional[httpx.AsyncClient] = None,
+    cache: Optional[ApiResponseCache] = None,
+    retry: Optional[RetryPolicy] = None,
+    limiter: Optional[RateLimiter] = None,
+    http2: bool = False,
 ) -> Dict[str, Any]:
     """
     Core HTTP request function.
 
+    Args:
+        cache: Response cache for GET requests. Cached bodies are revalidated with
+            If-None-Match and returned on 304; writes invalidate the path. Ignored
+            for GETs with an explicit if_none_match.
+        retry: Retry policy for transient failures (no retries if None)
+        limiter: Rate limiter every attempt waits for, and adapts to responses
+        http2: Negotiate HTTP/2 when no client is given (requires the 'h2' package)
+
     Returns:
-        Dictionary with 'status', 'etag', and 'body' keys.
+        Dictionary with 'status', 'etag', 'body' and 'attempts' keys ('attempts'
+        is 0 when the response came from the cache without a request).
+
+    Raises:
+        ApiError: On timeouts and transport errors, once retries are exhausted
     """
-    url = f"{api_base_url}{path}"
-    if query:
-        # Filter out None values
-        filtered_query = {k: v for k, v in query.items() if v is not None}
-        if filtered_query:
-            url = f"{url}?{urlencode(filtered_query)}"
+    url, query_string = _build_url(api_base_url, path, query)
 
-    req_headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "User-Agent": "aluvia-sdk-python/1.0.0",
-    }
+    method = method.upper()
+    cache_key = None
+    cache_entry: Optional[ApiCacheEntry] = None
+    if cache is not None and method == "GET" and not if_none_match:
+        cache_key = (method, path, query_string)
+        cache_entry = cache.get(cache_key)
+        if cache_entry is not None:
+            if cache.is_fresh(cache_key, cache_entry):
+                cache.hits += 1
+                return _build_result(
+                    cache_entry.status, cache_entry.etag, cache_entry.content, attempts=0
+                )
+            if_none_match = cache_entry.etag
 
-    if headers:
-        req_headers.update(headers)
+    req_headers = _build_headers(api_key, headers)
 
     if if_none_match:
         req_headers["If-None-Match"] = if_none_match
@@ -52,36 +117,147 @@ async def request_core(
 
     should_close_client = False
     if client is None:
-        client = httpx.AsyncClient()
+        client = httpx.AsyncClient(http2=http2)
         should_close_client = True
 
+    if retry is not None:
+        retry.record_request()
+    attempt = 0
+    delay: Optional[float] = None
+
+    # Encoded once, outside the retry loop
+    content = codec.dumps(body) if body is not None else None
+
     try:
-        response = await client.request(
-            method=method,
-            url=url,
-            headers=req_headers,
-            json=body if body is not None else None,
-            timeout=timeout,
-        )
+        while True:
+            attempt += 1
+            if limiter is not None:
+                await limiter.acquire()
+            failure: Optional[httpx.RequestError] = None
+            try:
+                response = await client.request(
+                    method=method,
+                    url=url,
+                    headers=req_headers,
+                    content=content,
+                    timeout=timeout,
+                )
+            except httpx.RequestError as e:
+                failure = e
+            finally:
+                if limiter is not None:
+                    limiter.release()
+
+            if failure is not None:
+                # Back off with the concurrency slot released
+                delay = retry.retry_delay(method, attempt, delay, error=failure) if retry else None
+                if delay is None:
+                    raise failure
+                await asyncio.sleep(delay)
+                continue
+
+            if limiter is not None:
+                limiter.observe(response.status_code, response.headers)
+
+            if retry is not None:
+                next_delay = retry.retry_delay(
+                    method,
+                    attempt,
+                    delay,
+                    status=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+                if next_delay is not None:
+                    delay = next_delay
+                    await asyncio.sleep(delay)
+                    continue
+            break
 
         etag = response.headers.get("ETag")
         status = response.status_code
 
-        # Handle empty responses
-        if status == 204 or not response.content:
-            return {"status": status, "etag": etag, "body": None}
+        if cache is not None and cache_key is not None:
+            if status == 304 and cache_entry is not None:
+                cache.revalidations += 1
+                cache.touch(cache_entry)
+                return _build_result(
+                    cache_entry.status, cache_entry.etag, cache_entry.content, attempt
+                )
+            cache.misses += 1
+            if 200 <= status < 300:
+                cache.put(cache_key, status, etag, response.content)
+        elif cache is not None and method != "GET" and 200 <= status < 300:
+            cache.invalidate(path)
 
-        try:
-            body_data = response.json()
-        except Exception:
-            body_data = None
+        return _build_result(status, etag, response.content, attempt)
 
-        return {"status": status, "etag": etag, "body": body_data}
+    except httpx.TimeoutException as e:
+        raise ApiError(f"Request timeout: {e}", status_code=None, attempts=attempt)
+    except httpx.RequestError as e:
+        raise ApiError(f"Request failed: {e}", status_code=None, attempts=attempt)
+    finally:
+        if should_close_client:
+            await client.aclose()
+
+
+async def stream_core(
+    api_base_url: str,
+    api_key: str,
+    path: str,
+    query: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout_ms: Optional[int] = None,
+    client: Optional[httpx.AsyncClient] = None,
+    limiter: Optional[RateLimiter] = None,
+    http2: bool = False,
+) -> AsyncGenerator[Any, None]:
+    """
+    GET a list endpoint and yield the items of its 'data' array as they arrive.
+
+    The body is parsed incrementally, so memory stays proportional to one item
+    and the first items are available before the response is complete. Streams
+    are not cached or retried. The limiter's concurrency slot is held only until
+    the response headers arrive, so a slow or abandoned consumer does not hold it.
+
+    Raises:
+        InvalidApiKeyError: On 401/403
+        ApiError: On other non-2xx responses, timeouts and transport errors
+    """
+    url, _ = _build_url(api_base_url, path, query)
+    req_headers = _build_headers(api_key, headers)
+    timeout = timeout_ms / 1000.0 if timeout_ms else 30.0
+
+    should_close_client = False
+    if client is None:
+        client = httpx.AsyncClient(http2=http2)
+        should_close_client = True
+
+    holds_slot = False
+    if limiter is not None:
+        await limiter.acquire()
+        holds_slot = True
+    try:
+        async with client.stream("GET", url, headers=req_headers, timeout=timeout) as response:
+            if limiter is not None:
+                limiter.observe(response.status_code, response.headers)
+                limiter.release()
+                holds_slot = False
+            status = response.status_code
+            if status in (401, 403):
+                raise InvalidApiKeyError(f"Authentication failed (HTTP {status})")
+            if status < 200 or status >= 300:
+                raise ApiError(f"API request failed (HTTP {status})", status_code=status)
+            async for item in iter_json_array(response.aiter_bytes()):
+                yield item
 
     except httpx.TimeoutException as e:
         raise ApiError(f"Request timeout: {e}", status_code=None)
     except httpx.RequestError as e:
         raise ApiError(f"Request failed: {e}", status_code=None)
+    except ValueError as e:
+        raise ApiError(f"Invalid API response: {e}", status_code=None)
     finally:
+        if limiter is not None and holds_slot:
+            limiter.release()
         if should_close_client:
             await client.aclose()
@@ -0,0 +1,190 @@
+"""Retry policy for Aluvia REST API requests."""
+
+from __future__ import annotations
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+import httpx
+
+# Safe to repeat: the request has no additional effect on the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date).
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds to wait, or None if missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of requests.
+
+    Every request deposits `ratio` tokens and every retry withdraws one, so during
+    an outage retries add at most `ratio` extra load; `min_per_second` tokens are
+    added over time so low-traffic clients can still retry.
+    """
+
+    def __init__(
+        self, ratio: float = 0.2, min_per_second: float = 1.0, capacity: float = 10.0
+    ) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            ratio: Tokens deposited per request
+            min_per_second: Tokens added per second regardless of traffic
+            capacity: Maximum number of stored tokens (the bucket starts full)
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    def deposit(self) -> None:
+        """Record a request."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a token for a retry; False if the budget is exhausted."""
+        self._refill()
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.min_per_second)
+
+
+class RetryPolicy:
+    """
+    Retries transient API failures with decorrelated-jitter backoff.
+
+    Retried:
+    - Connection failures for every method (the request never reached the server)
+    - Timeouts and other transport errors for idempotent methods
+    - 429 for every method (the server did not process the request)
+    - 5xx in retry_statuses for idempotent methods
+
+    A Retry-After header sets the delay; a retry is abandoned if it asks for more
+    than max_retry_after seconds. Retries are also limited by a RetryBudget shared
+    by all requests using the policy.
+
+    Example:
+        >>> api = AluviaApi(api_key="...", retry_policy=RetryPolicy(max_attempts=5))
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 5.0,
+        max_retry_after: float = 30.0,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            max_attempts: Attempts per request, including the first (1 disables retries)
+            base_delay: Minimum backoff delay in seconds
+            max_delay: Maximum backoff delay in seconds
+            max_retry_after: Longest Retry-After delay that is honored
+            retry_statuses: Response status codes that may be retried
+            budget: Retry budget (default: RetryBudget())
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+        self.budget = budget or RetryBudget()
+        self.retries = 0
+        self.budget_exhausted = 0
+
+    def record_request(self) -> None:
+        """Record a new (first-attempt) request in the retry budget."""
+        self.budget.deposit()
+
+    def is_retryable(
+        self,
+        method: str,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        """Check whether a failed attempt may be retried, ignoring attempts and budget."""
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if error is not None:
+            if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+                return True
+            return idempotent and isinstance(error, httpx.TransportError)
+        if status is None or status not in self.retry_statuses:
+            return False
+        return status == 429 or idempotent
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        previous_delay: Optional[float] = None,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry a failed attempt and how long to wait.
+
+        Args:
+            method: HTTP method
+            attempt: Number of the attempt that failed (1 for the first)
+            previous_delay: Delay before the failed attempt, if it was a retry
+            status: Response status code, if a response was received
+            error: Transport error, if no response was received
+            retry_after: Retry-After header of the response
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(method, status, error):
+            return None
+
+        delay = parse_retry_after(retry_after)
+        if delay is not None:
+            if delay > self.max_retry_after:
+                return None
+        else:
+            # Decorrelated jitter: random between the base and 3x the previous delay
+            upper = max(self.base_delay, (previous_delay or self.base_delay) * 3)
+            delay = min(self.max_delay, random.uniform(self.base_delay, upper))
+
+        if not self.budget.withdraw():
+            self.budget_exhausted += 1
+            return None
+        self.retries += 1
+        return delay
@@ -0,0 +1,81 @@
+"""Coalescing of identical in-flight API requests."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Flight:
+    """One shared request and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters", "shared")
+
+    def __init__(self, task: "asyncio.Task[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+        # Set when the task finishes, before any caller resumes
+        self.shared = False
+
+
+class SingleFlight:
+    """
+    Runs at most one request per key at a time and shares its result.
+
+    The first caller for a key starts the request as a task; callers arriving while
+    it is in flight await the same task. When a result is shared, each caller gets
+    its own deep copy, so mutating a response does not affect the others; an
+    uncontended call returns the result as is. Cancelling a caller only detaches
+    it; the request is cancelled when its last caller is.
+
+    Example:
+        >>> flights = SingleFlight()
+        >>> result = await flights.do(("GET", "/account"), lambda: fetch_account())
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn, or join the in-flight call with the same key.
+
+        Args:
+            key: Identity of the request
+            fn: Coroutine factory performing the request
+
+        Returns:
+            The request result (a private copy if other callers shared it)
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._start(key, fn)
+
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+        return copy.deepcopy(result) if flight.shared else result
+
+    def _start(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> _Flight:
+        """Start the shared request for a key."""
+        flight = _Flight(asyncio.ensure_future(fn()))
+        self._flights[key] = flight
+        # Runs before any caller resumes, since callers wait through later callbacks
+        flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        return flight
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        """Remove a finished flight unless a newer one took its key."""
+        flight.shared = flight.waiters > 1
+        if self._flights.get(key) is flight:
+            del self._flights[key]
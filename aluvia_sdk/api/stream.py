@@ -0,0 +1,118 @@
+"""Incremental parsing of JSON array responses."""
+
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, AsyncIterator, Optional
+
+_WHITESPACE = " \t\r\n"
+
+
+class _Buffer:
+    """Decoded text received so far, trimmed as it is consumed."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    async def fill(self) -> bool:
+        """Read another chunk; False at the end of the response."""
+        if self.eof:
+            return False
+        # Drop consumed text so memory stays proportional to one item
+        self.text = self.text[self.pos :]
+        self.pos = 0
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self.eof = True
+            self.text += self._decoder.decode(b"", final=True)
+            return False
+        self.text += self._decoder.decode(chunk)
+        return True
+
+    async def peek(self) -> Optional[str]:
+        """Skip whitespace and return the next character (None at the end)."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not await self.fill():
+                return None
+
+    async def expect(self, char: str) -> None:
+        """Consume a structural character."""
+        if await self.peek() != char:
+            raise ValueError(f"Expected {char!r} in JSON response")
+        self.pos += 1
+
+    async def value(self, decoder: json.JSONDecoder) -> Any:
+        """Decode the next complete JSON value."""
+        await self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not await self.fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.text) and not self.eof and await self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes], key: str = "data") -> AsyncIterator[Any]:
+    """
+    Yield the items of a JSON array as the response body arrives.
+
+    Accepts a top-level array or an object whose `key` member is an array (the
+    API's {"success": true, "data": [...]} envelope). Members before the array are
+    skipped; only one item is held in memory at a time.
+
+    Args:
+        chunks: Response body chunks
+        key: Member of the top-level object holding the array
+
+    Yields:
+        Decoded array items
+
+    Raises:
+        ValueError: If the body is not such an array or object
+    """
+    buffer = _Buffer(chunks)
+    decoder = json.JSONDecoder()
+
+    first = await buffer.peek()
+    if first == "{":
+        buffer.pos += 1
+        while True:
+            if await buffer.peek() == "}":
+                return  # No array member
+            name = await buffer.value(decoder)
+            await buffer.expect(":")
+            if name == key and await buffer.peek() == "[":
+                break
+            await buffer.value(decoder)
+            if await buffer.peek() == ",":
+                buffer.pos += 1
+    elif first != "[":
+        raise ValueError("Expected a JSON array or object in response")
+
+    await buffer.expect("[")
+    if await buffer.peek() == "]":
+        return
+    while True:
+        yield await buffer.value(decoder)
+        separator = await buffer.peek()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError("Malformed JSON array in response")
+        buffer.pos += 1
@@ -69,3 +69,21 @@ class Geo(TypedDict, total=False):
     code: str
     name: str
     # Additional fields as per API
+
+
+class AccountConnectionSpec(TypedDict, total=False):
+    """Fields for creating a connection with ConnectionsApi.create_many()."""
+
+    description: str
+    rules: List[str]
+    session_id: str
+    target_geo: str
+
+
+class BulkItemResult(TypedDict):
+    """Outcome of one item of a bulk operation."""
+
+    index: int  # Position of the item in the input
+    item: Any  # The spec or connection ID that was processed
+    result: Any  # Endpoint result, or None if the item failed
+    error: Optional[Exception]
@@ -1,5 +1,15 @@
 """Client package."""
 
+from aluvia_sdk.client.admission import AdmissionControl
 from aluvia_sdk.client.aluvia_client import AluviaClient
+from aluvia_sdk.client.gateway_pool import GatewayPool
+from aluvia_sdk.client.playwright_pool import BrowserContextPool
+from aluvia_sdk.client.proxy_server import SharedProxyServer
 
-__all__ = ["AluviaClient"]
+__all__ = [
+    "AdmissionControl",
+    "AluviaClient",
+    "BrowserContextPool",
+    "GatewayPool",
+    "SharedProxyServer",
+]
@@ -1,6 +1,11 @@
 """Tool integration adapters."""
 
-from typing import Any
+import ssl
+from contextlib import contextmanager
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+
+import httpcore
+import httpx
 
 
 def to_playwright_proxy_settings(server_url: str) -> dict[str, str]:
@@ -66,3 +71,206 @@ def to_aiohttp(server_url: str) -> str:
         Proxy URL string
     """
     return server_url
+
+
+class _UnixSocketBackend(httpcore.SyncBackend):
+    """Network backend dialing one Unix socket for every TCP connection."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.NetworkStream:
+        return self.connect_unix_socket(self.path, timeout=timeout, socket_options=socket_options)
+
+
+class _AsyncUnixSocketBackend(httpcore.AnyIOBackend):
+    """Async network backend dialing one Unix socket for every TCP connection."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self.connect_unix_socket(
+            self.path, timeout=timeout, socket_options=socket_options
+        )
+
+
+def _to_httpcore_request(request: httpx.Request) -> httpcore.Request:
+    """Convert an httpx request for an httpcore connection pool."""
+    return httpcore.Request(
+        method=request.method,
+        url=httpcore.URL(
+            scheme=request.url.raw_scheme,
+            host=request.url.raw_host,
+            port=request.url.port,
+            target=request.url.raw_path,
+        ),
+        headers=request.headers.raw,
+        content=request.stream,
+        extensions=request.extensions,
+    )
+
+
+@contextmanager
+def _map_httpcore_exceptions() -> Iterator[None]:
+    """Re-raise httpcore errors as the httpx exceptions of the same name."""
+    try:
+        yield
+    except httpcore.TimeoutException as e:
+        raise getattr(httpx, type(e).__name__, httpx.TimeoutException)(str(e)) from e
+    except httpcore.NetworkError as e:
+        raise getattr(httpx, type(e).__name__, httpx.NetworkError)(str(e)) from e
+    except httpcore.ProtocolError as e:
+        raise getattr(httpx, type(e).__name__, httpx.ProtocolError)(str(e)) from e
+    except (httpcore.ProxyError, httpcore.UnsupportedProtocol) as e:
+        raise getattr(httpx, type(e).__name__)(str(e)) from e
+
+
+class _ResponseStream(httpx.SyncByteStream):
+    """httpcore response body as an httpx stream."""
+
+    def __init__(self, stream: Iterable[bytes]) -> None:
+        self._stream = stream
+
+    def __iter__(self) -> Iterator[bytes]:
+        with _map_httpcore_exceptions():
+            yield from self._stream
+
+    def close(self) -> None:
+        if hasattr(self._stream, "close"):
+            self._stream.close()
+
+
+class _AsyncResponseStream(httpx.AsyncByteStream):
+    """Async httpcore response body as an httpx stream."""
+
+    def __init__(self, stream: AsyncIterable[bytes]) -> None:
+        self._stream = stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _map_httpcore_exceptions():
+            async for part in self._stream:
+                yield part
+
+    async def aclose(self) -> None:
+        if hasattr(self._stream, "aclose"):
+            await self._stream.aclose()
+
+
+class _UnixSocketProxyTransport(httpx.BaseTransport):
+    """httpx transport sending requests through a proxy listening on a Unix socket."""
+
+    def __init__(self, pool: httpcore.HTTPProxy) -> None:
+        self._pool = pool
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with _map_httpcore_exceptions():
+            response = self._pool.handle_request(_to_httpcore_request(request))
+        assert isinstance(response.stream, Iterable)
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+class _AsyncUnixSocketProxyTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport sending requests through a proxy on a Unix socket."""
+
+    def __init__(self, pool: httpcore.AsyncHTTPProxy) -> None:
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with _map_httpcore_exceptions():
+            response = await self._pool.handle_async_request(_to_httpcore_request(request))
+        assert isinstance(response.stream, AsyncIterable)
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_AsyncResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+def to_httpx_transport(
+    unix_socket_path: str,
+    ssl_context: Optional[ssl.SSLContext] = None,
+    limits: Optional[httpx.Limits] = None,
+) -> httpx.BaseTransport:
+    """
+    Build an httpx transport reaching the local proxy over a Unix socket.
+
+    httpx's own uds= option treats the socket as the origin server, so this
+    transport runs httpcore's proxy pool over a backend that dials the socket
+    instead of TCP: plain-HTTP requests are forwarded and HTTPS is tunneled with
+    CONNECT, as with a TCP proxy URL.
+
+    Args:
+        unix_socket_path: Path of the local proxy's Unix socket
+        ssl_context: SSL context for HTTPS origins (default: httpx's)
+        limits: Connection pool limits (default: httpx's)
+
+    Returns:
+        Transport for httpx.Client(transport=...)
+    """
+    limits = limits or httpx.Limits()
+    return _UnixSocketProxyTransport(
+        httpcore.HTTPProxy(
+            proxy_url="http://localhost",
+            ssl_context=ssl_context or httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=_UnixSocketBackend(unix_socket_path),
+        )
+    )
+
+
+def to_httpx_async_transport(
+    unix_socket_path: str,
+    ssl_context: Optional[ssl.SSLContext] = None,
+    limits: Optional[httpx.Limits] = None,
+) -> httpx.AsyncBaseTransport:
+    """
+    Build an async httpx transport reaching the local proxy over a Unix socket.
+
+    Args:
+        unix_socket_path: Path of the local proxy's Unix socket
+        ssl_context: SSL context for HTTPS origins (default: httpx's)
+        limits: Connection pool limits (default: httpx's)
+
+    Returns:
+        Transport for httpx.AsyncClient(transport=...)
+    """
+    limits = limits or httpx.Limits()
+    return _AsyncUnixSocketProxyTransport(
+        httpcore.AsyncHTTPProxy(
+            proxy_url="http://localhost",
+            ssl_context=ssl_context or httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=_AsyncUnixSocketBackend(unix_socket_path),
+        )
+    )
@@ -0,0 +1,148 @@
+"""Admission control and backpressure limits for the local proxy."""
+
+from __future__ import annotations
+
+import multiprocessing
+import zlib
+from typing import Dict, Optional
+
+
+class AdmissionControl:
+    """
+    Limits on the client and upstream connections the local proxy holds at once.
+
+    With max_client_connections, the proxy answers new client connections with
+    503 and closes them while that many are open. The check runs when a
+    connection is accepted, before it is handed to a worker, so it bounds file
+    descriptors and memory even for clients that never send a request. It is
+    approximate under bursts: connections accepted but not yet picked up by a
+    worker are not counted.
+
+    A request that needs an upstream connection (gateway or direct; blocked and
+    cached requests do not) is admitted only while the proxy is below
+    max_connections in total and below max_per_host for its destination host, and
+    while fewer than max_pending_connects upstream connects are in progress.
+    Over a limit, the request is answered at once with 503 Service Unavailable
+    (with Retry-After), so a burst degrades into fast rejections instead of
+    exhausting file descriptors. Requests are never queued: a waiting request
+    would stall its proxy worker's event loop and every connection on it.
+
+    The counters live in shared memory, so limits hold across all proxy worker
+    processes. Per-host counts are kept in hash buckets, so two hosts sharing a
+    bucket share a limit.
+
+    Gateway tunnels also stop reading from the gateway while more than
+    max_tunnel_buffer bytes are waiting to be sent to the client, so a slow
+    client cannot make the proxy buffer a whole download.
+
+    Example:
+        >>> admission = AdmissionControl(
+        ...     max_client_connections=5000, max_connections=2000, max_per_host=50
+        ... )
+        >>> client = AluviaClient(api_key="...", admission_control=admission)
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_per_host: Optional[int] = None,
+        max_pending_connects: Optional[int] = None,
+        max_tunnel_buffer: Optional[int] = 1024 * 1024,
+        host_buckets: int = 4096,
+        max_client_connections: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the limits.
+
+        Args:
+            max_connections: Maximum open upstream connections (None for no limit)
+            max_per_host: Maximum open upstream connections per destination host
+            max_pending_connects: Maximum upstream connects in progress at once
+            max_tunnel_buffer: Bytes buffered for a client before a gateway tunnel
+                stops reading from the gateway (None for no limit)
+            host_buckets: Number of shared per-host counters
+            max_client_connections: Maximum open client connections to the proxy,
+                checked when a connection is accepted (None for no limit)
+        """
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.max_pending_connects = max_pending_connects
+        self.max_tunnel_buffer = max_tunnel_buffer
+        self.max_client_connections = max_client_connections
+        self._lock = multiprocessing.Lock()
+        self._active = multiprocessing.RawValue("i", 0)
+        self._pending = multiprocessing.RawValue("i", 0)
+        self._clients_rejected = multiprocessing.RawValue("i", 0)
+        self._hosts = multiprocessing.RawArray("i", max(1, host_buckets))
+
+    def try_admit(self, hostname: str) -> bool:
+        """Take a connection slot for the host if every limit allows it."""
+        bucket = self._bucket(hostname)
+        with self._lock:
+            if self.max_connections is not None and self._active.value >= self.max_connections:
+                return False
+            if self.max_per_host is not None and self._hosts[bucket] >= self.max_per_host:
+                return False
+            self._active.value += 1
+            self._hosts[bucket] += 1
+            return True
+
+    def release(self, hostname: str) -> None:
+        """Give back a connection slot taken by try_admit()."""
+        bucket = self._bucket(hostname)
+        with self._lock:
+            self._active.value = max(0, self._active.value - 1)
+            self._hosts[bucket] = max(0, self._hosts[bucket] - 1)
+
+    def try_begin_connect(self) -> bool:
+        """Count an upstream connect as in progress if the limit allows it."""
+        with self._lock:
+            if (
+                self.max_pending_connects is not None
+                and self._pending.value >= self.max_pending_connects
+            ):
+                return False
+            self._pending.value += 1
+            return True
+
+    def end_connect(self) -> None:
+        """Count an upstream connect as finished."""
+        with self._lock:
+            self._pending.value = max(0, self._pending.value - 1)
+
+    def accepts_client(self, open_connections: int) -> bool:
+        """
+        Check whether a new client connection fits under max_client_connections.
+
+        Args:
+            open_connections: Client connections currently open
+
+        Returns:
+            False (and counts a rejection) if the connection is over the limit
+        """
+        if self.max_client_connections is None or open_connections < self.max_client_connections:
+            return True
+        with self._lock:
+            self._clients_rejected.value += 1
+        return False
+
+    def reset(self) -> None:
+        """Zero all counters (when the proxy restarts)."""
+        with self._lock:
+            self._active.value = 0
+            self._pending.value = 0
+            self._clients_rejected.value = 0
+            for i in range(len(self._hosts)):
+                self._hosts[i] = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the open upstream connections, connects in progress and rejected clients."""
+        return {
+            "active_connections": self._active.value,
+            "pending_connects": self._pending.value,
+            "clients_rejected": self._clients_rejected.value,
+        }
+
+    def _bucket(self, hostname: str) -> int:
+        """Shared counter index for a host (stable across processes)."""
+        return zlib.crc32(hostname.encode()) % len(self._hosts)
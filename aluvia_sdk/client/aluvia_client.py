@@ -3,25 +3,49 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 from typing import Any, Dict, List, Optional, Union
 from urllib.parse import quote
 
+import aiohttp
+import httpx
+
 from aluvia_sdk.api.aluvia_api import AluviaApi
 from aluvia_sdk.client.adapters import (
     to_httpx,
+    to_httpx_async_transport,
+    to_httpx_transport,
     to_playwright_proxy_settings,
     to_requests,
     to_selenium_args,
 )
+from aluvia_sdk.client.admission import AdmissionControl
+from aluvia_sdk.client.block_detection import BlockDetector
 from aluvia_sdk.client.config_manager import ConfigManager
+from aluvia_sdk.client.gateway_pool import GatewayPool
 from aluvia_sdk.client.logger import Logger
-from aluvia_sdk.client.proxy_server import ProxyServer
+from aluvia_sdk.client.proxy_server import (
+    DEFAULT_SESSION_USERNAME_FORMAT,
+    ProxyServer,
+    SharedProxyServer,
+)
+from aluvia_sdk.client.resolver import DnsCache, HappyEyeballs
+from aluvia_sdk.client.response_cache import ResponseCache
 from aluvia_sdk.client.types import GatewayProtocol, LogLevel, PlaywrightProxySettings
 from aluvia_sdk.errors import ApiError, MissingApiKeyError
 
+# aiohttp.ClientSession takes a session-wide proxy= from 3.10 on
+_AIOHTTP_SESSION_PROXY = tuple(int(p) for p in aiohttp.__version__.split(".")[:2]) >= (3, 10)
+
 
 class ConnectionObject:
-    """Connection object returned by client.start()."""
+    """
+    Connection object returned by client.start().
+
+    Clients made by httpx_client(), httpx_sync_client(), aiohttp_session() and
+    requests_session() are pooled, keep-alive clients owned by the connection:
+    create one per job or worker and reuse it, and close() closes them all.
+    """
 
     def __init__(
         self,
@@ -34,43 +58,248 @@ class ConnectionObject:
         as_httpx_fn: Any,
         as_requests_fn: Any,
         close_fn: Any,
+        unix_socket_path: Optional[str] = None,
+        logger: Optional[Logger] = None,
     ) -> None:
         self.host = host
         self.port = port
         self.url = url
+        self.unix_socket_path = unix_socket_path
+        self._clients: List[Any] = []
         self._get_url_fn = get_url_fn
         self._as_playwright_fn = as_playwright_fn
         self._as_selenium_fn = as_selenium_fn
         self._as_httpx_fn = as_httpx_fn
         self._as_requests_fn = as_requests_fn
         self._close_fn = close_fn
+        self._logger = logger
 
     def get_url(self) -> str:
         """Get the current proxy URL."""
         return self._get_url_fn()
 
     def as_playwright(self) -> PlaywrightProxySettings:
-        """Get Playwright proxy settings."""
+        """
+        Get Playwright proxy settings.
+
+        Raises:
+            ValueError: If the local proxy listens on a Unix socket only
+        """
+        self._require_tcp("as_playwright")
         return self._as_playwright_fn()
 
     def as_selenium(self) -> str:
-        """Get Selenium proxy argument."""
+        """
+        Get Selenium proxy argument.
+
+        Raises:
+            ValueError: If the local proxy listens on a Unix socket only
+        """
+        self._require_tcp("as_selenium")
         return self._as_selenium_fn()
 
     def as_httpx(self) -> Dict[str, str]:
-        """Get httpx proxy configuration."""
+        """
+        Get httpx proxy configuration.
+
+        Raises:
+            ValueError: If the local proxy listens on a Unix socket only; use
+                as_httpx_transport() then
+        """
+        self._require_tcp("as_httpx")
         return self._as_httpx_fn()
 
     def as_requests(self) -> Dict[str, str]:
-        """Get requests proxy configuration."""
+        """
+        Get requests proxy configuration.
+
+        Raises:
+            ValueError: If the local proxy listens on a Unix socket only
+        """
+        self._require_tcp("as_requests")
         return self._as_requests_fn()
 
     def as_aiohttp(self) -> str:
-        """Get aiohttp proxy URL."""
+        """
+        Get aiohttp proxy URL.
+
+        Raises:
+            ValueError: If the local proxy listens on a Unix socket only
+        """
+        self._require_tcp("as_aiohttp")
         return self.url
 
+    def as_httpx_transport(self, limits: Optional[httpx.Limits] = None) -> httpx.BaseTransport:
+        """Get an httpx transport, over the local proxy's Unix socket if it has one."""
+        if self.unix_socket_path:
+            return to_httpx_transport(self.unix_socket_path, limits=limits)
+        return httpx.HTTPTransport(
+            proxy=httpx.Proxy(self.get_url()), limits=limits or httpx.Limits()
+        )
+
+    def as_httpx_async_transport(
+        self, limits: Optional[httpx.Limits] = None
+    ) -> httpx.AsyncBaseTransport:
+        """Get an async httpx transport, over the local proxy's Unix socket if it has one."""
+        if self.unix_socket_path:
+            return to_httpx_async_transport(self.unix_socket_path, limits=limits)
+        return httpx.AsyncHTTPTransport(
+            proxy=httpx.Proxy(self.get_url()), limits=limits or httpx.Limits()
+        )
+
+    def httpx_client(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        **kwargs: Any,
+    ) -> httpx.AsyncClient:
+        """
+        Create a pooled httpx.AsyncClient routed through this connection.
+
+        Args:
+            max_connections: Maximum open connections (None for no limit)
+            max_keepalive_connections: Maximum idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept
+            **kwargs: Other httpx.AsyncClient arguments (timeout, headers, ...)
+
+        Returns:
+            Client closed by close()
+        """
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        client = httpx.AsyncClient(transport=self.as_httpx_async_transport(limits), **kwargs)
+        self._clients.append(client)
+        return client
+
+    def httpx_sync_client(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        **kwargs: Any,
+    ) -> httpx.Client:
+        """
+        Create a pooled httpx.Client routed through this connection.
+
+        Takes the same arguments as httpx_client().
+
+        Returns:
+            Client closed by close()
+        """
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        client = httpx.Client(transport=self.as_httpx_transport(limits), **kwargs)
+        self._clients.append(client)
+        return client
+
+    def aiohttp_session(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        **kwargs: Any,
+    ) -> aiohttp.ClientSession:
+        """
+        Create a pooled aiohttp.ClientSession routed through this connection.
+
+        Must be called with an event loop running.
+
+        Args:
+            limit: Maximum open connections (0 for no limit)
+            limit_per_host: Maximum open connections per host (0 for no limit)
+            keepalive_timeout: Seconds an idle connection is kept
+            **kwargs: Other aiohttp.ClientSession arguments (timeout, headers, ...)
+
+        Returns:
+            Session closed by close()
+
+        Raises:
+            ValueError: If the local proxy listens on a Unix socket only
+            RuntimeError: If aiohttp is older than 3.10; pass proxy=as_aiohttp()
+                to each request instead then
+        """
+        if not _AIOHTTP_SESSION_PROXY:
+            raise RuntimeError(
+                f"aiohttp_session() needs aiohttp 3.10 or later (found {aiohttp.__version__}); "
+                "pass proxy=connection.as_aiohttp() to each request instead"
+            )
+        url = self._tcp_url("aiohttp_session")
+        connector = aiohttp.TCPConnector(
+            limit=limit, limit_per_host=limit_per_host, keepalive_timeout=keepalive_timeout
+        )
+        session = aiohttp.ClientSession(connector=connector, proxy=url, **kwargs)
+        self._clients.append(session)
+        return session
+
+    def requests_session(self, pool_connections: int = 10, pool_maxsize: int = 10) -> Any:
+        """
+        Create a pooled requests.Session routed through this connection.
+
+        Requires the 'requests' package (pip install aluvia-sdk[requests]).
+
+        Args:
+            pool_connections: Number of per-host pools to cache
+            pool_maxsize: Maximum connections kept per host; match it to the number
+                of threads sharing the session
+
+        Returns:
+            requests.Session closed by close()
+
+        Raises:
+            ValueError: If the local proxy listens on a Unix socket only
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        url = self._tcp_url("requests_session")
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.proxies.update(to_requests(url))
+        self._clients.append(session)
+        return session
+
+    def _require_tcp(self, helper: str) -> None:
+        """Refuse helpers for tools that cannot use the Unix socket listener."""
+        if self.unix_socket_path and not self.port:
+            raise ValueError(
+                f"{helper}() needs the local proxy's TCP listener, but it listens on "
+                f"unix:{self.unix_socket_path} only; use httpx_client() or "
+                "as_httpx_transport(), or start without unix_socket_only"
+            )
+
+    def _tcp_url(self, factory: str) -> str:
+        """Proxy URL for clients that cannot use a Unix socket."""
+        self._require_tcp(factory)
+        return self.get_url()
+
+    async def close_clients(self) -> None:
+        """Close the clients created by this connection's client factories."""
+        clients, self._clients = self._clients, []
+        for client in clients:
+            # One failing client must not leave the others open
+            try:
+                if isinstance(client, httpx.AsyncClient):
+                    await client.aclose()
+                elif isinstance(client, aiohttp.ClientSession):
+                    await client.close()
+                else:
+                    client.close()
+            except Exception as e:
+                if self._logger is not None:
+                    self._logger.warning(f"Failed to close {type(client).__name__}: {e}")
+
     async def close(self) -> None:
-        """Close the connection and stop the proxy."""
+        """Close the connection's clients and stop the proxy."""
+        await self.close_clients()
         await self._close_fn()
 
     async def stop(self) -> None:
@@ -104,6 +333,20 @@ class AluviaClient:
         connection_id: Optional[Union[int, str]] = None,
         local_proxy: bool = True,
         strict: bool = True,
+        block_rules: Optional[List[str]] = None,
+        response_cache: Union[bool, ResponseCache] = False,
+        block_detector: Union[bool, BlockDetector] = False,
+        dns_cache: Union[bool, DnsCache] = False,
+        happy_eyeballs: Union[bool, HappyEyeballs] = False,
+        http2: bool = False,
+        shared_proxy: Optional[SharedProxyServer] = None,
+        listen_shards: int = 1,
+        unix_socket_path: Optional[str] = None,
+        unix_socket_only: bool = False,
+        sticky_sessions: Union[bool, str] = False,
+        session_ports: Optional[Dict[int, Optional[str]]] = None,
+        gateway_pool: Optional[GatewayPool] = None,
+        admission_control: Optional[AdmissionControl] = None,
     ) -> None:
         """
         Initialize AluviaClient.
@@ -120,6 +363,50 @@ class AluviaClient:
             connection_id: Existing connection ID to use
             local_proxy: Whether to start local proxy (default: True)
             strict: Strict mode for error handling
+            block_rules: Local block rules, e.g. ['*.doubleclick.net', 'ext:woff2'];
+                matching requests are answered by the local proxy without any upstream
+            response_cache: Cache plain-HTTP GET responses routed through the gateway
+                in the local proxy. True uses a default in-memory ResponseCache; pass a
+                ResponseCache to size it or enable the disk tier. Off by default.
+            block_detector: Let the local proxy detect blocked direct requests (403/429
+                by default) and route the hostname through Aluvia from then on. True
+                uses a default BlockDetector; pass one to customize it. Off by default.
+            dns_cache: Cache DNS answers (including failures) for direct routes in the
+                local proxy. True uses a default DnsCache. Off by default.
+            happy_eyeballs: Race IPv6 and IPv4 connection attempts (RFC 8305) for
+                direct routes; the winning connection is used and its address tried
+                first next time. True uses a default HappyEyeballs. Off by default.
+            http2: Use HTTP/2 for control-plane traffic, multiplexing configuration
+                polls, updates and API calls over one connection. client.api then
+                shares that connection and is closed by stop(). Requires the 'h2'
+                package (pip install aluvia-sdk[http2]). Off by default.
+            shared_proxy: Running SharedProxyServer to register this connection with
+                instead of starting a local proxy of its own. local_port then selects
+                one of the server's tenant ports; the response cache, DNS cache and
+                happy eyeballs options of the shared server apply.
+            listen_shards: Number of SO_REUSEPORT listening sockets for the local
+                proxy, each with its own worker process and accept queue, for bursts
+                of hundreds of new connections. Linux only. Default: 1.
+            unix_socket_path: Also listen on this Unix socket; the connection's
+                as_httpx_transport() then uses it, which avoids TCP setup cost and
+                ephemeral ports under heavy connection churn. Not on Windows.
+            unix_socket_only: Listen on unix_socket_path only, without a TCP port;
+                browsers and other TCP-only tools cannot use the connection then.
+            sticky_sessions: Let each client of the local proxy pick its own gateway
+                session (and so its own IP) without changing the connection; see
+                session_url() and set_port_session(). True uses the gateway username
+                format "{username}-session-{session}"; pass a format string with
+                {username} and {session} fields to change it. Off by default.
+            session_ports: Extra local ports mapped to a sticky session each (None for
+                the connection's own session), e.g. one per browser context.
+                Requires sticky_sessions. Not on Windows.
+            gateway_pool: Gateway endpoints the local proxy spreads gateway
+                connections over, with health probes and failover (see
+                GatewayPool). Not used in gateway mode.
+            admission_control: Limits on the local proxy's concurrent client
+                connections, upstream connections, per destination host and pending
+                connects; connections and requests over them get a 503 (see
+                AdmissionControl). Off by default.
         """
         api_key = str(api_key or "").strip()
         if not api_key:
@@ -136,12 +423,26 @@ class AluviaClient:
         self.connection_id = connection_id
         self.local_proxy = local_proxy
         self.strict = strict
+        self.block_rules = list(block_rules or [])
+        self.shared_proxy = shared_proxy
+        if unix_socket_path and sys.platform.startswith("win"):
+            raise ValueError("unix_socket_path is not supported on Windows")
+        if unix_socket_only and not unix_socket_path:
+            raise ValueError("unix_socket_only requires a unix_socket_path")
+        self.unix_socket_path = unix_socket_path
+        self.unix_socket_only = unix_socket_only
+        self._tenant_id: Optional[str] = None
 
         self.logger = Logger(log_level)
         self._connection: Optional[ConnectionObject] = None
         self._started = False
         self._start_lock = asyncio.Lock()
 
+        # Create API wrapper; with HTTP/2 the ConfigManager shares its HTTP client,
+        # which this client then owns and closes in stop()
+        self.http2 = http2
+        self.api = self._create_api()
+
         # Create ConfigManager
         self.config_manager = ConfigManager(
             api_key=api_key,
@@ -152,17 +453,37 @@ class AluviaClient:
             log_level=log_level,
             connection_id=connection_id,
             strict=strict,
+            http2=http2,
+            client=self.api.http_client if http2 else None,
         )
 
         # Create ProxyServer
-        self.proxy_server = ProxyServer(self.config_manager, log_level=log_level)
-
-        # Create API wrapper
-        self.api = AluviaApi(
-            api_key=api_key,
-            api_base_url=api_base_url,
-            timeout_ms=timeout_ms,
+        if response_cache is True:
+            response_cache = ResponseCache()
+        if block_detector is True:
+            block_detector = BlockDetector()
+        if dns_cache is True:
+            dns_cache = DnsCache()
+        if happy_eyeballs is True:
+            happy_eyeballs = HappyEyeballs()
+        self.proxy_server = ProxyServer(
+            self.config_manager,
+            log_level=log_level,
+            block_rules=block_rules,
+            response_cache=response_cache or None,
+            block_detector=block_detector or None,
+            dns_cache=dns_cache or None,
+            happy_eyeballs=happy_eyeballs or None,
+            listen_shards=listen_shards,
+            session_username_format=(
+                DEFAULT_SESSION_USERNAME_FORMAT
+                if sticky_sessions is True
+                else sticky_sessions or None
+            ),
+            gateway_pool=gateway_pool,
+            admission_control=admission_control,
         )
+        self.session_ports = dict(session_ports or {})
 
     async def start(self) -> ConnectionObject:
         """
@@ -176,6 +497,11 @@ class AluviaClient:
             if self._started and self._connection:
                 return self._connection
 
+            if self.http2 and self.api.http_client.is_closed:
+                # Closed by an earlier stop()
+                self.api = self._create_api()
+                self.config_manager.client = self.api.http_client
+
             # Fetch initial configuration
             await self.config_manager.init()
 
@@ -190,13 +516,33 @@ class AluviaClient:
             else:
                 # Client proxy mode - start local proxy
                 self.config_manager.start_polling()
-                info = await self.proxy_server.start(self.local_port)
+                if self.shared_proxy is not None:
+                    info = self.shared_proxy.register(
+                        self.config_manager, port=self.local_port, block_rules=self.block_rules
+                    )
+                    self._tenant_id = info["tenant_id"]
+                else:
+                    info = await self.proxy_server.start(
+                        self.local_port,
+                        unix_socket_path=self.unix_socket_path,
+                        tcp=not self.unix_socket_only,
+                        session_ports=self.session_ports,
+                    )
                 connection = self._create_local_connection(info)
 
             self._connection = connection
             self._started = True
             return connection
 
+    def _create_api(self) -> AluviaApi:
+        """Create the API wrapper exposed as client.api."""
+        return AluviaApi(
+            api_key=self.api_key,
+            api_base_url=self.api_base_url,
+            timeout_ms=self.timeout_ms,
+            http2=self.http2,
+        )
+
     def _create_gateway_connection(self) -> ConnectionObject:
         """Create connection object for gateway mode."""
         config = self.config_manager.get_config()
@@ -253,20 +599,31 @@ class AluviaClient:
             as_httpx_fn=as_httpx,
             as_requests_fn=as_requests,
             close_fn=close,
+            logger=self.logger,
         )
 
     def _create_local_connection(self, info: Dict[str, Any]) -> ConnectionObject:
         """Create connection object for local proxy mode."""
         url = info["url"]
+        # Shared proxy tenants authenticate with proxy credentials, which Playwright
+        # takes separately and Chromium's --proxy-server flag cannot carry
+        server_url = f"http://{info['host']}:{info['port']}"
 
         def get_url() -> str:
             return url
 
         def as_playwright() -> PlaywrightProxySettings:
+            if info.get("username"):
+                settings = to_playwright_proxy_settings(server_url)
+                return {
+                    "server": settings["server"],
+                    "username": info["username"],
+                    "password": info["password"],
+                }
             return to_playwright_proxy_settings(url)
 
         def as_selenium() -> str:
-            return to_selenium_args(url)
+            return to_selenium_args(server_url)
 
         def as_httpx() -> Dict[str, str]:
             return to_httpx(url)
@@ -275,7 +632,7 @@ class AluviaClient:
             return to_requests(url)
 
         async def close() -> None:
-            await self.proxy_server.stop()
+            await self._stop_local_proxy()
             await self.config_manager.stop_polling()
             self._connection = None
             self._started = False
@@ -290,20 +647,41 @@ class AluviaClient:
             as_httpx_fn=as_httpx,
             as_requests_fn=as_requests,
             close_fn=close,
+            unix_socket_path=info.get("unix_socket_path"),
+            logger=self.logger,
         )
 
-    async def stop(self) -> None:
-        """Stop the client and clean up resources."""
+    async def stop(self, drain_timeout: Optional[float] = None) -> None:
+        """
+        Stop the client and clean up resources.
+
+        Args:
+            drain_timeout: Let the local proxy's open connections finish for up to
+                this many seconds before closing them (see ProxyServer.drain())
+        """
         if not self._started:
             return
 
+        if self._connection is not None:
+            await self._connection.close_clients()
         if self.local_proxy:
-            await self.proxy_server.stop()
+            await self._stop_local_proxy(drain_timeout)
 
         await self.config_manager.stop_polling()
+        if self.http2:
+            # The API client's connection is shared with the ConfigManager
+            await self.api.close()
         self._connection = None
         self._started = False
 
+    async def _stop_local_proxy(self, drain_timeout: Optional[float] = None) -> None:
+        """Stop the local proxy, or deregister from the shared one."""
+        if self.shared_proxy is None:
+            await self.proxy_server.stop(drain_timeout=drain_timeout)
+        elif self._tenant_id is not None:
+            self.shared_proxy.deregister(self._tenant_id)
+            self._tenant_id = None
+
     async def update_rules(self, rules: List[str]) -> None:
         """
         Update the filtering rules used by the proxy.
@@ -313,6 +691,32 @@ class AluviaClient:
         """
         await self.config_manager.set_config(rules=rules)
 
+    async def update_block_rules(self, block_rules: List[str]) -> None:
+        """
+        Replace the local block rules.
+
+        Block rules are applied by the local proxy only and are not sent to the API.
+
+        Args:
+            block_rules: Block patterns, e.g. ['*.doubleclick.net', 'ext:woff2', '/ads/*']
+        """
+        self.block_rules = list(block_rules)
+        if self.shared_proxy is not None and self._tenant_id is not None:
+            self.shared_proxy.set_tenant_block_rules(self._tenant_id, block_rules)
+        else:
+            self.proxy_server.set_block_rules(block_rules)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get local proxy traffic counters.
+
+        With a shared proxy, the counters cover all of its tenants.
+
+        Returns:
+            Dictionary of counters (see ProxyServer.get_stats)
+        """
+        return (self.shared_proxy or self.proxy_server).get_stats()
+
     async def update_session_id(self, session_id: str) -> None:
         """
         Update the upstream session_id.
@@ -322,18 +726,45 @@ class AluviaClient:
         """
         await self.config_manager.set_config(session_id=session_id)
 
+    def session_url(self, session_id: str) -> str:
+        """
+        Get a local proxy URL for HTTP clients that should use their own sticky session.
+
+        Requires sticky_sessions; see ProxyServer.session_url().
+
+        Args:
+            session_id: Session id (letters, digits and underscores, at most 64)
+        """
+        return self.proxy_server.session_url(session_id)
+
+    def set_port_session(self, port: int, session_id: Optional[str]) -> None:
+        """
+        Set the sticky session of one of the session_ports, without an API call.
+
+        Args:
+            port: One of the session_ports
+            session_id: Session id, or None for the connection's own session
+        """
+        self.proxy_server.set_port_session(port, session_id)
+
     async def update_target_geo(self, target_geo: Optional[str]) -> None:
         """
         Update the upstream target_geo (geo targeting).
 
         Args:
             target_geo: Geo code (e.g., 'us_ca') or None to clear
+
+        Raises:
+            ApiError: If the code is not in the cached geo catalogue (see
+                api.geos.catalog()); without a cached catalogue the API validates it
         """
         if target_geo is None:
             await self.config_manager.set_config(target_geo=None)
             return
 
         trimmed = target_geo.strip()
+        if trimmed and self.api.geos.validate(trimmed) is False:
+            raise ApiError(f"Unknown target_geo '{trimmed}'")
         await self.config_manager.set_config(target_geo=trimmed if trimmed else None)
 
     async def __aenter__(self) -> "AluviaClient":
@@ -0,0 +1,79 @@
+"""Block detection for direct (non-gateway) routes in the local proxy."""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional, Union
+
+
+class BlockDetector:
+    """
+    Detects when a destination blocks direct traffic.
+
+    The local proxy inspects plain-HTTP responses on direct routes. When one looks
+    like a block, the hostname is added to the routing rules of every proxy worker
+    immediately, so subsequent requests go through the Aluvia gateway without an
+    application round-trip. Promotions last until the proxy stops; with
+    persist=True the hostname is also saved to the connection's rules on the
+    server in the background, so a transient block (e.g. a 429) becomes a
+    permanent rule.
+
+    HTTPS responses are encrypted inside CONNECT tunnels and cannot be inspected.
+
+    Example:
+        >>> detector = BlockDetector(status_codes=(403, 429), body_signatures=["captcha"])
+        >>> client = AluviaClient(api_key="...", block_detector=detector)
+    """
+
+    def __init__(
+        self,
+        status_codes: Iterable[int] = (403, 429),
+        body_signatures: Iterable[Union[str, bytes]] = (),
+        persist: bool = False,
+        max_body_bytes: int = 32 * 1024,
+    ) -> None:
+        """
+        Initialize the detector.
+
+        Args:
+            status_codes: Response status codes treated as a block
+            body_signatures: Case-insensitive strings that mark a block page when
+                found in the start of the response body
+            persist: Also add promoted hostnames to the connection's rules on the server
+                (off by default)
+            max_body_bytes: How much of each response body to scan for signatures
+        """
+        self.status_codes = frozenset(status_codes)
+        self.body_signatures = tuple(
+            (s.encode("utf-8") if isinstance(s, str) else s).lower() for s in body_signatures if s
+        )
+        self.persist = persist
+        self.max_body_bytes = max_body_bytes
+
+    def is_block_status(self, status: int) -> bool:
+        """Check whether a response status code indicates a block."""
+        return status in self.status_codes
+
+    def matches_body(self, body: bytes) -> bool:
+        """Check whether a (partial) response body contains a block signature."""
+        if not self.body_signatures:
+            return False
+        lowered = body[: self.max_body_bytes].lower()
+        return any(signature in lowered for signature in self.body_signatures)
+
+
+def parse_status_code(data: bytes) -> Optional[int]:
+    """
+    Parse the status code from the start of an HTTP/1.x response.
+
+    Args:
+        data: Raw response bytes, starting with the status line
+
+    Returns:
+        The status code, or None if data does not start with a status line
+    """
+    if not data.startswith(b"HTTP/"):
+        return None
+    parts = data.split(b" ", 2)
+    if len(parts) < 2 or len(parts[1]) != 3 or not parts[1].isdigit():
+        return None
+    return int(parts[1])
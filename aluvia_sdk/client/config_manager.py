@@ -3,48 +3,42 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
 from typing import Any, Callable, List, Optional, Union
 
+import httpx
+
 from aluvia_sdk.api.request import request_core
+from aluvia_sdk.api.retry import RetryPolicy
 from aluvia_sdk.client.logger import Logger
 from aluvia_sdk.client.types import GatewayProtocol, LogLevel
 from aluvia_sdk.errors import ApiError, InvalidApiKeyError
 
 
+@dataclass(frozen=True)
 class RawProxyConfig:
     """Raw proxy configuration."""
 
-    def __init__(
-        self,
-        protocol: GatewayProtocol,
-        host: str,
-        port: int,
-        username: str,
-        password: str,
-    ) -> None:
-        self.protocol = protocol
-        self.host = host
-        self.port = port
-        self.username = username
-        self.password = password
+    __slots__ = ("protocol", "host", "port", "username", "password")
+
+    protocol: GatewayProtocol
+    host: str
+    port: int
+    username: str
+    password: str
 
 
+@dataclass(frozen=True)
 class ConnectionNetworkConfig:
     """Complete connection network configuration."""
 
-    def __init__(
-        self,
-        raw_proxy: RawProxyConfig,
-        rules: List[str],
-        session_id: Optional[str],
-        target_geo: Optional[str],
-        etag: Optional[str],
-    ) -> None:
-        self.raw_proxy = raw_proxy
-        self.rules = rules
-        self.session_id = session_id
-        self.target_geo = target_geo
-        self.etag = etag
+    __slots__ = ("raw_proxy", "rules", "session_id", "target_geo", "etag")
+
+    raw_proxy: RawProxyConfig
+    rules: List[str]
+    session_id: Optional[str]
+    target_geo: Optional[str]
+    etag: Optional[str]
 
 
 class ConfigManager:
@@ -68,6 +62,9 @@ class ConfigManager:
         connection_id: Optional[Union[int, str]] = None,
         strict: bool = True,
         shared_config_callback: Optional[Callable[[str, Any], None]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        http2: bool = False,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         self.api_key = api_key
         self.api_base_url = api_base_url
@@ -78,6 +75,12 @@ class ConfigManager:
         self.strict = strict
         self.logger = Logger(log_level)
         self._shared_config_callback = shared_config_callback
+        # Transient failures are retried so one blip doesn't fail startup or skip a poll
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Polls and PATCHes share this client's connection (with HTTP/2, one
+        # multiplexed connection); without one, each request opens its own
+        self.http2 = http2
+        self.client = client
 
         self._config: Optional[ConnectionNetworkConfig] = None
         self._polling_task: Optional[asyncio.Task[None]] = None
@@ -105,6 +108,9 @@ class ConfigManager:
                 method=method,
                 path=path,
                 body=body,
+                retry=self.retry_policy,
+                client=self.client,
+                http2=self.http2,
             )
 
             if result["status"] < 200 or result["status"] >= 300:
@@ -130,7 +136,11 @@ class ConfigManager:
         status = result["status"]
         if status in (401, 403):
             raise InvalidApiKeyError(f"Authentication failed (HTTP {status})")
-        raise ApiError(f"API request failed (HTTP {status})", status_code=status)
+        raise ApiError(
+            f"API request failed (HTTP {status})",
+            status_code=status,
+            attempts=result.get("attempts"),
+        )
 
     def _parse_rules(self, rules_data: Any) -> list[str]:
         """
@@ -257,6 +267,9 @@ class ConfigManager:
                 method="GET",
                 path=f"/account/connections/{self.connection_id}",
                 if_none_match=self._config.etag,
+                retry=self.retry_policy,
+                client=self.client,
+                http2=self.http2,
             )
 
             # 304 Not Modified - no changes
@@ -302,6 +315,9 @@ class ConfigManager:
                 method="PATCH",
                 path=f"/account/connections/{self.connection_id}",
                 body=body,
+                retry=self.retry_policy,
+                client=self.client,
+                http2=self.http2,
             )
 
             if result["status"] < 200 or result["status"] >= 300:
@@ -0,0 +1,224 @@
+"""Gateway endpoint selection with health checking for the local proxy."""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+EndpointSpec = Union[str, Tuple[str, int]]
+
+STRATEGIES = ("ewma", "least_pending")
+
+
+class GatewayEndpoint:
+    """One gateway endpoint and what the local proxy has learned about it."""
+
+    __slots__ = ("host", "port", "ewma", "pending", "failures", "down_until")
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        # Smoothed connect time in seconds (None until the first measurement)
+        self.ewma: Optional[float] = None
+        self.pending = 0
+        self.failures = 0
+        self.down_until = 0.0
+
+    @property
+    def address(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    def is_up(self, now: float) -> bool:
+        return now >= self.down_until
+
+
+def parse_endpoint(spec: EndpointSpec) -> Tuple[str, int]:
+    """
+    Parse a "host:port" string (or pass a (host, port) tuple through).
+
+    Raises:
+        ValueError: If the port is missing or invalid
+    """
+    if isinstance(spec, tuple):
+        return spec[0], int(spec[1])
+    host, sep, port = spec.rpartition(":")
+    if not sep or not host or not port.isdigit():
+        raise ValueError(f"Gateway endpoint must be host:port, got {spec!r}")
+    return host.strip("[]"), int(port)
+
+
+class GatewayPool:
+    """
+    Several gateway endpoints for the local proxy, with failover.
+
+    Every gateway-routed connection picks an endpoint that is up: with the
+    "ewma" strategy the one with the lowest smoothed connect time times
+    (pending connections + 1), with "least_pending" the one with the fewest
+    pending connections (then the lowest connect time). Endpoints not measured
+    yet are tried first.
+
+    Failures are detected two ways. Passively, a failed connect counts against
+    the endpoint and the connection moves on to the next one. Actively, a
+    background thread in each proxy worker times a TCP connect to every endpoint
+    each probe_interval seconds. After failure_threshold consecutive failures an
+    endpoint is taken out for cooldown seconds, or until a probe succeeds. When
+    every endpoint is down, the one due back first is still tried.
+
+    Credentials still come from the connection's configuration; only the host
+    and port are chosen here. Gateway mode (local_proxy=False) connects to the
+    configured host directly and cannot fail over.
+
+    Example:
+        >>> pool = GatewayPool(["gw1.example.com:8080", "gw2.example.com:8080"])
+        >>> client = AluviaClient(api_key="...", gateway_pool=pool)
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[EndpointSpec],
+        strategy: str = "ewma",
+        probe_interval: Optional[float] = 10.0,
+        probe_timeout: float = 2.0,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        ewma_alpha: float = 0.3,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            endpoints: Gateway endpoints as "host:port" strings or (host, port) tuples
+            strategy: "ewma" (latency-weighted) or "least_pending"
+            probe_interval: Seconds between active health probes (None disables them)
+            probe_timeout: Time limit for one probe connect
+            failure_threshold: Consecutive failures that take an endpoint out
+            cooldown: Seconds an endpoint stays out unless a probe succeeds
+            ewma_alpha: Weight of the newest connect time in the moving average
+
+        Raises:
+            ValueError: If no endpoints are given or an option is invalid
+        """
+        self.endpoints = [GatewayEndpoint(*parse_endpoint(spec)) for spec in endpoints]
+        if not self.endpoints:
+            raise ValueError("GatewayPool needs at least one endpoint")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy!r}; use one of {STRATEGIES}")
+        self.strategy = strategy
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.ewma_alpha = ewma_alpha
+        self._lock = threading.Lock()
+        self._probe_pid = 0
+        self._stop = threading.Event()
+
+    def select(self, exclude: Iterable[GatewayEndpoint] = ()) -> Optional[GatewayEndpoint]:
+        """
+        Pick the endpoint for a new gateway connection.
+
+        Args:
+            exclude: Endpoints already tried for this connection
+
+        Returns:
+            An endpoint, or None if every endpoint is excluded
+        """
+        excluded = set(map(id, exclude))
+        now = time.monotonic()
+        with self._lock:
+            candidates = [e for e in self.endpoints if id(e) not in excluded]
+            if not candidates:
+                return None
+            up = [e for e in candidates if e.is_up(now)]
+            if not up:
+                return min(candidates, key=lambda e: e.down_until)
+            if self.strategy == "least_pending":
+                return min(up, key=lambda e: (e.pending, e.ewma or 0.0))
+            return min(up, key=lambda e: (e.ewma or 0.0) * (e.pending + 1))
+
+    def begin(self, endpoint: GatewayEndpoint) -> None:
+        """Count a connection to the endpoint as pending."""
+        with self._lock:
+            endpoint.pending += 1
+
+    def end(self, endpoint: GatewayEndpoint) -> None:
+        """Count a pending connection to the endpoint as finished."""
+        with self._lock:
+            endpoint.pending = max(0, endpoint.pending - 1)
+
+    def record_success(self, endpoint: GatewayEndpoint, connect_time: float) -> None:
+        """Record a successful connect and fold its time into the moving average."""
+        with self._lock:
+            endpoint.ewma = (
+                connect_time
+                if endpoint.ewma is None
+                else self.ewma_alpha * connect_time + (1 - self.ewma_alpha) * endpoint.ewma
+            )
+            endpoint.failures = 0
+            endpoint.down_until = 0.0
+
+    def record_failure(self, endpoint: GatewayEndpoint) -> None:
+        """Record a failed connect; take the endpoint out after too many in a row."""
+        with self._lock:
+            endpoint.failures += 1
+            if endpoint.failures >= self.failure_threshold:
+                endpoint.down_until = time.monotonic() + self.cooldown
+
+    def probe(self) -> None:
+        """Time a TCP connect to every endpoint and record the results."""
+        for endpoint in self.endpoints:
+            started = time.monotonic()
+            try:
+                with socket.create_connection(
+                    (endpoint.host, endpoint.port), timeout=self.probe_timeout
+                ):
+                    pass
+            except OSError:
+                self.record_failure(endpoint)
+            else:
+                self.record_success(endpoint, time.monotonic() - started)
+
+    def ensure_probing(self) -> None:
+        """Start the probe thread in this process if it is not running yet."""
+        if self.probe_interval is None or self._probe_pid == os.getpid():
+            return
+        # A forked worker inherits the parent's state but not its threads
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._probe_pid = os.getpid()
+        threading.Thread(target=self._probe_loop, name="aluvia-gateway-probe", daemon=True).start()
+
+    def stop_probing(self) -> None:
+        """Stop this process's probe thread."""
+        self._stop.set()
+        self._probe_pid = 0
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get each endpoint's state as seen by this process.
+
+        Returns:
+            One dict per endpoint: address, up, connect_ms, pending, failures
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "address": e.address,
+                    "up": e.is_up(now),
+                    "connect_ms": None if e.ewma is None else round(e.ewma * 1000, 2),
+                    "pending": e.pending,
+                    "failures": e.failures,
+                }
+                for e in self.endpoints
+            ]
+
+    def _probe_loop(self) -> None:
+        """Probe the endpoints until stopped."""
+        stop = self._stop
+        while not stop.is_set():
+            self.probe()
+            stop.wait(self.probe_interval)
@@ -0,0 +1,248 @@
+"""Pool of warm Playwright browser contexts routed through an Aluvia connection."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Set
+
+from aluvia_sdk.client.logger import Logger
+from aluvia_sdk.client.types import LogLevel
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Playwright
+
+    from aluvia_sdk.client.aluvia_client import ConnectionObject
+
+
+class BrowserContextPool:
+    """
+    Warm pool of Playwright browser contexts wired to a connection's proxy.
+
+    Launching browsers and contexts dominates the cost of short browser jobs.
+    The pool keeps `size` contexts ready, hands them out with acquire() and
+    takes them back with release(), closing a context after `max_uses`
+    checkouts and opening a fresh one in its place. At most `max_concurrency`
+    contexts are checked out at once; further acquire() calls wait.
+
+    Contexts get the connection's Playwright proxy settings (see
+    adapters.to_playwright_proxy_settings()), read again each time a context is
+    created, so recycled contexts pick up rotated gateway credentials.
+
+    Requires Playwright (pip install aluvia-sdk[playwright]) unless a browser is
+    passed in.
+
+    Example:
+        >>> pool = BrowserContextPool(connection, size=4)
+        >>> await pool.start()
+        >>> async with pool.context() as context:
+        ...     page = await context.new_page()
+        ...     await page.goto("https://example.com")
+        >>> await pool.close()
+    """
+
+    def __init__(
+        self,
+        connection: ConnectionObject,
+        size: int = 4,
+        max_uses: int = 50,
+        max_concurrency: Optional[int] = None,
+        browser: Optional[Browser] = None,
+        browser_type: str = "chromium",
+        launch_options: Optional[Dict[str, Any]] = None,
+        context_options: Optional[Dict[str, Any]] = None,
+        clear_cookies: bool = True,
+        log_level: LogLevel = "info",
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            connection: Connection returned by AluviaClient.start()
+            size: Number of contexts kept warm
+            max_uses: Checkouts after which a context is closed and replaced
+            max_concurrency: Maximum contexts checked out at once (default: size)
+            browser: Browser to create contexts in; launched by start() if omitted
+                and closed with the pool only in that case
+            browser_type: Playwright browser type to launch ("chromium", "firefox"
+                or "webkit")
+            launch_options: Extra arguments for browser_type.launch()
+            context_options: Extra arguments for browser.new_context()
+            clear_cookies: Clear a context's cookies when it is released
+            log_level: Logging level
+        """
+        if size < 0 or max_uses < 1:
+            raise ValueError("size must be >= 0 and max_uses >= 1")
+        self.connection = connection
+        self.size = size
+        self.max_uses = max_uses
+        self.max_concurrency = max_concurrency or max(size, 1)
+        self.browser_type = browser_type
+        self.launch_options = dict(launch_options or {})
+        self.context_options = dict(context_options or {})
+        self.clear_cookies = clear_cookies
+        self.logger = Logger(log_level)
+
+        self._browser = browser
+        self._owns_browser = browser is None
+        self._playwright: Optional[Playwright] = None
+        self._idle: List[BrowserContext] = []
+        self._uses: Dict[BrowserContext, int] = {}
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._refills: Set["asyncio.Task[None]"] = set()
+        self._closed = False
+        self._stats = {"checkouts": 0, "contexts_created": 0, "contexts_recycled": 0}
+
+    async def start(self) -> "BrowserContextPool":
+        """Launch the browser if needed and open the warm contexts."""
+        if self._browser is None:
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+            launcher = getattr(self._playwright, self.browser_type)
+            self._browser = await launcher.launch(
+                **{"proxy": self.connection.as_playwright(), **self.launch_options}
+            )
+        contexts = await asyncio.gather(*(self._new_context() for _ in range(self.size)))
+        self._idle.extend(contexts)
+        return self
+
+    async def acquire(self, timeout: Optional[float] = None) -> BrowserContext:
+        """
+        Check out a context, waiting for a free slot if max_concurrency are in use.
+
+        Args:
+            timeout: Seconds to wait for a slot (None waits forever)
+
+        Raises:
+            asyncio.TimeoutError: If no slot frees up in time
+            RuntimeError: If the pool is closed
+        """
+        if self._closed:
+            raise RuntimeError("BrowserContextPool is closed")
+        await asyncio.wait_for(self._slots.acquire(), timeout)
+        try:
+            context = self._idle.pop() if self._idle else await self._new_context()
+        except BaseException:
+            self._slots.release()
+            raise
+        self._uses[context] += 1
+        self._stats["checkouts"] += 1
+        return context
+
+    async def release(self, context: BrowserContext, discard: bool = False) -> None:
+        """
+        Return a checked-out context to the pool.
+
+        Its pages are closed. A context that reached max_uses, or is discarded
+        (e.g. after a crash or a block), is closed and replaced by a fresh one.
+
+        Args:
+            context: Context returned by acquire()
+            discard: Close the context instead of reusing it
+        """
+        try:
+            if (
+                discard
+                or self._closed
+                or self._uses.get(context, self.max_uses) >= self.max_uses
+                or len(self._idle) >= self.size
+            ):
+                await self._close_context(context)
+                self._stats["contexts_recycled"] += 1
+                self._refill()
+                return
+            try:
+                for page in list(context.pages):
+                    await page.close()
+                if self.clear_cookies:
+                    await context.clear_cookies()
+            except Exception as e:
+                self.logger.debug(f"Discarding browser context that failed to reset: {e}")
+                await self._close_context(context)
+                self._refill()
+                return
+            self._idle.append(context)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def context(self, timeout: Optional[float] = None) -> AsyncIterator[BrowserContext]:
+        """Check out a context for the duration of an async with block."""
+        context = await self.acquire(timeout)
+        discard = False
+        try:
+            yield context
+        except BaseException:
+            discard = True
+            raise
+        finally:
+            await self.release(context, discard=discard)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get pool counters: checkouts, contexts created and recycled, idle and in use."""
+        return {
+            **self._stats,
+            "idle": len(self._idle),
+            "in_use": len(self._uses) - len(self._idle),
+        }
+
+    async def close(self) -> None:
+        """Close all contexts, and the browser if the pool launched it."""
+        self._closed = True
+        for task in list(self._refills):
+            task.cancel()
+        idle, self._idle = self._idle, []
+        for context in idle:
+            await self._close_context(context)
+        if self._owns_browser and self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self) -> "BrowserContextPool":
+        return await self.start()
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+    async def _new_context(self) -> BrowserContext:
+        """Open a context with the connection's current proxy settings."""
+        if self._browser is None:
+            raise RuntimeError("BrowserContextPool is not started; call start() first")
+        context = await self._browser.new_context(
+            **{"proxy": self.connection.as_playwright(), **self.context_options}
+        )
+        self._uses[context] = 0
+        self._stats["contexts_created"] += 1
+        return context
+
+    async def _close_context(self, context: BrowserContext) -> None:
+        """Close a context, ignoring errors from an already-closed browser."""
+        self._uses.pop(context, None)
+        try:
+            await context.close()
+        except Exception as e:
+            self.logger.debug(f"Error closing browser context: {e}")
+
+    def _refill(self) -> None:
+        """Open a replacement context in the background to keep the pool warm."""
+        if self._closed or len(self._idle) + len(self._refills) >= self.size:
+            return
+
+        async def refill() -> None:
+            try:
+                context = await self._new_context()
+            except Exception as e:
+                self.logger.warning(f"Failed to open a replacement browser context: {e}")
+                return
+            if self._closed:
+                await self._close_context(context)
+            else:
+                self._idle.append(context)
+
+        task = asyncio.ensure_future(refill())
+        self._refills.add(task)
+        task.add_done_callback(self._refills.discard)
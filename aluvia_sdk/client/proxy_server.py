@@ -3,22 +3,59 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import base64
+import binascii
+import contextlib
+import hmac
 import multiprocessing
 import os
+import re
+import secrets
+import selectors
+import socket
+import stat
 import sys
 import tempfile
 import threading
 import time
-from typing import Any, Dict, Optional
-
-from proxy.proxy import Proxy
+import uuid
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, cast
+
+from proxy.common.constants import DEFAULT_CONNECT_TIMEOUT
+from proxy.common.types import Descriptors, HostPort
+from proxy.common.utils import text_
+from proxy.core.acceptor import Acceptor, AcceptorPool
+from proxy.core.connection import TcpServerConnection
+from proxy.core.listener import ListenerPool, TcpSocketListener
+from proxy.core.work import ThreadlessPool
+from proxy.core.work.fd import RemoteFdExecutor
+from proxy.http.exception import (
+    HttpProtocolException,
+    HttpRequestRejected,
+    ProxyConnectionFailed,
+)
+from proxy.http.handler import HttpProtocolHandler
+from proxy.http.parser import HttpParser, httpParserStates, httpParserTypes
+from proxy.http.proxy import HttpProxyPlugin
+from proxy.http.url import Url
 from proxy.plugin import ProxyPoolPlugin
-from proxy.http.parser import HttpParser
+from proxy.proxy import Proxy
 
+from aluvia_sdk import codec
+from aluvia_sdk.client.admission import AdmissionControl
+from aluvia_sdk.client.block_detection import BlockDetector, parse_status_code
 from aluvia_sdk.client.config_manager import ConfigManager
+from aluvia_sdk.client.gateway_pool import GatewayEndpoint, GatewayPool
 from aluvia_sdk.client.logger import Logger
-from aluvia_sdk.client.rules import should_proxy
+from aluvia_sdk.client.resolver import (
+    Address,
+    DnsCache,
+    HappyEyeballs,
+    connect_in_order,
+    is_ip_address,
+)
+from aluvia_sdk.client.response_cache import CacheEntry, ResponseCache, parse_cache_control
+from aluvia_sdk.client.rules import BlockRules, CompiledRules, host_key, split_block_rules
 from aluvia_sdk.client.types import LogLevel
 from aluvia_sdk.errors import ProxyStartError
 
@@ -28,6 +65,20 @@ IS_WINDOWS = sys.platform.startswith("win")
 _manager: Any = None
 _shared_config: Any = None
 _logger: Optional[Logger] = None
+# Opt-in response cache, set in start() and inherited by the proxy worker processes
+_response_cache: Optional[ResponseCache] = None
+# Opt-in block detection for direct routes, set in start() like the response cache
+_block_detector: Optional[BlockDetector] = None
+# Opt-in DNS cache and connection racing for direct routes, set in start() as well
+_dns_cache: Optional[DnsCache] = None
+_happy_eyeballs: Optional[HappyEyeballs] = None
+# Opt-in gateway endpoint pool with failover; each worker keeps its own health state
+_gateway_pool: Optional[GatewayPool] = None
+# Opt-in admission limits; their counters are in shared memory, set up before workers fork
+_admission: Optional[AdmissionControl] = None
+# Open client connections of the running server, for drain(); also set up before the fork
+_open_connections: Optional[_ConnectionCounter] = None
+_client_connections: Optional[_ConnectionCounter] = None
 
 # Windows-only: use a JSON snapshot for rules so all spawned proxy.py workers
 # read the same config (spawn re-imports module, globals/Manager aren’t shared).
@@ -37,6 +88,53 @@ _rules_cache: list[Any] = []
 _rules_mtime: float = 0.0
 _last_check: float = 0.0
 
+# Bumped on every rules update so proxy workers only re-fetch and re-compile
+# the rules when they actually change.
+_rules_version: int = 0
+
+# Per-process compiled rules, keyed by the rules version they were built from
+_compiled_version: Any = None
+_compiled_rules: CompiledRules = CompiledRules([])
+_compiled_block_rules: BlockRules = BlockRules([])
+
+# Hostnames promoted to the gateway by block detection are stored as shared config
+# keys (one per host, so concurrent workers never overwrite each other's updates).
+# Windows has no shared config, so each worker only remembers its own promotions.
+_PROMOTED_KEY_PREFIX = "promoted:"
+_promoted_hosts: Set[str] = set()
+
+# Prefix of the shared config keys each proxy worker publishes its counters under
+_STATS_KEY_PREFIX = "stats:"
+_STATS_FLUSH_INTERVAL = 1.0
+
+# Sent to client connections over AdmissionControl.max_client_connections
+_CLIENT_LIMIT_RESPONSE = (
+    b"HTTP/1.1 503 Service Unavailable\r\nRetry-After: 1\r\n"
+    b"Content-Length: 0\r\nConnection: close\r\n\r\n"
+)
+
+# SharedProxyServer: each tenant (Aluvia connection) is stored under its own shared
+# config key next to a version key, so workers only read the version per request
+# and re-fetch a tenant's rules and gateway credentials when they change. Reserved
+# tenant ports map a listening port to a tenant id.
+_TENANT_KEY_PREFIX = "tenant:"
+_TENANT_VERSION_KEY_PREFIX = "tenant_version:"
+_TENANT_PORT_KEY_PREFIX = "tenant_port:"
+# Set in SharedProxyServer.start(); requests must then resolve to a tenant
+_multi_tenant = False
+
+# Sticky sessions: each inbound client can name its own gateway session, by the
+# username of its local proxy credentials or through a session port (stored
+# under its own shared config key, so it can be changed while running). The
+# gateway username is built from the format, e.g. "{username}-session-{session}".
+DEFAULT_SESSION_USERNAME_FORMAT = "{username}-session-{session}"
+_SESSION_PORT_KEY_PREFIX = "session_port:"
+_SESSION_ID_RE = re.compile(r"[A-Za-z0-9_]{1,64}")
+_session_username_format: Optional[str] = None
+# Per-process gateway endpoints, keyed by base endpoint and session id
+_session_endpoints: Dict[Tuple[bytes, str], Url] = {}
+_SESSION_ENDPOINTS_MAX = 4096
+
 
 def _ensure_shared_config() -> Any:
     """
@@ -59,8 +157,8 @@ def _write_rules_atomic(rules: Any) -> None:
     tmp_path = _RULES_PATH + ".tmp"
 
     # Write to temp file, flush+fsync, then atomic replace.
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f)
+    with open(tmp_path, "wb") as f:
+        f.write(codec.dumps(payload))
         f.flush()
         os.fsync(f.fileno())
 
@@ -85,8 +183,8 @@ def _load_rules_cached(ttl_seconds: float = 0.5) -> list[Any]:
     try:
         st = os.stat(_RULES_PATH)
         if st.st_mtime != _rules_mtime:
-            with open(_RULES_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(_RULES_PATH, "rb") as f:
+                data = codec.loads(f.read())
             _rules_cache = data.get("rules", []) or []
             _rules_mtime = st.st_mtime
     except FileNotFoundError:
@@ -109,12 +207,390 @@ def _get_rules() -> list[Any]:
 
 def _set_rules(rules: Any) -> None:
     """Set current rules using the appropriate mechanism per platform."""
+    global _rules_version
+
     if IS_WINDOWS:
         _write_rules_atomic(rules)
         return
 
+    _rules_version += 1
     shared_config = _ensure_shared_config()
     shared_config["rules"] = rules
+    shared_config["rules_version"] = _rules_version
+
+
+def _get_compiled_rules() -> Tuple[CompiledRules, BlockRules]:
+    """
+    Get the compiled routing and block rules for this process.
+
+    Only the rules version is read per request; the full rule list is fetched and
+    compiled again only when the version changes.
+    """
+    global _compiled_version, _compiled_rules, _compiled_block_rules
+
+    if IS_WINDOWS:
+        rules = _load_rules_cached(ttl_seconds=0.5)
+        version: Any = (_rules_mtime, id(rules))
+    else:
+        version = _ensure_shared_config().get("rules_version")
+        rules = None
+
+    if version is None or version != _compiled_version:
+        if rules is None:
+            rules = _get_rules()
+        _compiled_rules = CompiledRules(list(rules) + sorted(_get_promoted_hosts()))
+        _compiled_block_rules = BlockRules(split_block_rules(rules))
+        _compiled_version = version
+
+    return _compiled_rules, _compiled_block_rules
+
+
+def _get_promoted_hosts() -> Set[str]:
+    """Get the hostnames promoted to the gateway by block detection."""
+    if IS_WINDOWS:
+        return set(_promoted_hosts)
+    shared_config = _ensure_shared_config()
+    return {
+        str(key)[len(_PROMOTED_KEY_PREFIX) :]
+        for key in shared_config.keys()
+        if str(key).startswith(_PROMOTED_KEY_PREFIX)
+    }
+
+
+def _promote_host(hostname: str) -> bool:
+    """
+    Route a hostname through the gateway from now on, in every proxy worker.
+
+    The calling worker updates its compiled rules in place; the others pick the
+    change up through the rules version on their next request.
+
+    Returns:
+        True if the hostname was promoted, False if it was already proxied or is
+        excluded by a negative rule
+    """
+    global _compiled_version
+
+    rules, _ = _get_compiled_rules()
+    if rules.should_proxy(hostname) or rules.is_excluded(hostname):
+        return False
+
+    normalized_hostname = hostname.strip().lower()
+    rules.promote(normalized_hostname)
+
+    if IS_WINDOWS:
+        _promoted_hosts.add(normalized_hostname)
+        return True
+
+    version = f"{os.getpid()}:{time.monotonic_ns()}"
+    shared_config = _ensure_shared_config()
+    shared_config[f"{_PROMOTED_KEY_PREFIX}{normalized_hostname}"] = time.time()
+    shared_config["rules_version"] = version
+    _compiled_version = version
+    return True
+
+
+class _Tenant:
+    """A tenant as seen by one proxy worker: compiled rules and gateway endpoint."""
+
+    __slots__ = ("tenant_id", "version", "token", "rules", "block_rules", "endpoint")
+
+    def __init__(self, tenant_id: str, version: Any, data: Dict[str, Any]) -> None:
+        rules = list(data.get("rules") or [])
+        protocol, host, port, username, password = data["gateway"]
+        self.tenant_id = tenant_id
+        self.version = version
+        self.token: str = data.get("token") or ""
+        self.rules = CompiledRules(rules)
+        self.block_rules = BlockRules(split_block_rules(rules))
+        self.endpoint = Url(
+            scheme=protocol.encode(),
+            username=username.encode(),
+            password=password.encode(),
+            hostname=host.encode(),
+            port=int(port),
+        )
+
+
+# Per-process tenant cache, keyed by tenant id
+_tenants: Dict[str, _Tenant] = {}
+
+
+def _set_tenant(tenant_id: str, data: Dict[str, Any]) -> None:
+    """Publish a tenant's rules and gateway credentials to every proxy worker."""
+    global _rules_version
+
+    _rules_version += 1
+    shared_config = _ensure_shared_config()
+    shared_config[f"{_TENANT_KEY_PREFIX}{tenant_id}"] = data
+    shared_config[f"{_TENANT_VERSION_KEY_PREFIX}{tenant_id}"] = _rules_version
+
+
+def _remove_tenant(tenant_id: str) -> None:
+    """Remove a tenant; workers reject its requests from then on."""
+    shared_config = _ensure_shared_config()
+    shared_config.pop(f"{_TENANT_VERSION_KEY_PREFIX}{tenant_id}", None)
+    shared_config.pop(f"{_TENANT_KEY_PREFIX}{tenant_id}", None)
+
+
+def _get_tenant(tenant_id: str) -> Optional[_Tenant]:
+    """
+    Get a tenant's compiled configuration in this process.
+
+    Only the tenant's version is read per request; its rules are fetched and
+    compiled again only when the version changes.
+    """
+    shared_config = _ensure_shared_config()
+    version = shared_config.get(f"{_TENANT_VERSION_KEY_PREFIX}{tenant_id}")
+    if version is None:
+        _tenants.pop(tenant_id, None)
+        return None
+
+    tenant = _tenants.get(tenant_id)
+    if tenant is None or tenant.version != version:
+        data = shared_config.get(f"{_TENANT_KEY_PREFIX}{tenant_id}")
+        if data is None:
+            return None
+        tenant = _Tenant(tenant_id, version, data)
+        _tenants[tenant_id] = tenant
+    return tenant
+
+
+def _session_endpoint(endpoint: Url, session_id: str) -> Url:
+    """Gateway endpoint whose username selects the given sticky session."""
+    key = (endpoint.username or b"", session_id)
+    session_endpoint = _session_endpoints.get(key)
+    if session_endpoint is None:
+        assert _session_username_format is not None
+        username = _session_username_format.format(
+            username=(endpoint.username or b"").decode(), session=session_id
+        )
+        session_endpoint = Url(
+            scheme=endpoint.scheme,
+            username=username.encode(),
+            password=endpoint.password,
+            hostname=endpoint.hostname,
+            port=endpoint.port,
+        )
+        if len(_session_endpoints) >= _SESSION_ENDPOINTS_MAX:
+            _session_endpoints.clear()
+        _session_endpoints[key] = session_endpoint
+    return session_endpoint
+
+
+def _parse_proxy_authorization(value: bytes) -> Optional[Tuple[str, str]]:
+    """
+    Decode a Basic Proxy-Authorization header value.
+
+    Returns:
+        (username, password), or None if the value is not valid Basic credentials
+    """
+    scheme, _, encoded = value.strip().partition(b" ")
+    if scheme.lower() != b"basic":
+        return None
+    try:
+        decoded = base64.b64decode(encoded.strip(), validate=True).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError):
+        return None
+    username, sep, password = decoded.partition(":")
+    if not sep:
+        return None
+    return username, password
+
+
+def _remove_stale_unix_socket(path: str) -> None:
+    """
+    Remove a Unix socket left behind by a proxy that did not shut down cleanly.
+
+    Raises:
+        ProxyStartError: If the path is not a socket, or a server still listens on it
+    """
+    try:
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            raise ProxyStartError(f"{path} exists and is not a socket")
+    except FileNotFoundError:
+        return
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise ProxyStartError(f"{path} is in use by another server")
+
+
+class _ProxyStats:
+    """
+    Per-process proxy counters.
+
+    proxy.py handles connections in worker processes, so each worker keeps its own
+    counters and periodically publishes a snapshot to the shared config, where
+    ProxyServer.get_stats() sums them up. Not aggregated on Windows.
+    """
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._last_flush = 0.0
+
+    def incr(self, key: str, amount: int = 1) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+        self.flush(force=False)
+
+    def flush(self, force: bool = True) -> None:
+        """Publish this process's counters to the shared config."""
+        if IS_WINDOWS:
+            return
+
+        now = time.monotonic()
+        if not force and now - self._last_flush < _STATS_FLUSH_INTERVAL:
+            return
+        self._last_flush = now
+
+        with self._lock:
+            snapshot = dict(self._counters)
+        if not snapshot:
+            return
+
+        try:
+            _ensure_shared_config()[f"{_STATS_KEY_PREFIX}{os.getpid()}"] = snapshot
+        except Exception:
+            # Stats are best-effort; never fail a request because of them
+            pass
+
+
+_stats = _ProxyStats()
+
+
+class _ConnectionCounter:
+    """Open client connections across proxy workers, kept in shared memory."""
+
+    def __init__(self) -> None:
+        self._lock = multiprocessing.Lock()
+        self._value = multiprocessing.RawValue("i", 0)
+
+    def add(self, amount: int) -> None:
+        with self._lock:
+            self._value.value = max(0, self._value.value + amount)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value.value = 0
+
+    @property
+    def value(self) -> int:
+        return int(self._value.value)
+
+
+class _CountingProtocolHandler(HttpProtocolHandler):
+    """
+    HttpProtocolHandler that counts its client connection from accept to close.
+
+    Unlike the plugin's count, which starts with the first request, idle clients
+    count too, so AdmissionControl.max_client_connections bounds every open socket.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._client_counter = _client_connections
+        if self._client_counter is not None:
+            self._client_counter.add(1)
+
+    def shutdown(self) -> None:
+        try:
+            super().shutdown()
+        finally:
+            if self._client_counter is not None:
+                self._client_counter.add(-1)
+                self._client_counter = None
+
+
+class _ConnectedServerConnection(TcpServerConnection):
+    """Upstream connection over a socket that is already connected."""
+
+    def __init__(self, host: str, port: int, sock: socket.socket) -> None:
+        super().__init__(host, port)
+        self._sock = sock
+
+    def connect(
+        self, addr: Optional[HostPort] = None, source_address: Optional[HostPort] = None
+    ) -> None:
+        self._conn = self._sock
+        self.closed = False
+
+
+class _DirectConnectPlugin(HttpProxyPlugin):
+    """
+    proxy.py's HTTP proxy plugin, connecting direct routes through the DNS cache
+    and happy eyeballs.
+
+    proxy.py opens the upstream connection itself once the plugins let a request
+    go direct. This override resolves through the DnsCache and uses the socket
+    that won the happy-eyeballs race (or the first address to accept, in resolver
+    order), so every address is tried, as socket.create_connection() would.
+    Like proxy.py's own connect, it runs in the worker that handles the request.
+    """
+
+    def connect_upstream(self) -> None:
+        host, port = self.request.host, self.request.port
+        if (
+            (_dns_cache is None and _happy_eyeballs is None)
+            or self.flags.enable_conn_pool
+            or not host
+            or not port
+            or is_ip_address(text_(host))
+        ):
+            super().connect_upstream()
+            return
+
+        hostname = text_(host)
+        try:
+            sock = _connect_direct(hostname, port)
+        except OSError as e:  # socket.gaierror, timeouts, refused connections
+            raise ProxyConnectionFailed(hostname, port, repr(e)) from e
+        self.upstream = _ConnectedServerConnection(hostname, port, sock)
+        self.upstream.connect()
+        self.upstream.connection.setblocking(False)
+
+
+def _connect_direct(hostname: str, port: int) -> socket.socket:
+    """
+    Resolve a hostname and connect to one of its addresses.
+
+    Raises:
+        OSError: If the hostname does not resolve (possibly cached) or no address
+            accepted the connection
+    """
+    addresses: List[Address]
+    if _dns_cache is not None:
+        _stats.incr("dns_cache_hits" if _dns_cache.is_cached(hostname) else "dns_cache_misses")
+        addresses = _dns_cache.resolve(hostname, port)
+    else:
+        infos = socket.getaddrinfo(hostname, port, type=socket.SOCK_STREAM)
+        addresses = [(int(info[0]), str(info[4][0])) for info in infos]
+
+    if _happy_eyeballs is not None:
+        return _happy_eyeballs.connect(hostname, port, addresses)
+    return connect_in_order(addresses, port, DEFAULT_CONNECT_TIMEOUT)
+
+
+class _GatewayUnavailable(HttpProtocolException):
+    """Raised when no gateway pool endpoint accepted the connection."""
+
+
+class _LocalResponse(HttpProtocolException):
+    """Answers a request with a prebuilt response, then closes the client connection."""
+
+    def __init__(self, response: bytes) -> None:
+        super().__init__("Served by the local proxy")
+        self._response = response
+
+    def response(self, _request: HttpParser) -> Optional[memoryview]:
+        return memoryview(self._response)
 
 
 class AluviaProxyPlugin(ProxyPoolPlugin):
@@ -125,6 +601,31 @@ class AluviaProxyPlugin(ProxyPoolPlugin):
     Decides whether to route through Aluvia gateway or go direct based on hostname rules.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Gateway endpoint from --proxy-pool; self._endpoint may switch to a session's
+        self._gateway_endpoint = self._endpoint
+        # Pool endpoint of the open gateway connection, released when it closes
+        self._pool_endpoint: Optional[GatewayEndpoint] = None
+        # Admission slot held by this connection, and whether its connect is pending
+        self._admitted_host: Optional[str] = None
+        self._connecting = False
+        # Counted as open until the client connection closes
+        self._open_connections = _open_connections
+        if self._open_connections is not None:
+            self._open_connections.add(1)
+        # Response cache state for the first request on this connection; later
+        # keep-alive requests are forwarded to the gateway as raw bytes.
+        self._cache_url: Optional[str] = None
+        self._cache_request_headers: Dict[bytes, bytes] = {}
+        self._cache_stale_entry: Optional[CacheEntry] = None
+        self._cache_parser: Optional[HttpParser] = None
+        self._cache_held: Optional[bytearray] = None
+        self._cache_received = 0
+        # Block detection state for a direct plain-HTTP request
+        self._detect_hostname: Optional[str] = None
+        self._detect_buffer = bytearray()
+
     def before_upstream_connection(self, request: HttpParser) -> Optional[HttpParser]:
         """
         Called by proxy.py before establishing upstream connection.
@@ -132,9 +633,31 @@ class AluviaProxyPlugin(ProxyPoolPlugin):
         Returns:
             - request: Go direct (bypass upstream proxy)
             - None: Route through upstream proxy (calls parent which uses --proxy-pool)
+
+        Raises:
+            HttpRequestRejected: If the request matches a block rule, (in a
+                SharedProxyServer) does not identify a registered tenant, or names
+                an invalid sticky session
         """
         global _logger
 
+        tenant: Optional[_Tenant] = None
+        session_id: Optional[str] = None
+        if _session_username_format is not None and not _multi_tenant:
+            session_id = self._resolve_session(request)
+        if _multi_tenant:
+            tenant = self._resolve_tenant(request)
+            if tenant is None:
+                _stats.incr("unauthorized_requests")
+                raise HttpRequestRejected(
+                    status_code=407,
+                    reason=b"Proxy Authentication Required",
+                    headers={b"Proxy-Authenticate": b'Basic realm="aluvia"'},
+                )
+            # The tenant's credentials are for the local proxy only
+            request.del_header(b"proxy-authorization")
+
+        local_response: Optional[HttpProtocolException] = None
         try:
             # Extract hostname from request
             hostname = self._extract_hostname(request)
@@ -144,52 +667,686 @@ class AluviaProxyPlugin(ProxyPoolPlugin):
                     _logger.debug("Could not extract hostname, going direct")
                 return request  # Direct connection
 
-            rules = _get_rules()
-            if not rules:
+            if tenant is not None:
+                rules, block_rules = tenant.rules, tenant.block_rules
+            else:
+                rules, block_rules = _get_compiled_rules()
+
+            if block_rules and block_rules.is_blocked(hostname, self._extract_path(request)):
+                _stats.incr("blocked_requests")
+                if rules.should_proxy(hostname):
+                    _stats.incr("blocked_gateway_requests")
+                if _logger:
+                    _logger.debug(f"Hostname {hostname} - blocked by block rules")
+                # Answer blocked requests locally without opening any upstream connection
+                if request.method == b"CONNECT":
+                    local_response = HttpRequestRejected(status_code=403, reason=b"Forbidden")
+                else:
+                    local_response = HttpRequestRejected(status_code=204, reason=b"No Content")
+            elif not rules.rules or not rules.should_proxy(hostname):
+                # Check if we should proxy this hostname
                 if _logger:
-                    _logger.debug("No rules available, going direct")
-                return request
+                    reason = "no rules available" if not rules.rules else "bypassing"
+                    _logger.debug(f"Hostname {hostname} - {reason} (direct connection)")
+                local_response = self._admit(hostname)
+                if local_response is None:
+                    _stats.incr("direct_connections")
+                    self._start_block_detection(request, hostname)
+                    return request  # Direct connection
+            else:
+                cached = self._lookup_cache(request, hostname, tenant)
+                if cached is not None:
+                    if _logger:
+                        _logger.debug(f"Hostname {hostname} - served from response cache")
+                    local_response = _LocalResponse(cached)
+                elif (rejection := self._admit(hostname)) is not None:
+                    self._cache_url = None
+                    local_response = rejection
+                else:
+                    # Route through Aluvia gateway - let parent class handle it
+                    if _logger:
+                        _logger.debug(f"Hostname {hostname} - routing through Aluvia (via parent)")
+
+                    # Call parent class which will use --proxy-pool to connect to Aluvia,
+                    # or the tenant's own gateway credentials in a SharedProxyServer
+                    if tenant is not None:
+                        self._endpoint = tenant.endpoint
+                    elif session_id is not None:
+                        self._endpoint = _session_endpoint(self._gateway_endpoint, session_id)
+                        _stats.incr("session_connections")
+                    try:
+                        result = self._connect_gateway(request)
+                    except _GatewayUnavailable as e:
+                        # Answer 502 rather than silently sending the request direct
+                        _stats.incr("gateway_unavailable")
+                        if _logger:
+                            _logger.warning(f"Hostname {hostname} - {e}")
+                        self._cache_url = None
+                        local_response = HttpRequestRejected(status_code=502, reason=b"Bad Gateway")
+                    else:
+                        _stats.incr(
+                            "gateway_connections" if result is None else "direct_connections"
+                        )
+                        if result is not None:
+                            self._cache_url = None
+                        return result
+                    finally:
+                        self._end_connect()
 
-            # Check if we should proxy this hostname
-            use_proxy = should_proxy(hostname, rules)
+        except Exception as e:
+            if _logger:
+                _logger.error(f"Error in routing decision: {e}")
+            # On error, go direct
+            self._cache_url = None
+            return request
+
+        # Raised outside the try block so it is not mistaken for a routing error
+        assert local_response is not None
+        raise local_response
+
+    def handle_client_request(self, request: HttpParser) -> Optional[HttpParser]:
+        """Turn the request into a conditional one when revalidating a cached response."""
+        # Called once the upstream connection is open
+        self._end_connect()
+        entry = self._cache_stale_entry
+        if entry is not None:
+            if request.has_header(b"if-none-match") or request.has_header(b"if-modified-since"):
+                # The client validates on its own; pass its 304 through untouched
+                self._cache_stale_entry = None
+            else:
+                if entry.etag:
+                    request.add_header(b"If-None-Match", entry.etag)
+                if entry.last_modified:
+                    request.add_header(b"If-Modified-Since", entry.last_modified)
+        return super().handle_client_request(request)
+
+    def handle_upstream_data(self, raw: memoryview) -> None:
+        """Count bytes received from the Aluvia gateway and feed the response cache."""
+        _stats.incr("gateway_bytes", len(raw))
+        if self._cache_url is not None:
+            captured = self._capture_response(raw)
+            if captured is None:
+                return
+            raw = captured
+        super().handle_upstream_data(raw)
+
+    def handle_upstream_chunk(self, chunk: memoryview) -> Optional[memoryview]:
+        """Count bytes received on direct connections and look for blocks."""
+        if not self.upstream:
+            _stats.incr("direct_bytes", len(chunk))
+            if self._detect_hostname is not None:
+                self._inspect_direct_response(chunk)
+        return super().handle_upstream_chunk(chunk)
+
+    def on_upstream_connection_close(self) -> None:
+        """Store read-until-close responses, then close the gateway connection."""
+        parser = self._cache_parser
+        if (
+            self._cache_url is not None
+            and parser is not None
+            and parser.state == httpParserStates.RCVING_BODY
+            and not parser.has_header(b"content-length")
+            and not parser.is_chunked_encoded
+        ):
+            self._store_response(parser)
+        self._cache_url = None
+        if self._pool_endpoint is not None and _gateway_pool is not None:
+            _gateway_pool.end(self._pool_endpoint)
+            self._pool_endpoint = None
+        self._end_connect()
+        if self._admitted_host is not None and _admission is not None:
+            _admission.release(self._admitted_host)
+            self._admitted_host = None
+        if self._open_connections is not None:
+            self._open_connections.add(-1)
+            self._open_connections = None
+        super().on_upstream_connection_close()
+
+    async def get_descriptors(self) -> Descriptors:
+        """Stop reading from the gateway while the client is too far behind."""
+        readables, writables = await super().get_descriptors()
+        limit = _admission.max_tunnel_buffer if _admission is not None else None
+        if limit is not None and self.upstream is not None and not self.upstream.closed:
+            backlog = sum(len(chunk) for chunk in self.client.buffer)
+            if backlog > limit:
+                upstream_fd = self.upstream.connection.fileno()
+                readables = [fd for fd in readables if fd != upstream_fd]
+        return readables, writables
+
+    def _admit(self, hostname: str) -> Optional[HttpProtocolException]:
+        """
+        Take an admission slot for an upstream connection to the host.
+
+        Returns:
+            None if admitted (or admission control is off), else a 503 response
+        """
+        admission = _admission
+        if admission is None or self._admitted_host is not None:
+            return None
+        # Never wait for a slot: that would block this worker's event loop
+        if not admission.try_admit(hostname):
+            return self._reject("connection limit")
+        if not admission.try_begin_connect():
+            admission.release(hostname)
+            return self._reject("pending connect limit")
+        self._admitted_host = hostname
+        self._connecting = True
+        return None
+
+    def _reject(self, limit: str) -> HttpProtocolException:
+        """Count a request turned away by admission control and build its 503."""
+        _stats.incr("admission_rejected")
+        if _logger:
+            _logger.debug(f"Rejecting request: {limit} reached")
+        return HttpRequestRejected(
+            status_code=503, reason=b"Service Unavailable", headers={b"Retry-After": b"1"}
+        )
+
+    def _end_connect(self) -> None:
+        """Count this connection's upstream connect as no longer pending."""
+        if self._connecting and _admission is not None:
+            _admission.end_connect()
+        self._connecting = False
+
+    def _connect_gateway(self, request: HttpParser) -> Optional[HttpParser]:
+        """
+        Connect to the gateway through self._endpoint, or through the gateway pool.
+
+        With a pool, the endpoint's host and port are replaced by the pool's pick,
+        and a failed connect is recorded and retried on the next endpoint.
+
+        Raises:
+            _GatewayUnavailable: If every pool endpoint failed
+        """
+        pool = _gateway_pool
+        if pool is None:
+            return super().before_upstream_connection(request)
 
-            if not use_proxy:
+        pool.ensure_probing()
+        credentials = self._endpoint
+        tried: List[GatewayEndpoint] = []
+        error: Optional[Exception] = None
+        while True:
+            endpoint = pool.select(exclude=tried)
+            if endpoint is None:
+                break
+            tried.append(endpoint)
+            self._endpoint = Url(
+                scheme=credentials.scheme,
+                username=credentials.username,
+                password=credentials.password,
+                hostname=endpoint.host.encode(),
+                port=endpoint.port,
+            )
+            pool.begin(endpoint)
+            started = time.monotonic()
+            try:
+                result = super().before_upstream_connection(request)
+            except (HttpProtocolException, OSError) as e:
+                pool.end(endpoint)
+                pool.record_failure(endpoint)
+                _stats.incr("gateway_connect_failures")
                 if _logger:
-                    _logger.debug(f"Hostname {hostname} - bypassing (direct connection)")
-                return request  # Direct connection
+                    _logger.debug(f"Gateway endpoint {endpoint.address} failed: {e}")
+                self.upstream = None
+                error = e
+                continue
+            if result is not None:
+                pool.end(endpoint)
+                return result
+            pool.record_success(endpoint, time.monotonic() - started)
+            self._pool_endpoint = endpoint
+            if len(tried) > 1:
+                _stats.incr("gateway_failovers")
+            return None
+        raise _GatewayUnavailable(f"No gateway endpoint reachable: {error}")
+
+    def on_access_log(self, context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Publish counters when a client connection closes."""
+        _stats.flush()
+        return super().on_access_log(context)
+
+    def _start_block_detection(self, request: HttpParser, hostname: str) -> None:
+        """Inspect the response to a direct plain-HTTP request for blocks."""
+        if _block_detector is not None and request.method != b"CONNECT":
+            self._detect_hostname = hostname
+
+    def _inspect_direct_response(self, chunk: memoryview) -> None:
+        """Promote the hostname to the gateway if the direct response is a block."""
+        detector = _block_detector
+        hostname = self._detect_hostname
+        assert detector is not None and hostname is not None
+
+        self._detect_buffer += chunk
+        data = bytes(self._detect_buffer)
+        status = parse_status_code(data)
+        header_end = data.find(b"\r\n\r\n")
+
+        blocked = False
+        done = status is None or len(data) >= detector.max_body_bytes
+        if status is not None and detector.is_block_status(status):
+            blocked = done = True
+        elif header_end != -1:
+            blocked = detector.matches_body(data[header_end + 4 :])
+            done = done or blocked or not detector.body_signatures
+
+        if blocked:
+            _stats.incr("blocks_detected")
+            if _promote_host(hostname):
+                _stats.incr("hosts_promoted")
+                if _logger:
+                    _logger.info(f"Hostname {hostname} - block detected, routing through Aluvia")
+        if done:
+            self._detect_hostname = None
+            self._detect_buffer = bytearray()
+
+    def _lookup_cache(
+        self, request: HttpParser, hostname: str, tenant: Optional[_Tenant] = None
+    ) -> Optional[bytes]:
+        """
+        Look up a gateway-routed plain-HTTP GET in the response cache.
+
+        Args:
+            request: Parsed client request
+            hostname: Request hostname
+            tenant: Tenant of the request in a SharedProxyServer; tenants never
+                share cache entries, as their gateway sessions may differ
+
+        Returns:
+            A complete response to send to the client, or None to forward the
+            request (possibly revalidating a stale entry)
+        """
+        cache = _response_cache
+        if cache is None or request.method != b"GET" or not request.path:
+            return None
+
+        headers = {key: value for key, (_, value) in (request.headers or {}).items()}
+        request_cc = parse_cache_control(headers.get(b"cache-control"))
+        if "no-store" in request_cc or b"authorization" in headers:
+            return None
+
+        host = f"[{hostname}]" if ":" in hostname else hostname
+        url = f"http://{host}:{request.port or 80}{request.path.decode('latin-1')}"
+        if tenant is not None:
+            # Tenant ids contain no ":", so keys of different tenants never collide
+            url = f"tenant:{tenant.tenant_id}:{url}"
+        self._cache_url = url
+        self._cache_request_headers = headers
+
+        entry = cache.lookup(url, headers)
+        now = time.time()
+        if entry is not None and entry.is_fresh(now, request_cc):
+            self._cache_url = None
+            _stats.incr("cache_hits")
+            if entry.is_not_modified_for(headers):
+                return entry.to_response(now, not_modified=True)
+            _stats.incr("cache_bytes_saved", len(entry.body))
+            return entry.to_response(now)
+
+        _stats.incr("cache_misses")
+        if entry is not None and (entry.etag or entry.last_modified):
+            self._cache_stale_entry = entry
+        return None
 
-            # Route through Aluvia gateway - let parent class handle it
+    def _capture_response(self, raw: memoryview) -> Optional[memoryview]:
+        """
+        Parse the gateway response for the cache.
+
+        Returns:
+            Data to forward to the client, or None while a revalidation response is
+            held back until its status line is known
+        """
+        cache = _response_cache
+        assert cache is not None
+        try:
+            if self._cache_parser is None:
+                self._cache_parser = HttpParser(httpParserTypes.RESPONSE_PARSER)
+            parser = self._cache_parser
+            self._cache_received += len(raw)
+            parser.parse(memoryview(raw.tobytes()))
+        except Exception:
+            # Unparseable responses are passed through and not cached
+            return self._stop_capture(raw)
+
+        if self._cache_stale_entry is not None:
+            held = self._cache_held if self._cache_held is not None else bytearray()
+            held += raw
+            self._cache_held = held
+            if parser.state < httpParserStates.HEADERS_COMPLETE:
+                return None
+
+            entry = self._cache_stale_entry
+            self._cache_stale_entry = None
+            self._cache_held = None
+            if parser.code == b"304":
+                headers = [(k, v) for k, v in (parser.headers or {}).values()]
+                refreshed = cache.refresh(entry, headers)
+                _stats.incr("cache_revalidations")
+                _stats.incr("cache_bytes_saved", len(refreshed.body))
+                self._cache_url = None
+                return memoryview(refreshed.to_response(time.time(), close=False))
+            raw = memoryview(bytes(held))
+
+        if self._cache_received > cache.max_entry_bytes + 64 * 1024:
+            return self._stop_capture(raw)
+        if parser.is_complete:
+            self._store_response(parser)
+            return self._stop_capture(raw)
+        return raw
+
+    def _stop_capture(self, raw: memoryview) -> memoryview:
+        """Stop caching this connection's responses and release held data."""
+        if self._cache_held is not None:
+            raw = memoryview(bytes(self._cache_held))
+        self._cache_url = None
+        self._cache_parser = None
+        self._cache_held = None
+        self._cache_stale_entry = None
+        return raw
+
+    def _store_response(self, parser: HttpParser) -> None:
+        """Store a complete gateway response in the cache."""
+        cache = _response_cache
+        if cache is None or self._cache_url is None or not parser.code:
+            return
+        try:
+            entry = cache.store(
+                self._cache_url,
+                self._cache_request_headers,
+                status=int(parser.code),
+                reason=parser.reason or b"",
+                headers=[(k, v) for k, v in (parser.headers or {}).values()],
+                body=parser.body or b"",
+            )
+        except Exception as e:
             if _logger:
-                _logger.debug(f"Hostname {hostname} - routing through Aluvia (via parent)")
+                _logger.debug(f"Response cache store failed: {e}")
+            return
+        if entry is not None:
+            _stats.incr("cache_stores")
 
-            # Call parent class which will use --proxy-pool to connect to Aluvia
-            return super().before_upstream_connection(request)
+    def _resolve_tenant(self, request: HttpParser) -> Optional[_Tenant]:
+        """
+        Find the tenant a request belongs to.
 
+        Requests carrying Basic Proxy-Authorization credentials select the tenant by
+        username (the password must match the tenant's token); others by the local
+        port the client connected to, if it is reserved for a tenant.
+        """
+        try:
+            if request.has_header(b"proxy-authorization"):
+                credentials = _parse_proxy_authorization(request.header(b"proxy-authorization"))
+                if credentials is None:
+                    return None
+                tenant_id, token = credentials
+                tenant = _get_tenant(tenant_id)
+                if tenant is None or not hmac.compare_digest(tenant.token.encode(), token.encode()):
+                    return None
+                return tenant
+
+            local_port = self.client.connection.getsockname()[1]
+            port_tenant = _ensure_shared_config().get(f"{_TENANT_PORT_KEY_PREFIX}{local_port}")
+            return _get_tenant(port_tenant) if port_tenant is not None else None
         except Exception as e:
             if _logger:
-                _logger.error(f"Error in routing decision: {e}")
-            # On error, go direct
-            return request
+                _logger.debug(f"Could not resolve tenant: {e}")
+            return None
+
+    def _resolve_session(self, request: HttpParser) -> Optional[str]:
+        """
+        Find the sticky session an inbound client asked for, if any.
+
+        Clients sending local proxy credentials name the session by username (the
+        password is ignored); others get the session of the session port they
+        connected to, if it has one.
+
+        Raises:
+            HttpRequestRejected: If the credentials do not name a valid session id
+        """
+        if request.has_header(b"proxy-authorization"):
+            credentials = _parse_proxy_authorization(request.header(b"proxy-authorization"))
+            # The credentials are for the local proxy only
+            request.del_header(b"proxy-authorization")
+            if credentials is None or not _SESSION_ID_RE.fullmatch(credentials[0]):
+                _stats.incr("unauthorized_requests")
+                raise HttpRequestRejected(
+                    status_code=407,
+                    reason=b"Proxy Authentication Required",
+                    headers={b"Proxy-Authenticate": b'Basic realm="aluvia"'},
+                )
+            return credentials[0]
+
+        try:
+            local_address = self.client.connection.getsockname()
+        except OSError:
+            return None
+        if not isinstance(local_address, tuple):
+            return None  # Unix socket
+        session_id = _ensure_shared_config().get(f"{_SESSION_PORT_KEY_PREFIX}{local_address[1]}")
+        return cast(Optional[str], session_id)
 
     def _extract_hostname(self, request: HttpParser) -> str | None:
-        """Extract hostname from HTTP request or CONNECT tunnel."""
-        # Check if this is a CONNECT request (for HTTPS tunneling)
-        is_connect = request.method and request.method == b"CONNECT"
-
-        if is_connect and request.path:
-            # CONNECT request - path is "hostname:port" (e.g., "ipconfig.io:443")
-            path_str = request.path.decode() if isinstance(request.path, bytes) else request.path
-            if path_str:
-                # Strip port number if present
-                hostname = path_str.split(":")[0]
-                return hostname if hostname else None
-
-        elif request.host:
-            # Regular HTTP request - use Host header
-            hostname = request.host.decode() if isinstance(request.host, bytes) else request.host
-            return hostname if hostname else None
+        """
+        Extract the normalized hostname key from HTTP request or CONNECT tunnel.
 
-        return None
+        The key is lowercased without port or IPv6 brackets (see host_key()), so it
+        can be passed straight to the compiled rules and their decision cache.
+        """
+        # proxy.py parses the authority of CONNECT and absolute-form requests
+        authority = request.host
+        if not authority:
+            if request.method == b"CONNECT":
+                # CONNECT request - path is "hostname:port" (e.g., "ipconfig.io:443")
+                authority = request.path
+            else:
+                # Origin-form request - fall back to the Host header
+                authority = request.header(b"host") if request.has_header(b"host") else None
+        if not authority:
+            return None
+        return host_key(authority)
+
+    def _extract_path(self, request: HttpParser) -> str | None:
+        """Extract the request path for plain-HTTP requests (None for CONNECT)."""
+        if request.method == b"CONNECT" or not request.path:
+            return None
+        path = request.path
+        return path.decode("latin-1") if isinstance(path, bytes) else path
+
+
+class _InheritedListenerPool(ListenerPool):
+    """
+    ListenerPool set up on sockets another server was listening on.
+
+    The sockets take the places of the listeners proxy.py would bind, in order,
+    so they must come from a server started with the same listen arguments.
+    """
+
+    def __init__(self, flags: Any, sockets: List[socket.socket]) -> None:
+        super().__init__(flags=flags)
+        self.sockets = list(sockets)
+
+    def add(self, klass: Any, **kwargs: Any) -> None:
+        listener = klass(flags=self.flags, **kwargs)
+        listener._socket = self.sockets.pop(0)
+        if isinstance(listener, TcpSocketListener):
+            listener._port = listener._socket.getsockname()[1]
+        self.pool.append(listener)
+
+
+class _DrainingAcceptor(Acceptor):
+    """Acceptor that can stop accepting while it goes on serving its open connections."""
+
+    def __init__(self, *args: Any, draining: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.draining = draining
+
+    def accept(
+        self, events: List[Tuple[selectors.SelectorKey, int]]
+    ) -> List[Tuple[socket.socket, Optional[HostPort]]]:
+        works = []
+        for key, mask in events:
+            if mask & selectors.EVENT_READ:
+                try:
+                    conn, addr = self.socks[key.data].accept()
+                except OSError:
+                    # Nothing to accept, or the listener was shut down by a drain
+                    continue
+                if not self._admit_client():
+                    # Turned away here, before a worker spends any state on it
+                    with contextlib.suppress(OSError):
+                        conn.send(_CLIENT_LIMIT_RESPONSE)
+                    conn.close()
+                    continue
+                works.append((conn, addr or None))
+        return works
+
+    def _admit_client(self) -> bool:
+        """Check the new connection against AdmissionControl.max_client_connections."""
+        if _admission is None or _client_connections is None:
+            return True
+        return _admission.accepts_client(_client_connections.value)
+
+    def run_once(self) -> None:
+        if not self.draining.is_set():
+            super().run_once()
+            return
+        if self.socks and self.selector is not None:
+            # Close this process's copies only; ProxyServer decides about the sockets
+            for fileno, sock in self.socks.items():
+                self.selector.unregister(fileno)
+                sock.close()
+                with contextlib.suppress(OSError):
+                    os.close(fileno)
+            self.socks.clear()
+        self.running.wait(timeout=1.0)
+
+
+class _DrainingAcceptorPool(AcceptorPool):
+    """AcceptorPool whose acceptors stop accepting on drain()."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.draining = multiprocessing.Event()
+
+    def drain(self) -> None:
+        self.draining.set()
+
+    def _start(self) -> None:
+        for acceptor_id in range(self.flags.num_acceptors):
+            work_queue = multiprocessing.Pipe()
+            acceptor = _DrainingAcceptor(
+                idd=acceptor_id,
+                fd_queue=work_queue[1],
+                flags=self.flags,
+                lock=self.lock,
+                event_queue=self.event_queue,
+                executor_queues=self.executor_queues,
+                executor_pids=self.executor_pids,
+                executor_locks=self.executor_locks,
+                draining=self.draining,
+            )
+            acceptor.start()
+            self.acceptors.append(acceptor)
+            self.fd_queues.append(work_queue[0])
+
+
+class _ReusePortListener(TcpSocketListener):
+    """TCP listener bound with SO_REUSEPORT, so several sockets can share one port."""
+
+    def listen(self) -> socket.socket:
+        sock = socket.socket(
+            socket.AF_INET6 if self.hostname.version == 6 else socket.AF_INET,
+            socket.SOCK_STREAM,
+        )
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.bind((str(self.hostname), self.port))
+        sock.listen(self.flags.backlog)
+        sock.setblocking(False)
+        self._port = sock.getsockname()[1]
+        return sock
+
+
+class _ReusePortListenerPool(ListenerPool):
+    """ListenerPool binding its TCP listeners with SO_REUSEPORT."""
+
+    def add(self, klass: Any, **kwargs: Any) -> None:
+        super().add(_ReusePortListener if klass is TcpSocketListener else klass, **kwargs)
+
+
+class _AluviaProxy(Proxy):
+    """
+    A proxy.py instance that can drain and can take over listening sockets.
+
+    Proxy.setup() always binds new listeners and starts plain acceptors; this is
+    the part of it ProxyServer uses (no events, metrics or SSH tunnels), with
+    acceptors that can stop accepting (see drain()) and, given listen_sockets,
+    listeners on sockets handed over by another server.
+    """
+
+    listener_pool_class: Type[ListenerPool] = ListenerPool
+
+    def __init__(
+        self, input_args: List[str], listen_sockets: Optional[List[socket.socket]] = None
+    ) -> None:
+        super().__init__(input_args=input_args)
+        self.listen_sockets = listen_sockets
+
+    def setup(self) -> None:
+        if self.listen_sockets is not None:
+            self.listeners = _InheritedListenerPool(self.flags, self.listen_sockets)
+        else:
+            self.listeners = self.listener_pool_class(flags=self.flags)
+        self.listeners.setup()
+        # The --port listener is set up after any --ports listeners
+        tcp_listeners = [
+            listener for listener in self.listeners.pool if isinstance(listener, TcpSocketListener)
+        ]
+        if tcp_listeners:
+            self.flags.port = tcp_listeners[-1]._port
+        if self.remote_executors_enabled:
+            self.executors = ThreadlessPool(flags=self.flags, executor_klass=RemoteFdExecutor)
+            self.executors.setup()
+        self.acceptors = _DrainingAcceptorPool(
+            flags=self.flags,
+            listeners=self.listeners,
+            executor_queues=self.executors.work_queues if self.executors else [],
+            executor_pids=self.executors.work_pids if self.executors else [],
+            executor_locks=self.executors.work_locks if self.executors else [],
+        )
+        self.acceptors.setup()
+
+    def drain(self, handoff: bool = False) -> None:
+        """
+        Stop accepting connections and close the listening sockets.
+
+        Args:
+            handoff: Another server listens on the sockets now; leave them open
+        """
+        cast(_DrainingAcceptorPool, self.acceptors).drain()
+        if not self.listeners:
+            return
+        if handoff:
+            # proxy.py would unlink the Unix socket path
+            self.flags.unix_socket_path = None
+        else:
+            # Forked workers hold copies of the sockets; shutting a socket down
+            # refuses new connections in all of them
+            for listener in self.listeners.pool:
+                if listener._socket is not None:
+                    with contextlib.suppress(OSError):
+                        listener._socket.shutdown(socket.SHUT_RDWR)
+        self.listeners.shutdown()
+
+
+class _ShardProxy(_AluviaProxy):
+    """
+    A proxy.py instance accepting on its own SO_REUSEPORT sockets, so the kernel
+    spreads incoming connections over the shards' accept queues.
+    """
+
+    listener_pool_class = _ReusePortListenerPool
 
 
 class ProxyServer:
@@ -200,22 +1357,116 @@ class ProxyServer:
     Uses proxy.py library for full HTTP/HTTPS CONNECT support.
     """
 
-    def __init__(self, config_manager: ConfigManager, log_level: LogLevel = "info") -> None:
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        log_level: LogLevel = "info",
+        block_rules: Optional[List[str]] = None,
+        response_cache: Optional[ResponseCache] = None,
+        block_detector: Optional[BlockDetector] = None,
+        dns_cache: Optional[DnsCache] = None,
+        happy_eyeballs: Optional[HappyEyeballs] = None,
+        listen_shards: int = 1,
+        session_username_format: Optional[str] = None,
+        gateway_pool: Optional[GatewayPool] = None,
+        admission_control: Optional[AdmissionControl] = None,
+    ) -> None:
+        """
+        Initialize the proxy server.
+
+        Args:
+            config_manager: ConfigManager providing gateway credentials and rules
+            log_level: Logging level ('silent', 'info', or 'debug')
+            block_rules: Local block rules (see BlockRules); matching requests are
+                answered locally with an empty response
+            response_cache: Cache for plain-HTTP GET responses routed through the
+                gateway (disabled if None)
+            block_detector: Detects blocks on direct routes and promotes the
+                hostname to the gateway (disabled if None)
+            dns_cache: Caches DNS answers for direct routes (disabled if None)
+            happy_eyeballs: Races IPv6/IPv4 connection attempts for direct routes
+                (disabled if None)
+            listen_shards: Number of SO_REUSEPORT listening sockets (Linux only), each
+                accepted by its own worker process, so the kernel load-balances new
+                connections instead of all workers contending for one accept queue
+            session_username_format: Enables sticky sessions per inbound client (see
+                session_url() and set_port_session()): the gateway username for a
+                session, with {username} and {session} fields, e.g.
+                DEFAULT_SESSION_USERNAME_FORMAT. Disabled if None.
+            gateway_pool: Gateway endpoints to spread gateway connections over, with
+                health checks and failover (disabled if None)
+            admission_control: Limits on concurrent client and upstream connections,
+                answering connections and requests over them with 503 (disabled if None)
+
+        Raises:
+            ValueError: If listen_shards > 1 on a platform other than Linux
+        """
+        self._init_proxy(
+            log_level,
+            response_cache,
+            block_detector,
+            dns_cache,
+            happy_eyeballs,
+            listen_shards,
+            gateway_pool,
+            admission_control,
+        )
+        if session_username_format is not None:
+            session_username_format.format(username="user", session="s")  # Validate fields
+        self.session_username_format = session_username_format
         self.config_manager = config_manager
+        self._rules: List[str] = []
+        self._block_rules: List[str] = list(block_rules or [])
+
+        # Set callback to update shared config when ConfigManager updates
+        self.config_manager._shared_config_callback = self._update_shared_config
+
+    def _init_proxy(
+        self,
+        log_level: LogLevel,
+        response_cache: Optional[ResponseCache],
+        block_detector: Optional[BlockDetector],
+        dns_cache: Optional[DnsCache],
+        happy_eyeballs: Optional[HappyEyeballs],
+        listen_shards: int = 1,
+        gateway_pool: Optional[GatewayPool] = None,
+        admission_control: Optional[AdmissionControl] = None,
+    ) -> None:
+        """Initialize the state shared by ProxyServer and SharedProxyServer."""
+        if listen_shards > 1 and not sys.platform.startswith("linux"):
+            raise ValueError("listen_shards > 1 requires Linux (SO_REUSEPORT load balancing)")
         self.logger = Logger(log_level)
-        self._proxy: Optional[Proxy] = None
+        self.response_cache = response_cache
+        self.block_detector = block_detector
+        self.dns_cache = dns_cache
+        self.happy_eyeballs = happy_eyeballs
+        self.gateway_pool = gateway_pool
+        self.admission_control = admission_control
+        self._promotion_task: Optional[asyncio.Task[None]] = None
+        self._proxy: Optional[_AluviaProxy] = None
         self._proxy_thread: Optional[threading.Thread] = None
+        self.listen_shards = max(1, listen_shards)
+        # Shards after the first, each a proxy.py instance on the same port
+        self._shards: List[_AluviaProxy] = []
+        self._proxy_args: List[str] = []
+        self._ready = threading.Event()
+        self._unix_socket_path: Optional[str] = None
+        self.session_username_format = None
+        self._session_ports: List[int] = []
         self._bind_host = "127.0.0.1"
         self._actual_port: int = 0
         self._shutdown_event = threading.Event()
-
-        # Set callback to update shared config when ConfigManager updates
-        self.config_manager._shared_config_callback = self._update_shared_config
+        self._open_connections = _ConnectionCounter()
+        self._client_connections = _ConnectionCounter()
+        self._draining = False
+        # Arguments of the last start(), repeated for a successor in close()
+        self._start_kwargs: Dict[str, Any] = {}
 
     def _update_shared_config(self, key: str, value: Any) -> None:
         """Callback to update shared config dict when ConfigManager updates."""
         if key == "rules":
-            _set_rules(value)
+            self._rules = list(value or [])
+            self._publish_rules()
             self.logger.debug(f"Updated shared config: {key} = {value}")
             return
 
@@ -226,26 +1477,230 @@ class ProxyServer:
 
         self.logger.debug(f"Updated shared config: {key} = {value}")
 
-    async def start(self, port: Optional[int] = None) -> Dict[str, Any]:
+    def _publish_rules(self) -> None:
+        """Publish routing rules merged with local block rules ('!'-prefixed)."""
+        _set_rules(self._rules + [f"!{pattern}" for pattern in self._block_rules])
+
+    def set_block_rules(self, block_rules: List[str]) -> None:
+        """
+        Replace the local block rules.
+
+        Takes effect immediately for new requests; nothing is sent to the API.
+
+        Args:
+            block_rules: Block patterns (see BlockRules), with or without '!'
+        """
+        self._block_rules = [p.strip().lstrip("!") for p in block_rules if p and p.strip()]
+        self._publish_rules()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get traffic counters aggregated over all proxy worker processes.
+
+        Counters are published by workers at most once per second and whenever a
+        client connection closes.
+
+        Returns:
+            Dictionary of counters, including 'blocked_requests',
+            'estimated_gateway_bytes_saved' (blocked gateway-routed requests times
+            the average gateway bytes per connection), 'cache_hit_rate' and
+            'cache_bytes_saved'
+        """
+        totals: Dict[str, Any] = {
+            "gateway_connections": 0,
+            "gateway_bytes": 0,
+            "direct_connections": 0,
+            "direct_bytes": 0,
+            "blocked_requests": 0,
+            "blocked_gateway_requests": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "cache_revalidations": 0,
+            "cache_stores": 0,
+            "cache_bytes_saved": 0,
+            "blocks_detected": 0,
+            "hosts_promoted": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+            "unauthorized_requests": 0,
+            "session_connections": 0,
+            "gateway_connect_failures": 0,
+            "gateway_failovers": 0,
+            "gateway_unavailable": 0,
+            "admission_rejected": 0,
+        }
+        totals["open_connections"] = self._open_connections.value
+        totals["client_connections"] = self._client_connections.value
+        if not IS_WINDOWS and _shared_config is not None:
+            for key, counters in list(_shared_config.items()):
+                if not str(key).startswith(_STATS_KEY_PREFIX):
+                    continue
+                for name, value in counters.items():
+                    totals[name] = totals.get(name, 0) + value
+
+        avg_gateway_bytes = (
+            totals["gateway_bytes"] // totals["gateway_connections"]
+            if totals["gateway_connections"]
+            else 0
+        )
+        totals["estimated_gateway_bytes_saved"] = (
+            totals["blocked_gateway_requests"] * avg_gateway_bytes
+        )
+        if self.admission_control is not None:
+            totals.update(self.admission_control.get_stats())
+        cache_lookups = totals["cache_hits"] + totals["cache_misses"]
+        totals["cache_hit_rate"] = totals["cache_hits"] / cache_lookups if cache_lookups else 0.0
+        return totals
+
+    def _reset_stats(self) -> None:
+        """Drop counters and promotions published by previous proxy workers."""
+        if IS_WINDOWS:
+            return
+        shared_config = _ensure_shared_config()
+        for key in list(shared_config.keys()):
+            if str(key).startswith(
+                (_STATS_KEY_PREFIX, _PROMOTED_KEY_PREFIX, _SESSION_PORT_KEY_PREFIX)
+            ):
+                del shared_config[key]
+
+    def session_url(self, session_id: str) -> str:
+        """
+        Get a local proxy URL whose clients use their own sticky gateway session.
+
+        The session id travels as the username of the local proxy credentials, so
+        many HTTP clients can share one proxy and connection, each with its own
+        upstream IP. Browsers only send proxy credentials after a 407 challenge;
+        give them a session port instead (see set_port_session()).
+
+        Args:
+            session_id: Session id (letters, digits and underscores, at most 64)
+
+        Raises:
+            ValueError: If sticky sessions are disabled, the proxy is not listening
+                on TCP or the session id is invalid
+        """
+        if self.session_username_format is None:
+            raise ValueError("Sticky sessions require session_username_format")
+        if not _SESSION_ID_RE.fullmatch(session_id):
+            raise ValueError(f"Invalid session id: {session_id!r}")
+        if not self._actual_port:
+            raise ValueError("Proxy server is not listening on TCP")
+        return f"http://{session_id}:session@{self._bind_host}:{self._actual_port}"
+
+    def set_port_session(self, port: int, session_id: Optional[str]) -> None:
+        """
+        Set the sticky session of clients connecting to a session port.
+
+        Takes effect for new client connections; give each browser context its own
+        port to give it its own upstream IP.
+
+        Args:
+            port: One of the session_ports passed to start()
+            session_id: Session id, or None for the connection's own session
+
+        Raises:
+            ValueError: If the port is not a session port or the session id is invalid
+        """
+        if port not in self._session_ports:
+            raise ValueError(f"Port {port} is not a session port")
+        shared_config = _ensure_shared_config()
+        key = f"{_SESSION_PORT_KEY_PREFIX}{port}"
+        if session_id is None:
+            shared_config.pop(key, None)
+            return
+        if not _SESSION_ID_RE.fullmatch(session_id):
+            raise ValueError(f"Invalid session id: {session_id!r}")
+        shared_config[key] = session_id
+
+    def get_promoted_hosts(self) -> List[str]:
+        """
+        Get the hostnames promoted to the gateway by block detection.
+
+        Hostnames are removed from this list once they are saved to the
+        connection's rules on the server.
+        """
+        if IS_WINDOWS:
+            return []
+        return sorted(_get_promoted_hosts())
+
+    async def _persist_promotions_loop(self, interval: float = 0.5) -> None:
+        """Background task saving promoted hostnames to the connection's rules."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._persist_promotions()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Failed to save promoted hostnames: {e}")
+                await asyncio.sleep(5.0)
+
+    async def _persist_promotions(self) -> None:
+        """Add promoted hostnames to the server-side rules, then forget them."""
+        hosts = self.get_promoted_hosts()
+        config = self.config_manager.get_config()
+        if not hosts or not config:
+            return
+
+        new_hosts = [host for host in hosts if host not in config.rules]
+        if new_hosts:
+            await self.config_manager.set_config(rules=list(config.rules) + new_hosts)
+            self.logger.info(f"Saved promoted hostnames to connection rules: {new_hosts}")
+
+        shared_config = _ensure_shared_config()
+        for host in hosts:
+            shared_config.pop(f"{_PROMOTED_KEY_PREFIX}{host}", None)
+
+    async def start(
+        self,
+        port: Optional[int] = None,
+        unix_socket_path: Optional[str] = None,
+        tcp: bool = True,
+        session_ports: Optional[Dict[int, Optional[str]]] = None,
+        listen_sockets: Optional[List[socket.socket]] = None,
+    ) -> Dict[str, Any]:
         """
         Start the local proxy server.
 
         Args:
             port: Optional port to listen on. If not provided, OS assigns a free port.
+            unix_socket_path: Also listen on this Unix socket, for clients on the same
+                host (see adapters.to_httpx_transport()); not with listen_shards > 1
+            tcp: Listen on TCP as well as on unix_socket_path (default: True)
+            session_ports: Additional ports to listen on, mapped to the sticky session
+                of clients connecting to them (None for the connection's own session);
+                requires session_username_format. Not on Windows.
+            listen_sockets: Listen on these sockets instead of binding new ones (see
+                close()); the other arguments must be those of the server they come from
 
         Returns:
-            Dictionary with 'host', 'port', and 'url' keys
+            Dictionary with 'host', 'port', 'url' and 'unix_socket_path' keys; 'port'
+            is 0 and 'url' a unix: URL when listening on the Unix socket only
 
         Raises:
             ProxyStartError: If server fails to start
         """
-        global _logger
+        global _multi_tenant
 
         listen_port = port or 0
+        self._start_kwargs = {
+            "port": port,
+            "unix_socket_path": unix_socket_path,
+            "tcp": tcp,
+            "session_ports": session_ports,
+        }
 
         try:
+            if not tcp and not unix_socket_path:
+                raise ValueError("tcp=False requires a unix_socket_path")
+            if unix_socket_path and self.listen_shards > 1:
+                raise ValueError("A Unix socket listener cannot be combined with listen_shards")
+            if session_ports and (self.session_username_format is None or IS_WINDOWS):
+                raise ValueError("session_ports require session_username_format (not on Windows)")
+
             # Set shared config for plugin (accessible across all processes)
-            _logger = self.logger
+            self._set_plugin_globals()
+            _multi_tenant = False
 
             # Get initial config and populate shared dict
             config = self.config_manager.get_config()
@@ -255,7 +1710,9 @@ class ProxyServer:
                 )
 
             # Windows=file snapshot, non-Windows=Manager
-            _set_rules(config.rules)
+            self._rules = list(config.rules)
+            self._publish_rules()
+            self._reset_stats()
 
             # Register plugin
             module_name = f"{__name__}.AluviaProxyPlugin"
@@ -283,32 +1740,101 @@ class ProxyServer:
                 "--num-workers",
                 "0",  # Single process mode - required for config sharing
             ]
+            self._unix_socket_path = unix_socket_path
+            extra_ports: List[int] = []
+            if unix_socket_path:
+                if listen_sockets is None:
+                    _remove_stale_unix_socket(unix_socket_path)
+                # proxy.py skips the --port listener when given a Unix socket
+                args += ["--unix-socket-path", unix_socket_path]
+                if tcp:
+                    extra_ports.append(listen_port)
+            self._session_ports = [int(p) for p in session_ports or {}]
+            for session_port, session_id in (session_ports or {}).items():
+                self.set_port_session(session_port, session_id)
+            extra_ports += self._session_ports
+            if extra_ports:
+                args += ["--ports", *(str(p) for p in extra_ports)]
 
             # Log configuration status
             self.logger.info(f"Aluvia gateway: {protocol}://{username}:***@{host}:{port_num}")
             self.logger.info("Proxy routing: Rules-based (per-request hostname matching)")
 
-            self._proxy = Proxy(input_args=args)
-
-            # Start proxy in a separate thread (proxy.py is blocking)
-            self._proxy_thread = threading.Thread(target=self._run_proxy, daemon=True)
-            self._proxy_thread.start()
+            await self._launch(args, listen_sockets)
 
-            # Wait for proxy to actually start and get the port
-            await self._wait_for_startup()
+            if self.block_detector and self.block_detector.persist and not IS_WINDOWS:
+                self._promotion_task = asyncio.create_task(self._persist_promotions_loop())
 
             info = {
                 "host": self._bind_host,
                 "port": self._actual_port,
-                "url": f"http://{self._bind_host}:{self._actual_port}",
+                "url": (
+                    f"http://{self._bind_host}:{self._actual_port}"
+                    if self._actual_port
+                    else f"unix:{unix_socket_path}"
+                ),
+                "unix_socket_path": unix_socket_path,
+                "session_ports": list(self._session_ports),
             }
 
             self.logger.info(f"Proxy server listening on {info['url']}")
+            if unix_socket_path and self._actual_port:
+                self.logger.info(f"Proxy server listening on unix:{unix_socket_path}")
             return info
 
         except Exception as e:
             raise ProxyStartError(f"Failed to start proxy server: {e}")
 
+    def _set_plugin_globals(self) -> None:
+        """Hand the optional features to the plugin (inherited by proxy workers)."""
+        global _logger, _response_cache, _block_detector, _dns_cache, _happy_eyeballs
+        global _session_username_format, _gateway_pool, _admission, _open_connections
+        global _client_connections
+
+        _logger = self.logger
+        _session_username_format = self.session_username_format
+        _session_endpoints.clear()
+        _response_cache = self.response_cache
+        _block_detector = self.block_detector
+        _dns_cache = self.dns_cache
+        _happy_eyeballs = self.happy_eyeballs
+        _gateway_pool = self.gateway_pool
+        _admission = self.admission_control
+        if _admission is not None:
+            _admission.reset()
+        _open_connections = self._open_connections
+        _open_connections.reset()
+        _client_connections = self._client_connections
+        _client_connections.reset()
+        self._draining = False
+
+    async def _launch(
+        self, args: List[str], listen_sockets: Optional[List[socket.socket]] = None
+    ) -> None:
+        """Start proxy.py with the given arguments and wait until it listens."""
+        args = args + ["--work-klass", f"{__name__}._CountingProtocolHandler"]
+        if self.dns_cache is not None or self.happy_eyeballs is not None:
+            # Replace proxy.py's HTTP proxy plugin with one that connects direct
+            # routes through the DNS cache and happy eyeballs
+            plugins = args.index("--plugins") + 1
+            args[plugins] += f",{__name__}._DirectConnectPlugin"
+            args.append("--disable-http-proxy")
+        if self.listen_shards > 1:
+            if listen_sockets is not None:
+                raise ValueError("Listening sockets cannot be handed over to listen_shards")
+            # One acceptor per shard; each shard is a worker process with its own socket
+            self._proxy_args = args + ["--num-acceptors", "1"]
+            self._proxy = _ShardProxy(self._proxy_args)
+        else:
+            self._proxy = _AluviaProxy(args, listen_sockets)
+
+        # Start proxy in a separate thread (proxy.py is blocking)
+        self._proxy_thread = threading.Thread(target=self._run_proxy, daemon=True)
+        self._proxy_thread.start()
+
+        # Wait for proxy to actually start and get the port
+        await self._wait_for_startup()
+
     def _run_proxy(self) -> None:
         """Run the proxy (called in separate thread)."""
         try:
@@ -316,8 +1842,18 @@ class ProxyServer:
             self._proxy.setup()
 
             # Get the actual port (important when port was 0)
-            if hasattr(self._proxy.flags, "port"):
-                self._actual_port = self._proxy.flags.port
+            self._actual_port = self._main_port(self._proxy)
+
+            # Further shards bind the same port; they are forked from this process
+            # like the first one, so all of them read the same shared rules
+            shard_args = list(self._proxy_args)
+            if "--port" in shard_args:
+                shard_args[shard_args.index("--port") + 1] = str(self._actual_port)
+            for _ in range(1, self.listen_shards):
+                shard = _ShardProxy(shard_args)
+                shard.setup()
+                self._shards.append(shard)
+            self._ready.set()
 
             # Run the proxy's main loop
             # proxy.py's Proxy class doesn't have a run() method
@@ -328,13 +1864,26 @@ class ProxyServer:
         except Exception as e:
             self.logger.error(f"Proxy thread error: {e}")
 
+    def _main_port(self, proxy: Proxy) -> int:
+        """Port of the main TCP listener (0 when listening on a Unix socket only)."""
+        listeners = [
+            cast(TcpSocketListener, listener)
+            for listener in (proxy.listeners.pool if proxy.listeners else [])
+            if isinstance(listener, TcpSocketListener)
+        ]
+        if not listeners:
+            return 0
+        # proxy.py reports its first listener's port, but the --port listener is set up
+        # after the --ports ones; with a Unix socket the TCP port is the first --ports
+        listener = listeners[0] if self._unix_socket_path else listeners[-1]
+        return int(listener._port or 0)
+
     async def _wait_for_startup(self) -> None:
         """Wait for proxy to start and get the actual port."""
         max_attempts = 50
         for i in range(max_attempts):
             await asyncio.sleep(0.1)
-            if self._proxy and hasattr(self._proxy, "flags") and self._proxy.flags.port:
-                self._actual_port = self._proxy.flags.port
+            if self._ready.is_set():
                 return
 
         # Fallback: check if thread is running
@@ -345,8 +1894,115 @@ class ProxyServer:
 
         raise ProxyStartError("Proxy failed to start within timeout")
 
-    async def stop(self) -> None:
-        """Stop the local proxy server."""
+    async def drain(self, timeout: float = 30.0) -> int:
+        """
+        Stop accepting connections and wait for the open ones to finish.
+
+        The listening sockets are closed, so new connections are refused, while
+        the proxy goes on serving its open connections (tunnels and keep-alive
+        connections) until they close or the timeout passes. stop() then closes
+        whatever is left.
+
+        Args:
+            timeout: Seconds to wait for open connections
+
+        Returns:
+            Number of client connections still open
+        """
+        if self._proxy is None:
+            return 0
+        self._stop_accepting()
+
+        deadline = time.monotonic() + timeout
+        reported = -1
+        while True:
+            remaining = self._open_connections.value
+            if remaining == 0 or time.monotonic() >= deadline:
+                break
+            if remaining != reported:
+                self.logger.info(f"Draining: {remaining} connections still open")
+                reported = remaining
+            await asyncio.sleep(0.05)
+        return remaining
+
+    async def close(
+        self, successor: Optional[ProxyServer] = None, drain_timeout: float = 30.0
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Drain and stop the proxy, optionally handing its listening sockets over.
+
+        With a successor (e.g. a ProxyServer on a config manager with rotated
+        credentials), the successor is started on this server's listening sockets
+        before this one stops accepting, so clients keep their proxy address and
+        no connection is refused; this server's open connections finish on the
+        old credentials.
+
+        Args:
+            successor: Server of the same class to start on the listening sockets
+            drain_timeout: Seconds to wait for open connections before stopping
+
+        Returns:
+            The successor's start() info, or None without a successor
+
+        Raises:
+            ValueError: If the proxy is not running, uses listen_shards or the
+                successor is of another class
+            ProxyStartError: If the successor fails to start
+        """
+        info = None
+        if successor is not None:
+            if self._proxy is None or self._proxy.listeners is None:
+                raise ValueError("Proxy server is not running")
+            if self.listen_shards > 1 or type(successor) is not type(self):
+                raise ValueError(
+                    "Listening sockets can only be handed to a successor of the same "
+                    "class, without listen_shards"
+                )
+            sockets = [
+                listener._socket.dup()
+                for listener in self._proxy.listeners.pool
+                if listener._socket is not None
+            ]
+            try:
+                info = await successor.start(**self._start_kwargs, listen_sockets=sockets)
+            except Exception:
+                for sock in sockets:
+                    sock.close()
+                raise
+            self._stop_accepting(handoff=True)
+        await self.stop(drain_timeout=drain_timeout)
+        return info
+
+    def _stop_accepting(self, handoff: bool = False) -> None:
+        """Put the proxy.py instances in drain mode (once)."""
+        if self._proxy is None or self._draining:
+            return
+        self._draining = True
+        for proxy in (self._proxy, *self._shards):
+            proxy.drain(handoff=handoff)
+        self.logger.info("Proxy server draining: no longer accepting connections")
+
+    async def stop(self, drain_timeout: Optional[float] = None) -> None:
+        """
+        Stop the local proxy server.
+
+        Args:
+            drain_timeout: Stop accepting and wait up to this many seconds for open
+                connections first (see drain()); None closes them at once
+        """
+        if drain_timeout is not None and self._proxy is not None:
+            remaining = await self.drain(drain_timeout)
+            if remaining:
+                self.logger.warning(f"Closing {remaining} connections still open after drain")
+
+        if self._promotion_task is not None:
+            self._promotion_task.cancel()
+            try:
+                await self._promotion_task
+            except asyncio.CancelledError:
+                pass
+            self._promotion_task = None
+
         if self._proxy:
             try:
                 # Signal the thread to stop
@@ -357,9 +2013,295 @@ class ProxyServer:
                     self._proxy_thread.join(timeout=2.0)
 
                 self._proxy.shutdown()
+                for shard in self._shards:
+                    shard.shutdown()
             except Exception as e:
                 self.logger.debug(f"Error during proxy shutdown: {e}")
+            self._shards = []
             self._proxy = None
             self._proxy_thread = None
+            self._draining = False
+            self._ready.clear()
             self._shutdown_event.clear()
             self.logger.info("Proxy server stopped")
+
+
+class SharedProxyServer(ProxyServer):
+    """
+    One local proxy serving many Aluvia connections (tenants).
+
+    Instead of a listener, proxy thread and rules store per connection, every
+    registered connection shares this server. Each request is matched to its
+    tenant by the Proxy-Authorization username (http://<tenant>:<token>@host:port)
+    or by the local port it arrives on, and is routed with that tenant's rules
+    and gateway credentials. Cost grows with traffic, not with the number of
+    registered connections.
+
+    A process runs either one ProxyServer or one SharedProxyServer. The response
+    and DNS caches are shared by all tenants; block detection is not available.
+    Not supported on Windows.
+
+    Example:
+        >>> shared = SharedProxyServer()
+        >>> await shared.start()
+        >>> client = AluviaClient(api_key="your-api-key", shared_proxy=shared)
+        >>> connection = await client.start()  # Registers the connection as a tenant
+        >>> await connection.close()  # Deregisters it
+        >>> await shared.stop()
+    """
+
+    def __init__(
+        self,
+        log_level: LogLevel = "info",
+        response_cache: Optional[ResponseCache] = None,
+        dns_cache: Optional[DnsCache] = None,
+        happy_eyeballs: Optional[HappyEyeballs] = None,
+        listen_shards: int = 1,
+        gateway_pool: Optional[GatewayPool] = None,
+        admission_control: Optional[AdmissionControl] = None,
+    ) -> None:
+        """
+        Initialize the shared proxy server.
+
+        Args:
+            log_level: Logging level ('silent', 'info', or 'debug')
+            response_cache: Cache for plain-HTTP GET responses routed through the
+                gateway; each tenant has its own entries (disabled if None)
+            dns_cache: Caches DNS answers for direct routes (disabled if None)
+            happy_eyeballs: Races IPv6/IPv4 connection attempts for direct routes
+                (disabled if None)
+            listen_shards: Number of SO_REUSEPORT listening sockets (see ProxyServer)
+            gateway_pool: Gateway endpoints for all tenants, with health checks and
+                failover (disabled if None)
+            admission_control: Limits on concurrent client and upstream connections
+                across all tenants (disabled if None)
+        """
+        self._init_proxy(
+            log_level,
+            response_cache,
+            None,
+            dns_cache,
+            happy_eyeballs,
+            listen_shards,
+            gateway_pool,
+            admission_control,
+        )
+        self._tenant_ports: List[int] = []
+        # tenant id -> registration (config manager, token, port, block rules)
+        self._registrations: Dict[str, Dict[str, Any]] = {}
+
+    async def start(
+        self,
+        port: Optional[int] = None,
+        unix_socket_path: Optional[str] = None,
+        tcp: bool = True,
+        session_ports: Optional[Dict[int, Optional[str]]] = None,
+        listen_sockets: Optional[List[socket.socket]] = None,
+        tenant_ports: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Start the shared proxy server.
+
+        Args:
+            port: Optional port to listen on. If not provided, OS assigns a free port.
+            unix_socket_path: Not supported by the shared proxy (must be None)
+            tcp: Not supported by the shared proxy (must be True)
+            session_ports: Not supported by the shared proxy (use tenant_ports)
+            listen_sockets: Listen on these sockets instead of binding new ones (see
+                close()); the other arguments must be those of the server they come from
+            tenant_ports: Additional ports to listen on, each of which can be reserved
+                for one tenant (see register()) by clients that cannot send proxy
+                credentials
+
+        Returns:
+            Dictionary with 'host', 'port', and 'url' keys
+
+        Raises:
+            ValueError: If unix_socket_path, tcp=False or session_ports is given
+            ProxyStartError: If server fails to start
+        """
+        global _multi_tenant
+
+        if unix_socket_path is not None or not tcp:
+            raise ValueError("SharedProxyServer listens on TCP only")
+        if session_ports:
+            raise ValueError("SharedProxyServer does not support session_ports (use tenant_ports)")
+        if IS_WINDOWS:
+            raise ProxyStartError("SharedProxyServer is not supported on Windows")
+
+        try:
+            self._start_kwargs = {"port": port, "tenant_ports": tenant_ports}
+            self._set_plugin_globals()
+            _multi_tenant = True
+            self._reset_stats()
+            for registration_id, registration in self._registrations.items():
+                self._publish_tenant(registration_id, registration)
+
+            self._tenant_ports = [int(p) for p in tenant_ports or []]
+            args = [
+                "--hostname",
+                self._bind_host,
+                "--port",
+                str(port or 0),
+                "--plugins",
+                f"{__name__}.AluviaProxyPlugin",
+                # Placeholder only: the plugin routes each request with its tenant's
+                # own gateway credentials
+                "--proxy-pool",
+                "http://127.0.0.1:9",
+                "--num-workers",
+                "0",
+            ]
+            if self._tenant_ports:
+                args += ["--ports", *(str(p) for p in self._tenant_ports)]
+
+            self.logger.info("Proxy routing: Shared (per-tenant rules and gateway credentials)")
+            await self._launch(args, listen_sockets)
+
+            info = {
+                "host": self._bind_host,
+                "port": self._actual_port,
+                "url": f"http://{self._bind_host}:{self._actual_port}",
+            }
+            self.logger.info(f"Shared proxy server listening on {info['url']}")
+            return info
+
+        except Exception as e:
+            raise ProxyStartError(f"Failed to start proxy server: {e}")
+
+    def register(
+        self,
+        config_manager: ConfigManager,
+        tenant_id: Optional[str] = None,
+        port: Optional[int] = None,
+        block_rules: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Serve an Aluvia connection through this proxy.
+
+        The tenant follows the connection's rules and gateway credentials as the
+        ConfigManager picks up changes.
+
+        Args:
+            config_manager: Initialized ConfigManager of the connection
+            tenant_id: Tenant id, used as the proxy username (default: random)
+            port: One of the tenant ports passed to start(), reserved for this
+                tenant; its URL then carries no credentials
+            block_rules: Local block rules for this tenant (see BlockRules)
+
+        Returns:
+            Dictionary with 'tenant_id', 'host', 'port', 'url' (including
+            credentials unless a port is reserved), 'username' and 'password' keys
+
+        Raises:
+            ProxyStartError: If the server is not running or the connection has no
+                configuration yet
+            ValueError: If the tenant id or port is already taken, or the port is
+                not a tenant port
+        """
+        if self._proxy is None:
+            raise ProxyStartError("SharedProxyServer is not running; call start() first")
+        if config_manager.get_config() is None:
+            raise ProxyStartError(
+                "No configuration available - cannot register a tenant without Aluvia gateway credentials"
+            )
+
+        tenant_id = tenant_id or uuid.uuid4().hex[:16]
+        if not tenant_id or ":" in tenant_id:
+            raise ValueError(f"Invalid tenant id '{tenant_id}'")
+        if tenant_id in self._registrations:
+            raise ValueError(f"Tenant '{tenant_id}' is already registered")
+        if port is not None:
+            if port not in self._tenant_ports:
+                raise ValueError(f"Port {port} is not one of this server's tenant ports")
+            if any(r["port"] == port for r in self._registrations.values()):
+                raise ValueError(f"Port {port} is already reserved for another tenant")
+
+        registration: Dict[str, Any] = {
+            "config_manager": config_manager,
+            "token": secrets.token_urlsafe(16),
+            "port": port,
+            "block_rules": [p.strip().lstrip("!") for p in block_rules or [] if p and p.strip()],
+        }
+        self._registrations[tenant_id] = registration
+        self._publish_tenant(tenant_id, registration)
+        if port is not None:
+            _ensure_shared_config()[f"{_TENANT_PORT_KEY_PREFIX}{port}"] = tenant_id
+
+        def on_update(key: str, value: Any) -> None:
+            # Any update may change the gateway credentials or session, not just rules
+            if tenant_id in self._registrations:
+                self._publish_tenant(tenant_id, self._registrations[tenant_id])
+
+        config_manager._shared_config_callback = on_update
+
+        host = self._bind_host
+        if port is not None:
+            url = f"http://{host}:{port}"
+            username = password = None
+        else:
+            port = self._actual_port
+            username, password = tenant_id, registration["token"]
+            url = f"http://{username}:{password}@{host}:{port}"
+
+        self.logger.debug(f"Registered tenant {tenant_id}")
+        return {
+            "tenant_id": tenant_id,
+            "host": host,
+            "port": port,
+            "url": url,
+            "username": username,
+            "password": password,
+        }
+
+    def deregister(self, tenant_id: str) -> None:
+        """
+        Stop serving a tenant; its requests are rejected from then on.
+
+        Args:
+            tenant_id: Tenant id returned by register()
+        """
+        registration = self._registrations.pop(tenant_id, None)
+        if registration is None:
+            return
+        registration["config_manager"]._shared_config_callback = None
+        _remove_tenant(tenant_id)
+        if registration["port"] is not None:
+            _ensure_shared_config().pop(f"{_TENANT_PORT_KEY_PREFIX}{registration['port']}", None)
+        self.logger.debug(f"Deregistered tenant {tenant_id}")
+
+    def set_tenant_block_rules(self, tenant_id: str, block_rules: List[str]) -> None:
+        """
+        Replace a tenant's local block rules.
+
+        Args:
+            tenant_id: Tenant id returned by register()
+            block_rules: Block patterns (see BlockRules), with or without '!'
+
+        Raises:
+            KeyError: If the tenant is not registered
+        """
+        registration = self._registrations[tenant_id]
+        registration["block_rules"] = [
+            p.strip().lstrip("!") for p in block_rules if p and p.strip()
+        ]
+        self._publish_tenant(tenant_id, registration)
+
+    def get_tenants(self) -> List[str]:
+        """Get the ids of the registered tenants."""
+        return list(self._registrations)
+
+    def _publish_tenant(self, tenant_id: str, registration: Dict[str, Any]) -> None:
+        """Publish a tenant's current rules and gateway credentials."""
+        config = registration["config_manager"].get_config()
+        if config is None:
+            return
+        raw = config.raw_proxy
+        _set_tenant(
+            tenant_id,
+            {
+                "rules": list(config.rules) + [f"!{p}" for p in registration["block_rules"]],
+                "gateway": (raw.protocol, raw.host, raw.port, raw.username, raw.password),
+                "token": registration["token"],
+            },
+        )
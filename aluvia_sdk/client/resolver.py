@@ -0,0 +1,426 @@
+"""DNS caching and happy-eyeballs connection racing for direct connections."""
+
+from __future__ import annotations
+
+import errno
+import ipaddress
+import os
+import selectors
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+# (family, ip) pairs as returned by the resolver
+Address = Tuple[int, str]
+
+
+class DnsCacheEntry:
+    """Resolved addresses of one hostname."""
+
+    __slots__ = ("addresses", "ttl", "expires_at", "error")
+
+    def __init__(self, addresses: List[Address], ttl: float, error: Optional[str] = None) -> None:
+        self.addresses = addresses
+        self.ttl = ttl
+        self.expires_at = time.monotonic() + ttl
+        self.error = error
+
+
+def _resolve_with_dnspython(hostname: str) -> Optional[Tuple[List[Address], float]]:
+    """Resolve A and AAAA records with their TTL, if dnspython is installed."""
+    try:
+        import dns.resolver
+    except ImportError:
+        return None
+
+    addresses: List[Address] = []
+    ttls: List[float] = []
+    for record_type, family in (("AAAA", socket.AF_INET6), ("A", socket.AF_INET)):
+        try:
+            answer = dns.resolver.resolve(hostname, record_type)
+        except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
+            continue
+        except Exception:
+            return None  # Let getaddrinfo decide (e.g. /etc/hosts entries)
+        addresses.extend((family, record.to_text()) for record in answer)
+        if answer.rrset is not None:
+            ttls.append(float(answer.rrset.ttl))
+
+    if not addresses:
+        return None
+    return addresses, min(ttls) if ttls else 0.0
+
+
+class DnsCache:
+    """
+    In-process DNS cache for direct connections made by the local proxy.
+
+    Positive answers are cached for the record TTL when dnspython is installed
+    (clamped to [min_ttl, max_ttl]) and for default_ttl otherwise, since
+    getaddrinfo() does not expose TTLs. Failed lookups are cached for negative_ttl.
+    Entries close to expiry are refreshed in a background thread while the cached
+    answer keeps being served, so requests rarely wait on a resolver.
+
+    Example:
+        >>> client = AluviaClient(api_key="...", dns_cache=DnsCache(default_ttl=120))
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = 60.0,
+        min_ttl: float = 5.0,
+        max_ttl: float = 3600.0,
+        negative_ttl: float = 5.0,
+        refresh_ahead: float = 0.2,
+        max_entries: int = 10000,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            default_ttl: TTL in seconds when the record TTL is unknown
+            min_ttl: Lower bound applied to record TTLs
+            max_ttl: Upper bound applied to record TTLs
+            negative_ttl: How long failed lookups are cached
+            refresh_ahead: Fraction of the TTL before expiry at which a background
+                refresh starts
+            max_entries: Maximum number of cached hostnames
+        """
+        self.default_ttl = default_ttl
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.negative_ttl = negative_ttl
+        self.refresh_ahead = refresh_ahead
+        self.max_entries = max_entries
+
+        self._entries: Dict[str, DnsCacheEntry] = {}
+        self._refreshing: Set[str] = set()
+        self._lock = threading.Lock()
+        # Created lazily so that forked proxy workers start their own threads
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def resolve(self, hostname: str, port: int) -> List[Address]:
+        """
+        Resolve a hostname, using the cache when possible.
+
+        Args:
+            hostname: Hostname to resolve
+            port: Destination port (passed to getaddrinfo)
+
+        Returns:
+            Addresses in resolver order
+
+        Raises:
+            socket.gaierror: If the lookup failed (possibly a cached failure)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(hostname)
+
+        if entry is not None and now < entry.expires_at:
+            if entry.error is not None:
+                raise socket.gaierror(socket.EAI_NONAME, entry.error)
+            if entry.expires_at - now < entry.ttl * self.refresh_ahead:
+                self._refresh_in_background(hostname, port)
+            return entry.addresses
+
+        entry = self._lookup(hostname, port)
+        if entry.error is not None:
+            raise socket.gaierror(socket.EAI_NONAME, entry.error)
+        return entry.addresses
+
+    def is_cached(self, hostname: str) -> bool:
+        """Check whether a hostname has an unexpired entry."""
+        with self._lock:
+            entry = self._entries.get(hostname)
+        return entry is not None and time.monotonic() < entry.expires_at
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, hostname: str, port: int, keep_on_error: bool = False) -> DnsCacheEntry:
+        """
+        Resolve a hostname and store the result.
+
+        Args:
+            hostname: Hostname to resolve
+            port: Destination port
+            keep_on_error: Keep an existing positive entry if the lookup fails
+
+        Returns:
+            The new entry
+        """
+        try:
+            result = _resolve_with_dnspython(hostname)
+            if result is not None:
+                addresses, ttl = result
+                # getaddrinfo() orders by RFC 6724; dnspython answers need it done here
+                addresses = sort_addresses(addresses)
+                ttl = min(max(ttl, self.min_ttl), self.max_ttl)
+            else:
+                infos = socket.getaddrinfo(hostname, port, type=socket.SOCK_STREAM)
+                addresses = []
+                for family, _, _, _, sockaddr in infos:
+                    address = (int(family), str(sockaddr[0]))
+                    if address not in addresses:
+                        addresses.append(address)
+                ttl = self.default_ttl
+            entry = DnsCacheEntry(addresses, ttl)
+        except socket.gaierror as e:
+            entry = DnsCacheEntry([], self.negative_ttl, error=e.strerror or str(e))
+
+        with self._lock:
+            if entry.error is not None and keep_on_error and hostname in self._entries:
+                return entry
+            if len(self._entries) >= self.max_entries and hostname not in self._entries:
+                # Evict expired entries first, then the oldest insertion
+                now = time.monotonic()
+                for key in [k for k, v in self._entries.items() if v.expires_at <= now]:
+                    del self._entries[key]
+                if len(self._entries) >= self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[hostname] = entry
+        return entry
+
+    def _refresh_in_background(self, hostname: str, port: int) -> None:
+        """Start a background lookup unless one is already running."""
+        with self._lock:
+            if hostname in self._refreshing:
+                return
+            self._refreshing.add(hostname)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="aluvia-dns")
+            executor = self._executor
+
+        def refresh() -> None:
+            try:
+                # A failed refresh keeps serving the last good answer until it expires
+                self._lookup(hostname, port, keep_on_error=True)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(hostname)
+
+        executor.submit(refresh)
+
+
+class HappyEyeballs:
+    """
+    RFC 8305 connection racing for direct connections made by the local proxy.
+
+    Addresses are interleaved by family (IPv6 first) and connection attempts are
+    started attempt_delay apart; the first address to complete a TCP handshake wins.
+    Its socket becomes the upstream connection and the other attempts are closed,
+    so racing costs no extra connection. The winner is remembered for the hostname
+    for remember_ttl seconds and tried first next time, with the other addresses
+    still racing behind it if it stops answering.
+
+    Example:
+        >>> client = AluviaClient(api_key="...", happy_eyeballs=HappyEyeballs())
+    """
+
+    def __init__(
+        self,
+        attempt_delay: float = 0.25,
+        connect_timeout: float = 10.0,
+        remember_ttl: float = 300.0,
+    ) -> None:
+        """
+        Initialize connection racing.
+
+        Args:
+            attempt_delay: Delay between starting connection attempts (RFC 8305: 250ms)
+            connect_timeout: Overall time limit for connecting
+            remember_ttl: How long the winning address is tried first for a hostname
+        """
+        self.attempt_delay = attempt_delay
+        self.connect_timeout = connect_timeout
+        self.remember_ttl = remember_ttl
+        self._winners: Dict[Tuple[str, int], Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def connect(self, hostname: str, port: int, addresses: List[Address]) -> socket.socket:
+        """
+        Open a TCP connection to whichever address answers first.
+
+        Args:
+            hostname: Destination hostname
+            port: Destination port
+            addresses: Candidate addresses from the resolver
+
+        Returns:
+            The connected (non-blocking) socket
+
+        Raises:
+            OSError: If no address could be connected to in time
+        """
+        ordered = interleave_addresses(addresses)
+        key = (hostname, port)
+        now = time.monotonic()
+        with self._lock:
+            winner = self._winners.get(key)
+        if winner is not None and now < winner[1]:
+            remembered = winner[0]
+            ordered.sort(key=lambda address: address[1] != remembered)
+
+        sock, ip = self.race(port, ordered)
+        with self._lock:
+            if len(self._winners) > 10000:
+                self._winners.clear()
+            self._winners[key] = (ip, now + self.remember_ttl)
+        return sock
+
+    def race(self, port: int, addresses: List[Address]) -> Tuple[socket.socket, str]:
+        """
+        Race TCP connection attempts in the given order.
+
+        Args:
+            port: Destination port
+            addresses: Candidate addresses, in the order attempts start
+
+        Returns:
+            The first connected socket and its IP address
+
+        Raises:
+            OSError: If every attempt failed or the time limit passed
+        """
+        deadline = time.monotonic() + self.connect_timeout
+        selector = selectors.DefaultSelector()
+        pending: Dict[int, Tuple[socket.socket, str]] = {}
+        next_index = 0
+        next_attempt_at = time.monotonic()
+        error: OSError = OSError(errno.EHOSTUNREACH, "No addresses to connect to")
+
+        try:
+            while time.monotonic() < deadline:
+                now = time.monotonic()
+                if next_index < len(addresses) and (now >= next_attempt_at or not pending):
+                    family, ip = addresses[next_index]
+                    next_index += 1
+                    try:
+                        sock = self._start_attempt(family, ip, port)
+                    except OSError as e:
+                        error = e
+                    else:
+                        pending[sock.fileno()] = (sock, ip)
+                        selector.register(sock, selectors.EVENT_WRITE)
+                    next_attempt_at = now + self.attempt_delay
+                    continue
+
+                if not pending:
+                    raise error
+
+                timeout = deadline - now
+                if next_index < len(addresses):
+                    timeout = min(timeout, max(0.0, next_attempt_at - now))
+                for key, _ in selector.select(timeout):
+                    conn, ip = pending.pop(key.fd)
+                    selector.unregister(conn)
+                    code = conn.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    if code == 0:
+                        return conn, ip
+                    conn.close()
+                    error = OSError(code, os.strerror(code))
+            raise socket.timeout("Timed out connecting to any address")
+        finally:
+            for conn, _ in pending.values():
+                conn.close()
+            selector.close()
+
+    @staticmethod
+    def _start_attempt(family: int, ip: str, port: int) -> socket.socket:
+        """Start a non-blocking connection attempt."""
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        error = sock.connect_ex((ip, port))
+        if error not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN):
+            sock.close()
+            raise OSError(error, os.strerror(error))
+        return sock
+
+
+def connect_in_order(addresses: List[Address], port: int, timeout: float) -> socket.socket:
+    """
+    Connect to each address in turn until one accepts, like socket.create_connection().
+
+    Args:
+        addresses: Candidate addresses, in resolver order
+        port: Destination port
+        timeout: Time limit for each attempt
+
+    Returns:
+        The connected socket
+
+    Raises:
+        OSError: The last attempt's error if none succeeded
+    """
+    error: OSError = OSError(errno.EHOSTUNREACH, "No addresses to connect to")
+    for family, ip in addresses:
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(timeout)
+            sock.connect((ip, port))
+            return sock
+        except OSError as e:
+            sock.close()
+            error = e
+    raise error
+
+
+def sort_addresses(addresses: List[Address]) -> List[Address]:
+    """
+    Move addresses this host has no route to behind the others (RFC 6724 rule 1).
+
+    The check connects a UDP socket, which looks up a route without sending
+    anything, so IPv6 answers do not come first on hosts without IPv6 routing.
+
+    Args:
+        addresses: Addresses in resolver order
+
+    Returns:
+        Reachable addresses first, each group in resolver order
+    """
+    return sorted(addresses, key=lambda address: not _has_route(*address))
+
+
+def _has_route(family: int, ip: str) -> bool:
+    """Check whether the host has a route to an address."""
+    try:
+        with socket.socket(family, socket.SOCK_DGRAM) as probe:
+            probe.connect((ip, 9))
+        return True
+    except OSError:
+        return False
+
+
+def interleave_addresses(addresses: List[Address]) -> List[Address]:
+    """
+    Order addresses by alternating families, starting with IPv6 (RFC 8305 section 4).
+
+    Args:
+        addresses: Addresses in resolver order
+
+    Returns:
+        Interleaved addresses
+    """
+    v6 = [a for a in addresses if a[0] == socket.AF_INET6]
+    v4 = [a for a in addresses if a[0] != socket.AF_INET6]
+    ordered: List[Address] = []
+    for i in range(max(len(v6), len(v4))):
+        if i < len(v6):
+            ordered.append(v6[i])
+        if i < len(v4):
+            ordered.append(v4[i])
+    return ordered
+
+
+def is_ip_address(hostname: str) -> bool:
+    """Check whether a hostname is an IP literal (which needs no resolution)."""
+    try:
+        ipaddress.ip_address(hostname.strip("[]"))
+        return True
+    except ValueError:
+        return False
@@ -0,0 +1,542 @@
+"""Local HTTP response cache for plain-HTTP requests routed through the gateway."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from aluvia_sdk import codec
+
+Headers = List[Tuple[bytes, bytes]]
+
+# Status codes cacheable by default (RFC 9110 section 15.1)
+CACHEABLE_STATUS_CODES = frozenset({200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501})
+
+# Heuristic freshness is capped, and is a fraction of the time since Last-Modified
+HEURISTIC_FRACTION = 0.1
+MAX_HEURISTIC_LIFETIME = 24 * 3600.0
+
+_HOP_BY_HOP_HEADERS = frozenset(
+    {
+        b"connection",
+        b"keep-alive",
+        b"proxy-connection",
+        b"proxy-authenticate",
+        b"te",
+        b"trailer",
+        b"transfer-encoding",
+        b"upgrade",
+        b"content-length",
+    }
+)
+
+
+def parse_cache_control(value: Optional[bytes]) -> Dict[str, Optional[str]]:
+    """
+    Parse a Cache-Control header value into a directive dictionary.
+
+    Args:
+        value: Raw header value (or None)
+
+    Returns:
+        Dictionary mapping lowercased directive names to their argument (or None)
+    """
+    directives: Dict[str, Optional[str]] = {}
+    if not value:
+        return directives
+    for part in value.decode("latin-1").split(","):
+        name, sep, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip().strip('"') if sep else None
+    return directives
+
+
+def _parse_seconds(value: Optional[str]) -> Optional[int]:
+    """Parse a delta-seconds directive argument."""
+    try:
+        return max(0, int(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _parse_http_date(value: Optional[bytes]) -> Optional[float]:
+    """Parse an HTTP-date header value into a POSIX timestamp."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value.decode("latin-1")).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def _header(headers: Headers, name: bytes) -> Optional[bytes]:
+    """Get the first value of a header (name must be lowercase)."""
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+class CacheEntry:
+    """A stored response and the metadata needed to judge its freshness."""
+
+    __slots__ = (
+        "url",
+        "status",
+        "reason",
+        "headers",
+        "body",
+        "vary",
+        "response_time",
+        "freshness_lifetime",
+        "no_cache",
+    )
+
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        reason: bytes,
+        headers: Headers,
+        body: bytes,
+        vary: Tuple[Tuple[bytes, bytes], ...],
+        response_time: float,
+        freshness_lifetime: float,
+        no_cache: bool,
+    ) -> None:
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+        self.vary = vary
+        self.response_time = response_time
+        self.freshness_lifetime = freshness_lifetime
+        self.no_cache = no_cache
+
+    @property
+    def size(self) -> int:
+        """Approximate memory footprint in bytes."""
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers) + 256
+
+    @property
+    def etag(self) -> Optional[bytes]:
+        """Entity tag of the stored response."""
+        return _header(self.headers, b"etag")
+
+    @property
+    def last_modified(self) -> Optional[bytes]:
+        """Last-Modified value of the stored response."""
+        return _header(self.headers, b"last-modified")
+
+    def age(self, now: float) -> float:
+        """Current age of the response in seconds (RFC 9111 section 4.2.3)."""
+        age_header = _header(self.headers, b"age")
+        try:
+            age_value = float(age_header) if age_header else 0.0
+        except ValueError:
+            age_value = 0.0
+        date_value = _parse_http_date(_header(self.headers, b"date")) or self.response_time
+        apparent_age = max(0.0, self.response_time - date_value)
+        return max(apparent_age, age_value) + max(0.0, now - self.response_time)
+
+    def is_fresh(self, now: float, request_cc: Dict[str, Optional[str]]) -> bool:
+        """
+        Check whether the entry can be served without revalidation.
+
+        Args:
+            now: Current time
+            request_cc: Parsed Cache-Control of the incoming request
+        """
+        if self.no_cache or "no-cache" in request_cc:
+            return False
+        age = self.age(now)
+        max_age = _parse_seconds(request_cc.get("max-age"))
+        if max_age is not None and age > max_age:
+            return False
+        min_fresh = _parse_seconds(request_cc.get("min-fresh")) or 0
+        return age + min_fresh < self.freshness_lifetime
+
+    def matches(self, request_headers: Dict[bytes, bytes]) -> bool:
+        """Check the request against the stored Vary header values."""
+        return all(request_headers.get(name, b"") == value for name, value in self.vary)
+
+    def is_not_modified_for(self, request_headers: Dict[bytes, bytes]) -> bool:
+        """Check whether the request's If-None-Match validates this entry."""
+        if_none_match = request_headers.get(b"if-none-match")
+        etag = self.etag
+        if not if_none_match or not etag:
+            return False
+        candidates = {tag.strip().lstrip(b"W/") for tag in if_none_match.split(b",")}
+        return b"*" in candidates or etag.lstrip(b"W/") in candidates
+
+    def to_response(self, now: float, not_modified: bool = False, close: bool = True) -> bytes:
+        """
+        Serialize the entry as an HTTP/1.1 response.
+
+        Args:
+            now: Current time, used for the Age header
+            not_modified: Send a bodiless 304 instead of the stored response
+            close: Add 'Connection: close'
+        """
+        body = b"" if not_modified else self.body
+        status = b"304 Not Modified" if not_modified else b"%d %s" % (self.status, self.reason)
+        lines = [b"HTTP/1.1 " + status]
+        lines.extend(k + b": " + v for k, v in self.headers if k.lower() != b"age")
+        lines.append(b"Age: %d" % int(self.age(now)))
+        if not not_modified:
+            lines.append(b"Content-Length: %d" % len(body))
+        lines.append(b"Connection: close" if close else b"Connection: keep-alive")
+        return b"\r\n".join(lines) + b"\r\n\r\n" + body
+
+    def to_bytes(self) -> bytes:
+        """Serialize for the disk tier: length-prefixed JSON metadata, then the body."""
+        meta = codec.dumps(
+            {
+                "url": self.url,
+                "status": self.status,
+                "reason": self.reason.decode("latin-1"),
+                "headers": [[k.decode("latin-1"), v.decode("latin-1")] for k, v in self.headers],
+                "vary": [[k.decode("latin-1"), v.decode("latin-1")] for k, v in self.vary],
+                "response_time": self.response_time,
+                "freshness_lifetime": self.freshness_lifetime,
+                "no_cache": self.no_cache,
+            }
+        )
+        return struct.pack("!I", len(meta)) + meta + self.body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CacheEntry":
+        """Deserialize an entry written by to_bytes()."""
+        (meta_len,) = struct.unpack("!I", data[:4])
+        meta = codec.loads(data[4 : 4 + meta_len])
+        return cls(
+            url=meta["url"],
+            status=meta["status"],
+            reason=meta["reason"].encode("latin-1"),
+            headers=[(k.encode("latin-1"), v.encode("latin-1")) for k, v in meta["headers"]],
+            body=data[4 + meta_len :],
+            vary=tuple((k.encode("latin-1"), v.encode("latin-1")) for k, v in meta["vary"]),
+            response_time=meta["response_time"],
+            freshness_lifetime=meta["freshness_lifetime"],
+            no_cache=meta["no_cache"],
+        )
+
+
+def _freshness_lifetime(status: int, headers: Headers, response_time: float) -> float:
+    """Compute the freshness lifetime of a response (RFC 9111 section 4.2.1)."""
+    cc = parse_cache_control(_header(headers, b"cache-control"))
+    max_age = _parse_seconds(cc.get("max-age"))
+    if max_age is not None:
+        return float(max_age)
+
+    date_value = _parse_http_date(_header(headers, b"date")) or response_time
+    expires_header = _header(headers, b"expires")
+    if expires_header is not None:
+        expires = _parse_http_date(expires_header)
+        # Invalid Expires values (e.g. "0") mean "already expired"
+        return max(0.0, expires - date_value) if expires is not None else 0.0
+
+    last_modified = _parse_http_date(_header(headers, b"last-modified"))
+    if last_modified is not None and status in CACHEABLE_STATUS_CODES:
+        heuristic = (date_value - last_modified) * HEURISTIC_FRACTION
+        return max(0.0, min(heuristic, MAX_HEURISTIC_LIFETIME))
+
+    return 0.0
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of HTTP responses with an optional disk tier.
+
+    Behaves as a private cache (RFC 9111): honors Cache-Control (no-store, no-cache,
+    max-age, min-fresh), Expires, heuristic freshness from Last-Modified, and Vary.
+    Stale entries with an ETag or Last-Modified are revalidated with a conditional
+    request. Responses that set cookies or answer authorized requests are never stored.
+
+    Each proxy worker process keeps its own memory tier; the disk tier is shared by
+    all workers (and by later runs) when disk_path is set.
+
+    Example:
+        >>> cache = ResponseCache(max_memory_bytes=32 * 1024 * 1024, disk_path="/tmp/aluvia-cache")
+        >>> client = AluviaClient(api_key="...", response_cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: int = 8 * 1024 * 1024,
+        disk_path: Optional[str] = None,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_memory_bytes: Memory tier size bound (per proxy worker)
+            max_entry_bytes: Largest response body that will be stored
+            disk_path: Directory for the disk tier (disabled if None)
+            max_disk_bytes: Disk tier size bound
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.disk_path = disk_path
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: "OrderedDict[str, List[CacheEntry]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+
+        if disk_path:
+            os.makedirs(disk_path, exist_ok=True)
+
+    def lookup(self, url: str, request_headers: Dict[bytes, bytes]) -> Optional[CacheEntry]:
+        """
+        Find a stored response matching the request, fresh or not.
+
+        Args:
+            url: Absolute request URL
+            request_headers: Request headers keyed by lowercase name
+        """
+        with self._lock:
+            variants = self._memory.get(url)
+            if variants is not None:
+                self._memory.move_to_end(url)
+                for entry in variants:
+                    if entry.matches(request_headers):
+                        return entry
+
+        if not self.disk_path:
+            return None
+
+        disk_entry = self._read_disk(url, request_headers)
+        if disk_entry is not None:
+            self._put_memory(disk_entry)
+        return disk_entry
+
+    def store(
+        self,
+        url: str,
+        request_headers: Dict[bytes, bytes],
+        status: int,
+        reason: bytes,
+        headers: Headers,
+        body: bytes,
+        response_time: Optional[float] = None,
+    ) -> Optional[CacheEntry]:
+        """
+        Store a response if it is cacheable.
+
+        Returns:
+            The stored entry, or None if the response may not be cached
+        """
+        if status not in CACHEABLE_STATUS_CODES or len(body) > self.max_entry_bytes:
+            return None
+        if b"authorization" in request_headers:
+            return None
+        if "no-store" in parse_cache_control(request_headers.get(b"cache-control")):
+            return None
+
+        cc = parse_cache_control(_header(headers, b"cache-control"))
+        if "no-store" in cc or _header(headers, b"set-cookie") is not None:
+            return None
+
+        vary_names = self._vary_names(headers)
+        if vary_names is None:
+            return None
+
+        response_time = response_time if response_time is not None else time.time()
+        stored_headers = [(k, v) for k, v in headers if k.lower() not in _HOP_BY_HOP_HEADERS]
+        entry = CacheEntry(
+            url=url,
+            status=status,
+            reason=reason,
+            headers=stored_headers,
+            body=body,
+            vary=tuple((name, request_headers.get(name, b"")) for name in vary_names),
+            response_time=response_time,
+            freshness_lifetime=_freshness_lifetime(status, headers, response_time),
+            no_cache="no-cache" in cc,
+        )
+
+        # Without freshness or a validator the entry could never be used
+        if entry.freshness_lifetime <= 0 and not (entry.etag or entry.last_modified):
+            return None
+
+        self._put_memory(entry)
+        if self.disk_path:
+            self._write_disk(entry, vary_names)
+        return entry
+
+    def refresh(self, entry: CacheEntry, headers: Headers) -> CacheEntry:
+        """
+        Update a stored entry from a 304 Not Modified response.
+
+        Args:
+            entry: The entry that was revalidated
+            headers: Headers of the 304 response
+        """
+        now = time.time()
+        updated = {k.lower() for k, _ in headers if k.lower() not in _HOP_BY_HOP_HEADERS}
+        merged = [(k, v) for k, v in entry.headers if k.lower() not in updated]
+        merged.extend((k, v) for k, v in headers if k.lower() in updated)
+
+        refreshed = CacheEntry(
+            url=entry.url,
+            status=entry.status,
+            reason=entry.reason,
+            headers=merged,
+            body=entry.body,
+            vary=entry.vary,
+            response_time=now,
+            freshness_lifetime=_freshness_lifetime(entry.status, merged, now),
+            no_cache="no-cache" in parse_cache_control(_header(merged, b"cache-control")),
+        )
+        self._put_memory(refreshed)
+        if self.disk_path:
+            self._write_disk(refreshed, [name for name, _ in refreshed.vary])
+        return refreshed
+
+    def clear(self) -> None:
+        """Drop every entry from the memory tier."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    @staticmethod
+    def _vary_names(headers: Headers) -> Optional[List[bytes]]:
+        """Get the lowercase Vary header names, or None for 'Vary: *'."""
+        names: List[bytes] = []
+        for key, value in headers:
+            if key.lower() != b"vary":
+                continue
+            for name in value.split(b","):
+                name = name.strip().lower()
+                if name == b"*":
+                    return None
+                if name and name not in names:
+                    names.append(name)
+        return sorted(names)
+
+    def _put_memory(self, entry: CacheEntry) -> None:
+        """Insert an entry into the memory tier, evicting least recently used URLs."""
+        with self._lock:
+            variants = self._memory.pop(entry.url, [])
+            kept = []
+            for existing in variants:
+                if existing.vary == entry.vary:
+                    self._memory_bytes -= existing.size
+                else:
+                    kept.append(existing)
+            kept.append(entry)
+            self._memory[entry.url] = kept
+            self._memory_bytes += entry.size
+
+            while self._memory_bytes > self.max_memory_bytes and self._memory:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= sum(e.size for e in evicted)
+
+    def _disk_file(self, key: str, suffix: str) -> str:
+        """Path of a disk tier file."""
+        assert self.disk_path
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.disk_path, digest + suffix)
+
+    @staticmethod
+    def _variant_key(url: str, vary: Iterable[Tuple[bytes, bytes]]) -> str:
+        """Disk key for one Vary variant of a URL."""
+        parts = [url] + [f"{k.decode('latin-1')}={v.decode('latin-1')}" for k, v in vary]
+        return "\n".join(parts)
+
+    def _read_disk(self, url: str, request_headers: Dict[bytes, bytes]) -> Optional[CacheEntry]:
+        """Load a matching entry from the disk tier."""
+        try:
+            with open(self._disk_file(url, ".vary"), "rb") as f:
+                vary_names = [name.encode("latin-1") for name in codec.loads(f.read())]
+            vary = [(name, request_headers.get(name, b"")) for name in vary_names]
+            path = self._disk_file(self._variant_key(url, vary), ".entry")
+            with open(path, "rb") as f:
+                entry = CacheEntry.from_bytes(f.read())
+            os.utime(path)  # mtime doubles as the LRU timestamp
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+        return entry if entry.url == url and entry.matches(request_headers) else None
+
+    def _write_disk(self, entry: CacheEntry, vary_names: List[bytes]) -> None:
+        """Write an entry to the disk tier atomically, then enforce the size bound."""
+        data = entry.to_bytes()
+        try:
+            self._write_atomic(
+                self._disk_file(entry.url, ".vary"),
+                codec.dumps([n.decode("latin-1") for n in vary_names]),
+            )
+            self._write_atomic(
+                self._disk_file(self._variant_key(entry.url, entry.vary), ".entry"), data
+            )
+        except OSError:
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_bytes()
+            else:
+                self._disk_bytes += len(data)
+            over_limit = self._disk_bytes > self.max_disk_bytes
+        if over_limit:
+            self._evict_disk()
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        """Write a file via a temp file and atomic replace."""
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _scan_disk_bytes(self) -> int:
+        """Total size of the disk tier entries."""
+        assert self.disk_path
+        total = 0
+        with os.scandir(self.disk_path) as it:
+            for item in it:
+                if item.name.endswith(".entry"):
+                    try:
+                        total += item.stat().st_size
+                    except OSError:
+                        pass
+        return total
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used disk entries until 90% of the size bound."""
+        assert self.disk_path
+        files = []
+        with os.scandir(self.disk_path) as it:
+            for item in it:
+                if item.name.endswith(".entry"):
+                    try:
+                        st = item.stat()
+                    except OSError:
+                        continue
+                    files.append((st.st_mtime, st.st_size, item.path))
+
+        # Other workers share the directory, so recount instead of trusting the estimate
+        total = sum(size for _, size, _ in files)
+        target = int(self.max_disk_bytes * 0.9)
+        for _, size, path in sorted(files):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+        with self._lock:
+            self._disk_bytes = total
@@ -1,6 +1,8 @@
 """Hostname matching rules engine."""
 
-from typing import Sequence
+import fnmatch
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Set
 
 
 def match_pattern(hostname: str, pattern: str) -> bool:
@@ -67,6 +69,7 @@ def should_proxy(hostname: str, rules: Sequence[str]) -> bool:
     - ['*.google.com'] → proxy subdomains of google.com
     - ['*', '-example.com'] → proxy everything except example.com
     - ['AUTO', 'example.com'] → AUTO is placeholder (ignored), proxy example.com
+    - ['!*.doubleclick.net'] → block rule, never proxied (see BlockRules)
 
     Negative patterns (prefixed with '-') exclude hosts from proxying.
     If '*' is in rules, default is to proxy unless excluded.
@@ -116,3 +119,287 @@ def should_proxy(hostname: str, rules: Sequence[str]) -> bool:
             return True
 
     return False
+
+
+def host_key(authority: bytes) -> Optional[str]:
+    """
+    Normalize a raw request authority into the hostname key used for matching.
+
+    Handles 'host', 'host:port', '[v6]', '[v6]:port' and bare IPv6 literals in one
+    pass over the bytes: the port, IPv6 brackets, surrounding whitespace and a
+    trailing root dot are removed and the result is lowercased (ASCII only, as in
+    the wire format).
+
+    Args:
+        authority: Raw authority bytes, e.g. b"Example.com:443" or b"[::1]:443"
+
+    Returns:
+        The normalized hostname, or None if the authority is empty or malformed
+
+    Example:
+        >>> host_key(b"[2001:DB8::1]:443")
+        '2001:db8::1'
+    """
+    start = 0
+    end = len(authority)
+    while start < end and authority[start] in b" \t":
+        start += 1
+    while end > start and authority[end - 1] in b" \t":
+        end -= 1
+
+    if start < end and authority[start] == 0x5B:  # '['
+        close = authority.find(b"]", start + 1, end)
+        if close == -1:
+            return None
+        start, end = start + 1, close
+    else:
+        colon = authority.find(b":", start, end)
+        # A single colon separates the port; more than one is a bare IPv6 literal
+        if colon != -1 and authority.find(b":", colon + 1, end) == -1:
+            end = colon
+
+    if end > start and authority[end - 1] == 0x2E:  # '.'
+        end -= 1
+    if end <= start:
+        return None
+    return authority[start:end].lower().decode("latin-1")
+
+
+class _HostPatternSet:
+    """
+    A set of hostname patterns compiled into hash lookups.
+
+    Matching is equivalent to calling match_pattern() for every pattern, but costs
+    one set lookup per dot in the hostname instead of one string scan per pattern.
+    """
+
+    __slots__ = ("match_all", "exact", "suffixes", "prefixes")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.match_all = False
+        self.exact: Set[str] = set()
+        self.suffixes: Set[str] = set()  # '*.example.com' -> '.example.com'
+        self.prefixes: Set[str] = set()  # 'google.*' -> 'google.'
+
+        for pattern in patterns:
+            normalized = pattern.strip().lower()
+            if not normalized:
+                continue
+            if normalized == "*":
+                self.match_all = True
+            elif normalized.startswith("*."):
+                self.suffixes.add(normalized[1:])
+            elif normalized.endswith(".*"):
+                self.prefixes.add(normalized[:-1])
+            else:
+                self.exact.add(normalized)
+
+    def __bool__(self) -> bool:
+        return bool(self.match_all or self.exact or self.suffixes or self.prefixes)
+
+    def matches(self, hostname: str) -> bool:
+        """Check a normalized (stripped, lowercased) hostname against the set."""
+        if not hostname:
+            return False
+        if self.match_all or hostname in self.exact:
+            return True
+        if not self.suffixes and not self.prefixes:
+            return False
+
+        dot = hostname.find(".")
+        while dot != -1:
+            # Suffix wildcards need a non-empty label in front of the suffix
+            if dot > 0 and hostname[dot:] in self.suffixes:
+                return True
+            if hostname[: dot + 1] in self.prefixes:
+                return True
+            dot = hostname.find(".", dot + 1)
+        return False
+
+
+class CompiledRules:
+    """
+    Routing rules compiled once for fast per-request decisions.
+
+    Semantics are identical to should_proxy(); block rules (prefixed with '!') are
+    ignored here and handled by BlockRules.
+
+    Example:
+        >>> compiled = CompiledRules(["*", "-api.stripe.com"])
+        >>> compiled.should_proxy("example.com")
+        True
+    """
+
+    __slots__ = ("rules", "_positive", "_negative", "_decisions")
+
+    # Upper bound for the per-instance decision cache
+    MAX_CACHED_DECISIONS = 4096
+
+    def __init__(self, rules: Sequence[str]) -> None:
+        self.rules = tuple(r for r in rules if isinstance(r, str))
+
+        normalized_rules = [r.strip() for r in self.rules if r.strip()]
+        effective_rules = [
+            r for r in normalized_rules if r.upper() != "AUTO" and not r.startswith("!")
+        ]
+
+        self._positive = _HostPatternSet(r for r in effective_rules if not r.startswith("-"))
+        self._negative = _HostPatternSet(
+            r[1:] for r in effective_rules if r.startswith("-") and len(r) > 1
+        )
+        self._decisions: Dict[str, bool] = {}
+
+    def should_proxy(self, hostname: str) -> bool:
+        """
+        Determine if a hostname should be proxied.
+
+        Args:
+            hostname: The hostname to check; keys from host_key() hit the decision
+                cache without further normalization
+
+        Returns:
+            True if the hostname should be proxied
+        """
+        decision = self._decisions.get(hostname)
+        if decision is not None:
+            return decision
+
+        normalized_hostname = hostname.strip().lower()
+        decision = bool(normalized_hostname) and (
+            not self._negative.matches(normalized_hostname)
+            and self._positive.matches(normalized_hostname)
+        )
+
+        if len(self._decisions) >= self.MAX_CACHED_DECISIONS:
+            self._decisions.clear()
+        self._decisions[hostname] = decision
+        return decision
+
+    def promote(self, hostname: str) -> None:
+        """
+        Add an exact hostname to the positive rules in place.
+
+        Negative rules still take precedence.
+
+        Args:
+            hostname: The hostname to proxy from now on
+        """
+        normalized_hostname = hostname.strip().lower()
+        if not normalized_hostname:
+            return
+        self.rules = self.rules + (normalized_hostname,)
+        self._positive.exact.add(normalized_hostname)
+        self._decisions.clear()
+
+    def is_excluded(self, hostname: str) -> bool:
+        """Check whether a negative rule excludes the hostname from proxying."""
+        return self._negative.matches(hostname.strip().lower())
+
+
+# Block pattern prefix for a URL path extension, e.g. 'ext:woff2'
+EXTENSION_PREFIX = "ext:"
+
+
+class BlockRules:
+    """
+    Block rules compiled for the local proxy.
+
+    Blocked requests are answered locally with an empty response and never reach
+    the gateway or the destination. Patterns may be given with or without the
+    leading '!' used to mix them into routing rules.
+
+    Supported patterns:
+    - '*.doubleclick.net', 'ads.example.com', 'tracker.*' match hostnames, with the
+      same semantics as match_pattern() (so '*.cn' blocks the .cn domains, as it
+      routes them in routing rules)
+    - 'ext:woff2' matches URLs whose path ends in that extension
+    - '/ads/*', '*/pixel.gif' (anything containing '/') match the URL path using
+      shell-style wildcards
+
+    Paths are only visible for plain-HTTP requests; HTTPS (CONNECT) tunnels can
+    only be blocked by hostname.
+    """
+
+    __slots__ = ("patterns", "_hosts", "_extensions", "_path_regex")
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        normalized = []
+        for pattern in patterns:
+            if not isinstance(pattern, str):
+                continue
+            p = pattern.strip()
+            if p.startswith("!"):
+                p = p[1:].strip()
+            if p:
+                normalized.append(p)
+        self.patterns = tuple(normalized)
+
+        host_patterns: List[str] = []
+        extensions: Set[str] = set()
+        path_patterns: List[str] = []
+        for p in self.patterns:
+            if p.lower().startswith(EXTENSION_PREFIX):
+                extension = p[len(EXTENSION_PREFIX) :].strip().lstrip(".").lower()
+                if extension:
+                    extensions.add("." + extension)
+            elif "/" in p:
+                path_patterns.append(p)
+            else:
+                host_patterns.append(p)
+
+        self._hosts = _HostPatternSet(host_patterns)
+        self._extensions = frozenset(extensions)
+        self._path_regex: Optional[Pattern[str]] = (
+            re.compile("|".join(fnmatch.translate(p) for p in path_patterns), re.IGNORECASE)
+            if path_patterns
+            else None
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def is_blocked(self, hostname: str, path: Optional[str] = None) -> bool:
+        """
+        Check whether a request should be blocked.
+
+        Args:
+            hostname: Destination hostname
+            path: Request path including query string (None for CONNECT tunnels)
+
+        Returns:
+            True if the request matches a block rule
+        """
+        if self._hosts and self._hosts.matches(hostname.strip().lower()):
+            return True
+
+        if not path:
+            return False
+
+        if self._extensions:
+            path_only = path.split("?", 1)[0].split("#", 1)[0]
+            slash = path_only.rfind("/")
+            dot = path_only.rfind(".")
+            if dot > slash and path_only[dot:].lower() in self._extensions:
+                return True
+
+        if self._path_regex is not None and self._path_regex.match(path):
+            return True
+
+        return False
+
+
+def split_block_rules(rules: Sequence[str]) -> List[str]:
+    """
+    Extract block rules ('!'-prefixed entries) from a routing rules list.
+
+    Args:
+        rules: Sequence of rule patterns
+
+    Returns:
+        Block patterns with the '!' prefix removed
+    """
+    return [
+        r.strip()[1:].strip()
+        for r in rules
+        if isinstance(r, str) and r.strip().startswith("!") and len(r.strip()) > 1
+    ]
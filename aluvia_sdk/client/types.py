@@ -1,6 +1,6 @@
 """Type definitions for the client layer."""
 
-from typing import Any, Callable, Literal, Protocol, TypedDict, Union
+from typing import Any, Callable, List, Literal, Protocol, TypedDict, Union
 
 GatewayProtocol = Literal["http", "https"]
 LogLevel = Literal["silent", "info", "debug"]
@@ -28,6 +28,7 @@ class AluviaClientOptions(TypedDict, total=False):
     connection_id: Union[int, str]
     local_proxy: bool
     strict: bool
+    block_rules: List[str]
 
 
 class AluviaClientConnection(Protocol):
@@ -0,0 +1,200 @@
+"""JSON codec used for all SDK serialization, with optional fast backends."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Optional, Union
+
+
+def _default(obj: Any) -> Any:
+    """Encode values the backends do not handle natively."""
+    if isinstance(obj, Mapping):
+        # API records are read-only mappings
+        return dict(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Integer range orjson can encode
+_ORJSON_INT_MIN = -(2**63)
+_ORJSON_INT_MAX = 2**64 - 1
+
+
+def _has_big_int(obj: Any) -> bool:
+    """Check whether a value holds an integer outside orjson's range."""
+    if isinstance(obj, int):
+        return not _ORJSON_INT_MIN <= obj <= _ORJSON_INT_MAX
+    if isinstance(obj, Mapping):
+        return any(_has_big_int(k) or _has_big_int(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return any(_has_big_int(item) for item in obj)
+    return False
+
+
+class JsonCodec:
+    """
+    JSON encoder/decoder backend.
+
+    dumps() returns compact UTF-8 bytes and loads() accepts bytes or str. Both
+    raise ValueError subclasses on failure (TypeError for unsupported values),
+    whatever the backend.
+    """
+
+    name = "base"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a value to JSON bytes."""
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON bytes or text."""
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"<JsonCodec {self.name}>"
+
+
+class StdlibJsonCodec(JsonCodec):
+    """Codec backed by the standard library json module."""
+
+    name = "stdlib"
+
+    def __init__(self) -> None:
+        self._encoder = json.JSONEncoder(
+            separators=(",", ":"), ensure_ascii=False, default=_default
+        )
+        self._decoder = json.JSONDecoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a value to JSON bytes."""
+        return self._encoder.encode(obj).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON bytes or text."""
+        text = data.decode("utf-8") if isinstance(data, (bytes, bytearray)) else data
+        return self._decoder.decode(text)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a value to JSON bytes."""
+        try:
+            return self._orjson.dumps(obj, default=_default, option=self._option)
+        except TypeError:
+            # orjson rejects integers beyond 64 bits; the stdlib encoder does not
+            if _has_big_int(obj):
+                return _stdlib.dumps(obj)
+            raise
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON bytes or text."""
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """Codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decode_error = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a value to JSON bytes."""
+        encoded: bytes = self._encoder.encode(obj)
+        return encoded
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON bytes or text."""
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e)) from e
+
+
+_stdlib = StdlibJsonCodec()
+
+_BACKENDS: Dict[str, Callable[[], JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "stdlib": StdlibJsonCodec,
+}
+
+_codec: Optional[JsonCodec] = None
+
+
+def _detect() -> JsonCodec:
+    """Pick the fastest installed backend."""
+    for name in ("orjson", "msgspec"):
+        try:
+            return _BACKENDS[name]()
+        except ImportError:
+            continue
+    return _stdlib
+
+
+def get_codec() -> JsonCodec:
+    """Get the codec in use, detecting the fastest installed backend on first use."""
+    global _codec
+    if _codec is None:
+        _codec = _detect()
+    return _codec
+
+
+def set_codec(codec: Union[str, JsonCodec, None]) -> JsonCodec:
+    """
+    Choose the JSON backend for the whole process.
+
+    Args:
+        codec: "orjson", "msgspec" or "stdlib", a JsonCodec instance, or None to
+            go back to automatic detection
+
+    Returns:
+        The codec now in use
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If the named backend is not installed
+
+    Example:
+        >>> from aluvia_sdk import codec
+        >>> codec.set_codec("stdlib")
+        <JsonCodec stdlib>
+    """
+    global _codec
+    if codec is None:
+        _codec = None
+        return get_codec()
+    if isinstance(codec, str):
+        factory = _BACKENDS.get(codec)
+        if factory is None:
+            raise ValueError(f"Unknown JSON codec: {codec!r}")
+        codec = factory()
+    _codec = codec
+    return codec
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode a value to compact JSON bytes with the current codec."""
+    return get_codec().dumps(obj)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON bytes or text with the current codec."""
+    return get_codec().loads(data)
@@ -22,9 +22,13 @@ class InvalidApiKeyError(Exception):
 class ApiError(Exception):
     """Raised for general API errors (non-2xx responses other than auth errors)."""
 
-    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+    def __init__(
+        self, message: str, status_code: Optional[int] = None, attempts: Optional[int] = None
+    ) -> None:
         super().__init__(message)
         self.status_code = status_code
+        # Number of HTTP attempts made, when the error comes from a request
+        self.attempts = attempts
 
 
 class ProxyStartError(Exception):
@@ -0,0 +1,276 @@
+"""Synchronous facades for AluviaClient and AluviaApi."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import os
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from aluvia_sdk.api.account import AccountApi, ConnectionsApi
+from aluvia_sdk.api.aluvia_api import AluviaApi
+from aluvia_sdk.api.geos import GeosApi
+from aluvia_sdk.client.aluvia_client import AluviaClient, ConnectionObject
+
+T = TypeVar("T")
+
+
+class EventLoopThread:
+    """
+    An asyncio event loop running forever in a daemon thread.
+
+    Coroutines submitted with run() execute on that loop, so connection pools,
+    polling tasks and the local proxy persist between synchronous calls.
+    """
+
+    def __init__(self, name: str = "aluvia-loop") -> None:
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid = 0
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop, started on first use (and again in a forked child)."""
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid() or self._loop.is_closed():
+                self._start()
+            assert self._loop is not None
+            return self._loop
+
+    def _start(self) -> None:
+        """Start a new loop thread."""
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+        self._thread.start()
+        ready.wait()
+        self._loop = loop
+        self._pid = os.getpid()
+
+    def run(self, awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run an awaitable on the loop thread and wait for its result.
+
+        Args:
+            awaitable: Coroutine or other awaitable
+            timeout: Seconds to wait (None waits forever); the work is cancelled on timeout
+
+        Raises:
+            RuntimeError: If called from the loop thread itself, which would deadlock
+        """
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Synchronous Aluvia calls cannot be made from the SDK's loop thread")
+
+        async def wrapper() -> T:
+            return await awaitable
+
+        future = asyncio.run_coroutine_threadsafe(wrapper(), loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stop(self) -> None:
+        """Stop the loop and wait for its thread to exit."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or self._pid != os.getpid():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+# Loop thread shared by all synchronous facades in the process
+_default_loop_thread = EventLoopThread()
+
+
+class SyncIterator(Iterator[T]):
+    """Blocking iterator over an async iterator running on the loop thread."""
+
+    def __init__(self, iterator: AsyncIterator[T], loop_thread: EventLoopThread) -> None:
+        self._iterator = iterator
+        self._loop_thread = loop_thread
+
+    def __iter__(self) -> "SyncIterator[T]":
+        return self
+
+    def __next__(self) -> T:
+        try:
+            return self._loop_thread.run(self._iterator.__anext__())
+        except StopAsyncIteration:
+            raise StopIteration from None
+
+    def close(self) -> None:
+        """Stop iterating early and release the underlying response or tasks."""
+        aclose = getattr(self._iterator, "aclose", None)
+        if aclose is not None:
+            self._loop_thread.run(aclose())
+
+    def __enter__(self) -> "SyncIterator[T]":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+# Objects whose attributes are wrapped rather than returned as-is
+_WRAPPED_TYPES = (AluviaApi, AccountApi, ConnectionsApi, GeosApi, ConnectionObject)
+
+
+class _SyncProxy:
+    """
+    Blocking view of an SDK object living on the loop thread.
+
+    Methods run on the loop thread: awaitable results are waited for, async
+    iterators become SyncIterator, and SDK namespaces (api.account, ...) and
+    connection objects are wrapped in turn.
+    """
+
+    def __init__(self, target: Any, loop_thread: EventLoopThread) -> None:
+        self._target = target
+        self._loop_thread = loop_thread
+
+    def _wrap(self, value: Any) -> Any:
+        """Wrap a value returned from the loop thread."""
+        if isinstance(value, _WRAPPED_TYPES):
+            return _SyncProxy(value, self._loop_thread)
+        if hasattr(value, "__anext__"):
+            return SyncIterator(value, self._loop_thread)
+        return value
+
+    def _call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call fn on the loop thread, awaiting its result if needed."""
+
+        async def call() -> Any:
+            result = fn(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        return self._wrap(self._loop_thread.run(call()))
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ("_target", "_loop_thread"):
+            raise AttributeError(name)  # Not initialized yet
+        value = getattr(self._target, name)
+        if callable(value) and not isinstance(value, type):
+            return functools.partial(self._call, value)
+        return self._wrap(value)
+
+    def __repr__(self) -> str:
+        return f"<sync {self._target!r}>"
+
+
+class SyncAluviaApi(_SyncProxy):
+    """
+    Blocking AluviaApi for synchronous code.
+
+    Takes the same arguments as AluviaApi. Calls run on a shared background
+    event loop, so the HTTP connection pool, caches and rate limiter persist
+    between calls; list iterators (iter_connections, create_many, ...) become
+    ordinary iterators.
+
+    Example:
+        >>> api = SyncAluviaApi(api_key="your-api-key")
+        >>> account = api.account.get()
+        >>> for connection in api.account.iter_connections():
+        ...     print(connection["connection_id"])
+        >>> api.close()
+    """
+
+    def __init__(
+        self, *args: Any, loop_thread: Optional[EventLoopThread] = None, **kwargs: Any
+    ) -> None:
+        """
+        Initialize the API wrapper.
+
+        Args:
+            *args: Positional arguments for AluviaApi
+            loop_thread: Loop thread to run on (default: one shared by the process)
+            **kwargs: Keyword arguments for AluviaApi
+        """
+        loop_thread = loop_thread or _default_loop_thread
+
+        async def create() -> AluviaApi:
+            return AluviaApi(*args, **kwargs)
+
+        super().__init__(loop_thread.run(create()), loop_thread)
+
+    def close(self) -> None:
+        """Close the underlying HTTP client."""
+        self._loop_thread.run(self._target.close())
+
+    def __enter__(self) -> "SyncAluviaApi":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+class SyncAluviaClient(_SyncProxy):
+    """
+    Blocking AluviaClient for synchronous code (Selenium, requests, threads).
+
+    Takes the same arguments as AluviaClient. The client, its configuration
+    polling and the local proxy run on a shared background event loop that
+    outlives individual calls, instead of a new loop per asyncio.run().
+
+    Example:
+        >>> client = SyncAluviaClient(api_key="your-api-key")
+        >>> connection = client.start()
+        >>> requests.get("https://example.com", proxies=connection.as_requests())
+        >>> client.update_rules(["example.com"])
+        >>> client.stop()
+    """
+
+    def __init__(
+        self, *args: Any, loop_thread: Optional[EventLoopThread] = None, **kwargs: Any
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            *args: Positional arguments for AluviaClient
+            loop_thread: Loop thread to run on (default: one shared by the process)
+            **kwargs: Keyword arguments for AluviaClient
+        """
+        loop_thread = loop_thread or _default_loop_thread
+
+        async def create() -> AluviaClient:
+            return AluviaClient(*args, **kwargs)
+
+        super().__init__(loop_thread.run(create()), loop_thread)
+
+    def start(self) -> Any:
+        """
+        Start the client.
+
+        Returns:
+            The connection, with blocking close()/stop()
+        """
+        return self._call(self._target.start)
+
+    def stop(self) -> None:
+        """Stop the client and clean up resources."""
+        self._loop_thread.run(self._target.stop())
+
+    def __enter__(self) -> "SyncAluviaClient":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.stop()
@@ -0,0 +1,98 @@
+"""
+Benchmark: local proxy accept rate with and without SO_REUSEPORT shards.
+
+Starts the local proxy with listen_shards=1 and listen_shards=N and opens many
+short-lived client connections at once, each sending one request to a blocked
+hostname (answered by the proxy itself, so no upstream is involved). Reports
+completed connections per second and connect latency. Linux only.
+
+Usage (with the SDK installed, e.g. pip install -e .):
+    python benchmarks/bench_accept.py [connections] [concurrency] [shards]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from typing import List, Tuple
+
+from aluvia_sdk.client.config_manager import (
+    ConfigManager,
+    ConnectionNetworkConfig,
+    RawProxyConfig,
+)
+from aluvia_sdk.client.proxy_server import ProxyServer
+
+REQUEST = b"GET http://blocked.test/ HTTP/1.1\r\nHost: blocked.test\r\nConnection: close\r\n\r\n"
+
+
+def make_config_manager() -> ConfigManager:
+    """ConfigManager with a static configuration (no API calls)."""
+    config_manager = ConfigManager(
+        api_key="bench",
+        api_base_url="http://127.0.0.1:9/v1",
+        poll_interval_ms=60000,
+        gateway_protocol="http",
+        gateway_port=8080,
+        log_level="silent",
+    )
+    config_manager._config = ConnectionNetworkConfig(
+        raw_proxy=RawProxyConfig("http", "127.0.0.1", 9, "user", "pass"),
+        rules=["*"],
+        session_id=None,
+        target_geo=None,
+        etag=None,
+    )
+    return config_manager
+
+
+async def hammer(port: int, connections: int, concurrency: int) -> Tuple[float, List[float]]:
+    """Open connections with bounded concurrency; return elapsed time and connect latencies."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            latencies.append(time.perf_counter() - start)
+            writer.write(REQUEST)
+            await reader.read()
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(connections)))
+    return time.perf_counter() - start, latencies
+
+
+def percentile(values: List[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def main() -> None:
+    connections = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    shards = int(sys.argv[3]) if len(sys.argv) > 3 else max(2, os.cpu_count() or 1)
+    print(f"{connections} connections, {concurrency} concurrent, {os.cpu_count()} CPUs\n")
+
+    for listen_shards in (1, shards):
+        server = ProxyServer(
+            make_config_manager(),
+            log_level="silent",
+            block_rules=["blocked.test"],
+            listen_shards=listen_shards,
+        )
+        info = await server.start()
+        await hammer(info["port"], min(connections, 200), concurrency)  # Warm up
+        elapsed, latencies = await hammer(info["port"], connections, concurrency)
+        await server.stop()
+        print(
+            f"listen_shards={listen_shards:<3} {connections / elapsed:8.0f} conn/s"
+            f"  connect p50={percentile(latencies, 0.5) * 1000:6.2f} ms"
+            f"  p99={percentile(latencies, 0.99) * 1000:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,189 @@
+"""
+Benchmark: HTTP/1.1 vs HTTP/2 for concurrent control-plane calls.
+
+Starts a local TLS stand-in for the Aluvia API that speaks both HTTP/1.1 and
+HTTP/2 (ALPN) and answers every request after a fixed delay, then issues
+concurrent AluviaApi calls with and without http2=True. Reports the number of
+TCP connections the server accepted and the latency distribution.
+
+Requires the 'h2' package (pip install aluvia-sdk[http2]) and the openssl CLI
+to create a throwaway certificate.
+
+Usage (with the SDK installed, e.g. pip install -e .):
+    python benchmarks/bench_http2.py [calls] [server_delay_ms]
+"""
+
+import asyncio
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+
+from aluvia_sdk import AluviaApi
+
+BODY = b'{"success":true,"data":{"connection_id":1,"proxy_username":"u","proxy_password":"p"}}'
+
+
+class StandInServer:
+    """Minimal API stand-in speaking HTTP/1.1 and HTTP/2 over TLS."""
+
+    def __init__(self, cert: str, key: str, delay: float) -> None:
+        self.delay = delay
+        self.connections = 0
+        self.ssl = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        self.ssl.load_cert_chain(cert, key)
+        self.ssl.set_alpn_protocols(["h2", "http/1.1"])
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0, ssl=self.ssl)
+        port: int = self.server.sockets[0].getsockname()[1]
+        return port
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            if writer.get_extra_info("ssl_object").selected_alpn_protocol() == "h2":
+                await self.serve_h2(reader, writer)
+            else:
+                await self.serve_http1(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve_http1(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            await asyncio.sleep(self.delay)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(BODY), BODY)
+            )
+            await writer.drain()
+
+    async def serve_h2(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        conn.update_settings({h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 1000})
+        writer.write(conn.data_to_send())
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(self.delay)
+            conn.send_headers(
+                stream_id,
+                [
+                    (":status", "200"),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(BODY))),
+                ],
+            )
+            conn.send_data(stream_id, BODY, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        tasks = set()
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                return
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.StreamEnded):
+                    task = asyncio.ensure_future(respond(event.stream_id))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                elif isinstance(event, h2.events.DataReceived):
+                    conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+
+def make_certificate(directory: str) -> Tuple[str, str]:
+    """Create a self-signed certificate for localhost."""
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost",
+            "-keyout", key, "-out", cert,
+        ],
+        check=True,
+        capture_output=True,
+    )  # fmt: skip
+    return cert, key
+
+
+async def run(port: int, calls: int, http2: bool) -> List[float]:
+    """Issue concurrent GETs and return per-call latencies in seconds."""
+    api = AluviaApi(
+        api_key="bench",
+        api_base_url=f"https://localhost:{port}/v1",
+        http2=http2,
+        response_cache=False,
+        retry_policy=False,
+        rate_limiter=False,
+    )
+
+    async def call() -> float:
+        start = time.perf_counter()
+        await api.account.connections.get(1)
+        return time.perf_counter() - start
+
+    try:
+        return list(await asyncio.gather(*(call() for _ in range(calls))))
+    finally:
+        await api.close()
+
+
+def percentile(values: List[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    delay = (float(sys.argv[2]) if len(sys.argv) > 2 else 20.0) / 1000.0
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        # httpx trusts SSL_CERT_FILE, so the default client verifies the stand-in
+        os.environ["SSL_CERT_FILE"] = cert
+        print(f"{calls} concurrent calls, server delay {delay * 1000:.0f} ms\n")
+
+        results: Dict[str, Tuple[int, List[float], float]] = {}
+        for label, http2 in (("HTTP/1.1", False), ("HTTP/2", True)):
+            server = StandInServer(cert, key, delay)
+            port = await server.start()
+            start = time.perf_counter()
+            latencies = await run(port, calls, http2)
+            results[label] = (server.connections, latencies, time.perf_counter() - start)
+            await server.stop()
+
+    for label, (connections, latencies, total) in results.items():
+        print(
+            f"{label:<9} connections={connections:<4}"
+            f" p50={percentile(latencies, 0.5) * 1000:7.1f} ms"
+            f" p99={percentile(latencies, 0.99) * 1000:7.1f} ms"
+            f" total={total * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""
+Memory benchmark: per-record footprint of API connection records.
+
+Compares the decoded JSON dicts the API layer used to return with
+ConnectionRecord instances built from the same payload.
+
+Timings run under tracemalloc and are only comparable with each other.
+
+Usage (with the SDK installed, e.g. pip install -e .):
+    python benchmarks/bench_models.py [count]
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+from aluvia_sdk.api.models import ConnectionRecord
+
+
+def make_payload(count: int) -> bytes:
+    """Build a /account/connections response body with count connections."""
+    connections = [
+        {
+            "connection_id": i,
+            "description": f"agent-{i}",
+            "proxy_username": f"user-{i:08d}",
+            "proxy_password": f"pass-{i:08d}",
+            "rules": ["*.example.com"],
+            "session_id": None,
+            "target_geo": "us_ca",
+        }
+        for i in range(count)
+    ]
+    return json.dumps({"success": True, "data": connections}).encode()
+
+
+def measure(label: str, count: int, build: Callable[[], List[Any]]) -> None:
+    """Report retained bytes per record and build time."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(records) == count
+    print(
+        f"{label:<18} {retained / count:8.0f} bytes/record"
+        f"  {elapsed * 1e6 / count:6.2f} us/record"
+    )
+    del records
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    payload = make_payload(count)
+    print(f"{count} connection records\n")
+
+    measure("dict", count, lambda: json.loads(payload)["data"])
+    measure(
+        "ConnectionRecord",
+        count,
+        lambda: ConnectionRecord.from_json_list(json.loads(payload)["data"]),
+    )
+
+    # Container overhead alone, excluding the field values both representations share
+    sample = json.loads(make_payload(1))["data"][0]
+    print(
+        f"\ncontainer only: dict {sys.getsizeof(sample)} bytes,"
+        f" ConnectionRecord {sys.getsizeof(ConnectionRecord.from_json(sample))} bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Tests for admission control limits."""
+
+from aluvia_sdk import AdmissionControl
+
+
+class TestAdmissionControl:
+    """Tests for AdmissionControl counters."""
+
+    def test_total_limit(self) -> None:
+        """Test that max_connections caps slots across hosts."""
+        admission = AdmissionControl(max_connections=2)
+        assert admission.try_admit("a.example.com")
+        assert admission.try_admit("b.example.com")
+        assert not admission.try_admit("c.example.com")
+        admission.release("a.example.com")
+        assert admission.try_admit("c.example.com")
+        assert admission.get_stats()["active_connections"] == 2
+
+    def test_per_host_limit(self) -> None:
+        """Test that max_per_host caps slots for one host only."""
+        admission = AdmissionControl(max_per_host=1)
+        assert admission.try_admit("a.example.com")
+        assert not admission.try_admit("a.example.com")
+        assert admission.try_admit("b.example.com")
+
+    def test_pending_connect_limit(self) -> None:
+        """Test that max_pending_connects caps connects in progress."""
+        admission = AdmissionControl(max_pending_connects=1)
+        assert admission.try_begin_connect()
+        assert not admission.try_begin_connect()
+        assert admission.get_stats()["pending_connects"] == 1
+        admission.end_connect()
+        assert admission.try_begin_connect()
+
+    def test_client_connection_limit(self) -> None:
+        """Test that accepts_client() rejects connections at max_client_connections."""
+        admission = AdmissionControl(max_client_connections=2)
+        assert admission.accepts_client(1)
+        assert not admission.accepts_client(2)
+        assert AdmissionControl().accepts_client(10_000)
+        assert admission.get_stats()["clients_rejected"] == 1
+
+    def test_reset(self) -> None:
+        """Test that reset() zeroes every counter."""
+        admission = AdmissionControl(
+            max_connections=1, max_pending_connects=1, max_client_connections=1
+        )
+        admission.try_admit("a.example.com")
+        admission.try_begin_connect()
+        admission.accepts_client(5)
+        admission.reset()
+        assert admission.get_stats() == {
+            "active_connections": 0,
+            "pending_connects": 0,
+            "clients_rejected": 0,
+        }
@@ -24,6 +24,13 @@ class TestAluviaApi:
         assert api.api_key == "test-api-key"
         assert api.api_base_url == "https://api.aluvia.io/v1"
 
+    def test_request_features_are_opt_in(self) -> None:
+        """Test that caching, retries and rate limiting are off by default."""
+        api = AluviaApi(api_key="test-api-key")
+        assert api.response_cache is None
+        assert api.retry_policy is None
+        assert api.rate_limiter is None
+
     def test_custom_base_url(self) -> None:
         """Test custom base URL."""
         api = AluviaApi(api_key="test-api-key", api_base_url="https://custom.api")
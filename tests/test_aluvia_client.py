@@ -1,9 +1,20 @@
 """Tests for AluviaClient."""
 
+import httpx
 import pytest
+import respx
 
 from aluvia_sdk import AluviaClient, MissingApiKeyError
 
+BASE_URL = "https://api.test/v1"
+
+CONNECTION = {
+    "connection_id": 7,
+    "proxy_username": "user",
+    "proxy_password": "pass",
+    "rules": ["*.example.com"],
+}
+
 
 class TestAluviaClient:
     """Tests for AluviaClient class."""
@@ -58,3 +69,51 @@ class TestAluviaClient:
         assert hasattr(client, "api")
         assert hasattr(client.api, "account")
         assert hasattr(client.api, "geos")
+
+    def test_control_plane_has_own_client(self) -> None:
+        """Test that without HTTP/2, closing client.api does not affect polling."""
+        client = AluviaClient(api_key="test-api-key")
+        assert client.config_manager.client is None
+        assert client.config_manager.http2 is False
+
+    def test_http2_option(self) -> None:
+        """Test that http2 is passed to the API and control plane."""
+        pytest.importorskip("h2")
+        client = AluviaClient(api_key="test-api-key", http2=True)
+        assert client.api.http2 is True
+        assert client.config_manager.http2 is True
+        assert client.config_manager.client is client.api.http_client
+
+    @respx.mock
+    async def test_http2_client_closed_on_stop(self) -> None:
+        """Test that stop() closes the shared HTTP/2 client and start() reopens it."""
+        pytest.importorskip("h2")
+        respx.get(f"{BASE_URL}/account/connections/7").mock(
+            return_value=httpx.Response(200, json={"data": CONNECTION})
+        )
+        client = AluviaClient(
+            api_key="key",
+            api_base_url=BASE_URL,
+            connection_id=7,
+            local_proxy=False,
+            http2=True,
+            log_level="silent",
+        )
+
+        await client.start()
+        shared = client.api.http_client
+        await client.stop()
+        assert shared.is_closed
+
+        await client.start()
+        assert not client.api.http_client.is_closed
+        assert client.config_manager.client is client.api.http_client
+        await client.stop()
+
+    def test_unix_socket_options(self) -> None:
+        """Test validation of the Unix socket listener options."""
+        with pytest.raises(ValueError):
+            AluviaClient(api_key="test-key", unix_socket_only=True)
+        client = AluviaClient(api_key="test-key", unix_socket_path="/tmp/aluvia.sock")
+        assert client.unix_socket_path == "/tmp/aluvia.sock"
+        assert client.unix_socket_only is False
@@ -0,0 +1,123 @@
+"""Tests for the AluviaApi response cache."""
+
+import httpx
+import respx
+
+from aluvia_sdk import AluviaApi
+from aluvia_sdk.api.cache import ApiResponseCache
+
+BASE_URL = "https://api.test/v1"
+
+
+def _account_response(request: httpx.Request) -> httpx.Response:
+    """Answer with an ETag and honor If-None-Match."""
+    if request.headers.get("If-None-Match") == '"a1"':
+        return httpx.Response(304, headers={"ETag": '"a1"'})
+    return httpx.Response(
+        200, json={"success": True, "data": {"balance_gb": 5}}, headers={"ETag": '"a1"'}
+    )
+
+
+class TestApiResponseCache:
+    """Tests for ApiResponseCache class."""
+
+    def test_ttl_for(self) -> None:
+        """Test exact and pattern TTL lookups."""
+        cache = ApiResponseCache(default_ttl=1.0, ttls={"/geos": 60.0, "/account/*": 5.0})
+        assert cache.ttl_for("/geos") == 60.0
+        assert cache.ttl_for("/account/connections") == 5.0
+        assert cache.ttl_for("/account") == 1.0
+
+    def test_size_bound_evicts_least_recently_used(self) -> None:
+        """Test that the byte budget evicts the oldest entries."""
+        cache = ApiResponseCache(max_bytes=10)
+        cache.put(("GET", "/a", ""), 200, '"a"', b"12345")
+        cache.put(("GET", "/b", ""), 200, '"b"', b"12345")
+        cache.get(("GET", "/a", ""))
+        cache.put(("GET", "/c", ""), 200, '"c"', b"12345")
+        assert cache.get(("GET", "/a", "")) is not None
+        assert cache.get(("GET", "/b", "")) is None
+        assert cache.get(("GET", "/c", "")) is not None
+
+    def test_responses_without_etag_need_a_ttl(self) -> None:
+        """Test that unvalidated responses are only kept with a TTL."""
+        cache = ApiResponseCache(ttls={"/geos": 60.0})
+        cache.put(("GET", "/account", ""), 200, None, b"{}")
+        cache.put(("GET", "/geos", ""), 200, None, b"[]")
+        assert cache.get(("GET", "/account", "")) is None
+        assert cache.get(("GET", "/geos", "")) is not None
+
+    def test_invalidate_parents(self) -> None:
+        """Test that a path invalidates itself and its parent collections."""
+        cache = ApiResponseCache()
+        for path in ("/account", "/account/connections", "/account/connections/1", "/geos"):
+            cache.put(("GET", path, ""), 200, '"x"', b"{}")
+        cache.invalidate("/account/connections/1")
+        assert cache.get(("GET", "/account/connections", "")) is None
+        assert cache.get(("GET", "/account", "")) is None
+        assert cache.get(("GET", "/geos", "")) is not None
+
+
+class TestAluviaApiCaching:
+    """Tests for response caching in AluviaApi requests."""
+
+    @respx.mock
+    async def test_revalidates_with_etag(self) -> None:
+        """Test that a 304 returns the cached body."""
+        route = respx.get(f"{BASE_URL}/account").mock(side_effect=_account_response)
+        api = AluviaApi(api_key="key", api_base_url=BASE_URL, response_cache=True)
+
+        assert await api.account.get() == {"balance_gb": 5}
+        assert await api.account.get() == {"balance_gb": 5}
+        assert route.call_count == 2
+        assert route.calls[1].request.headers["If-None-Match"] == '"a1"'
+        assert api.response_cache is not None
+        assert api.response_cache.revalidations == 1
+        await api.close()
+
+    @respx.mock
+    async def test_ttl_skips_request(self) -> None:
+        """Test that fresh entries are served without a request."""
+        route = respx.get(f"{BASE_URL}/account").mock(side_effect=_account_response)
+        api = AluviaApi(
+            api_key="key",
+            api_base_url=BASE_URL,
+            response_cache=ApiResponseCache(ttls={"/account": 60.0}),
+        )
+
+        await api.account.get()
+        await api.account.get()
+        assert route.call_count == 1
+        await api.close()
+
+    @respx.mock
+    async def test_write_invalidates(self) -> None:
+        """Test that a PATCH drops the cached connection."""
+        route = respx.get(f"{BASE_URL}/account/connections/1").mock(
+            return_value=httpx.Response(200, json={"data": {"connection_id": 1}})
+        )
+        respx.patch(f"{BASE_URL}/account/connections/1").mock(
+            return_value=httpx.Response(200, json={"data": {"connection_id": 1}})
+        )
+        api = AluviaApi(
+            api_key="key",
+            api_base_url=BASE_URL,
+            response_cache=ApiResponseCache(default_ttl=60.0),
+        )
+
+        await api.account.connections.get(1)
+        await api.account.connections.patch(1, rules=["*"])
+        await api.account.connections.get(1)
+        assert route.call_count == 2
+        await api.close()
+
+    @respx.mock
+    async def test_disabled(self) -> None:
+        """Test that response_cache=False sends plain requests."""
+        route = respx.get(f"{BASE_URL}/account").mock(side_effect=_account_response)
+        api = AluviaApi(api_key="key", api_base_url=BASE_URL, response_cache=False)
+
+        await api.account.get()
+        await api.account.get()
+        assert "If-None-Match" not in route.calls[1].request.headers
+        await api.close()
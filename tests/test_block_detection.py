@@ -0,0 +1,45 @@
+"""Tests for block detection."""
+
+from aluvia_sdk.client.block_detection import BlockDetector, parse_status_code
+
+
+class TestParseStatusCode:
+    """Tests for parse_status_code function."""
+
+    def test_status_line(self) -> None:
+        """Test parsing a status line."""
+        assert parse_status_code(b"HTTP/1.1 403 Forbidden\r\n") == 403
+        assert parse_status_code(b"HTTP/1.0 200 OK\r\n\r\nbody") == 200
+
+    def test_not_a_status_line(self) -> None:
+        """Test data that is not an HTTP response."""
+        assert parse_status_code(b"\x16\x03\x01") is None
+        assert parse_status_code(b"HTTP/1.1 abc") is None
+
+
+class TestBlockDetector:
+    """Tests for BlockDetector class."""
+
+    def test_default_status_codes(self) -> None:
+        """Test that 403 and 429 are blocks by default."""
+        detector = BlockDetector()
+        assert detector.is_block_status(403)
+        assert detector.is_block_status(429)
+        assert not detector.is_block_status(200)
+
+    def test_body_signatures(self) -> None:
+        """Test case-insensitive body signature matching."""
+        detector = BlockDetector(body_signatures=["captcha", b"Access Denied"], max_body_bytes=100)
+        assert detector.matches_body(b"<title>Please solve the CAPTCHA</title>")
+        assert detector.matches_body(b"access denied")
+        assert not detector.matches_body(b"<html>welcome</html>")
+        assert not detector.matches_body(b"x" * 100 + b"captcha")
+
+    def test_does_not_persist_by_default(self) -> None:
+        """Test that promotions stay local unless persist is set."""
+        assert not BlockDetector().persist
+        assert BlockDetector(persist=True).persist
+
+    def test_no_signatures(self) -> None:
+        """Test that bodies never match without signatures."""
+        assert not BlockDetector().matches_body(b"captcha")
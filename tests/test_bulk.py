@@ -0,0 +1,87 @@
+"""Tests for bulk connection operations."""
+
+import asyncio
+import json
+
+import httpx
+import respx
+
+from aluvia_sdk import AluviaApi, ApiError
+
+BASE_URL = "https://api.test/v1"
+
+
+def make_api() -> AluviaApi:
+    """Build an API client without rate limiting or retries."""
+    return AluviaApi(api_key="key", api_base_url=BASE_URL, rate_limiter=False, retry_policy=False)
+
+
+class TestBulkConnections:
+    """Tests for create_many and delete_many."""
+
+    @respx.mock
+    async def test_create_many_bounded(self) -> None:
+        """Test that creates run with bounded concurrency and report errors per item."""
+        running = 0
+        peak = 0
+
+        async def create(request: httpx.Request) -> httpx.Response:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.005)
+            running -= 1
+            description = json.loads(request.content)["description"]
+            if description == "agent-3":
+                return httpx.Response(400, json={"success": False, "error": {"code": "bad"}})
+            return httpx.Response(201, json={"data": {"description": description}})
+
+        respx.post(f"{BASE_URL}/account/connections").mock(side_effect=create)
+        api = make_api()
+
+        specs = ({"description": f"agent-{i}"} for i in range(10))
+        results = [r async for r in api.account.connections.create_many(specs, concurrency=3)]
+
+        assert peak == 3
+        assert sorted(r["index"] for r in results) == list(range(10))
+        failed = [r for r in results if r["error"] is not None]
+        assert len(failed) == 1
+        assert failed[0]["item"] == {"description": "agent-3"}
+        assert isinstance(failed[0]["error"], ApiError)
+        assert all(
+            r["result"]["description"] == r["item"]["description"] for r in results if r["result"]
+        )
+        await api.close()
+
+    @respx.mock
+    async def test_delete_many(self) -> None:
+        """Test deleting several connections."""
+        route = respx.delete(url__regex=rf"{BASE_URL}/account/connections/\d+").mock(
+            return_value=httpx.Response(200, json={"data": {"deleted": True}})
+        )
+        api = make_api()
+
+        results = [r async for r in api.account.connections.delete_many([1, 2, 3])]
+        assert route.call_count == 3
+        assert all(r["result"] == {"deleted": True} for r in results)
+        await api.close()
+
+    @respx.mock
+    async def test_early_exit_cancels_pending(self) -> None:
+        """Test that breaking out of the iterator stops further requests."""
+
+        async def slow(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"data": {"deleted": True}})
+
+        route = respx.delete(url__regex=rf"{BASE_URL}/account/connections/\d+").mock(
+            side_effect=slow
+        )
+        api = make_api()
+
+        iterator = api.account.connections.delete_many(range(100), concurrency=2)
+        async for _ in iterator:
+            break
+        await iterator.aclose()
+        assert route.call_count <= 4
+        await api.close()
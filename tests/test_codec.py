@@ -0,0 +1,107 @@
+"""Tests for the JSON codec."""
+
+import json
+import os
+from typing import Iterator
+
+import httpx
+import pytest
+import respx
+
+from aluvia_sdk import AluviaApi, codec
+from aluvia_sdk.api.models import GeoRecord
+from aluvia_sdk.client import proxy_server
+
+BASE_URL = "https://api.test/v1"
+
+
+def available_backends() -> Iterator[str]:
+    """Names of the installed backends."""
+    for name in ("stdlib", "orjson", "msgspec"):
+        try:
+            codec.set_codec(name)
+        except ImportError:
+            continue
+        yield name
+    codec.set_codec(None)
+
+
+@pytest.fixture(params=list(available_backends()))
+def backend(request: pytest.FixtureRequest) -> Iterator[codec.JsonCodec]:
+    """Select each installed backend in turn."""
+    yield codec.set_codec(request.param)
+    codec.set_codec(None)
+
+
+class TestJsonCodec:
+    """Tests for JSON codec backends."""
+
+    def test_round_trip(self, backend: codec.JsonCodec) -> None:
+        """Test that all backends agree on encoding and decoding."""
+        value = {"rules": ["*.example.com", "!ads.*"], "ts": 1.5, "n": None, "é": [1, 2**70]}
+        encoded = codec.dumps(value)
+        assert isinstance(encoded, bytes)
+        assert b" " not in encoded
+        assert codec.loads(encoded) == value
+        assert codec.loads(encoded.decode("utf-8")) == value
+
+    def test_records_and_tuples(self, backend: codec.JsonCodec) -> None:
+        """Test that API records and tuples encode as objects and arrays."""
+        record = GeoRecord.from_json({"code": "us", "name": "United States"})
+        assert codec.loads(codec.dumps({"geo": record, "pair": (1, 2)})) == {
+            "geo": {"code": "us", "name": "United States"},
+            "pair": [1, 2],
+        }
+
+    def test_errors(self, backend: codec.JsonCodec) -> None:
+        """Test that failures raise ValueError and TypeError."""
+        with pytest.raises(ValueError):
+            codec.loads(b"{")
+        with pytest.raises(TypeError):
+            codec.dumps(object())
+
+    def test_big_integers(self, backend: codec.JsonCodec) -> None:
+        """Test that integers beyond 64 bits encode, also inside records and tuples."""
+        record = GeoRecord.from_json({"code": "us", "id": -(2**63) - 1})
+        value = {"geo": record, "pair": (2**64, 1)}
+        # Decoded with the stdlib, since orjson decodes such integers as floats
+        assert json.loads(codec.dumps(value)) == {
+            "geo": {"code": "us", "id": -(2**63) - 1},
+            "pair": [2**64, 1],
+        }
+        with pytest.raises(TypeError):
+            codec.dumps({"n": 2**70, "x": object()})
+
+    def test_set_codec(self) -> None:
+        """Test selecting backends by name."""
+        with pytest.raises(ValueError):
+            codec.set_codec("yaml")
+        assert codec.set_codec("stdlib").name == "stdlib"
+        assert codec.set_codec(None) is codec.get_codec()
+
+    def test_rules_snapshot(self, backend: codec.JsonCodec, tmp_path: os.PathLike) -> None:
+        """Test the Windows rules snapshot round trip."""
+        path = os.path.join(tmp_path, "rules.json")
+        original = proxy_server._RULES_PATH
+        proxy_server._RULES_PATH = path
+        try:
+            proxy_server._last_check = 0.0
+            proxy_server._rules_mtime = 0.0
+            proxy_server._write_rules_atomic(["*.example.com"])
+            assert proxy_server._load_rules_cached(ttl_seconds=0) == ["*.example.com"]
+        finally:
+            proxy_server._RULES_PATH = original
+            proxy_server._rules_cache = []
+
+    @respx.mock
+    async def test_request_body(self, backend: codec.JsonCodec) -> None:
+        """Test that request bodies are encoded by the codec."""
+        route = respx.post(f"{BASE_URL}/account/connections").mock(
+            return_value=httpx.Response(201, json={"data": {"connection_id": 1}})
+        )
+        api = AluviaApi(api_key="key", api_base_url=BASE_URL)
+        connection = await api.account.connections.create(rules=["*"])
+        assert connection["connection_id"] == 1
+        assert route.calls[0].request.content == b'{"rules":["*"]}'
+        assert route.calls[0].request.headers["Content-Type"] == "application/json"
+        await api.close()
@@ -0,0 +1,129 @@
+"""Tests for gateway endpoint selection and health checking."""
+
+import socket
+import time
+from typing import Iterator
+
+import pytest
+
+from aluvia_sdk import GatewayPool
+from aluvia_sdk.client.gateway_pool import parse_endpoint
+
+
+@pytest.fixture
+def listener() -> Iterator[int]:
+    """Port of a listening socket."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        yield sock.getsockname()[1]
+
+
+def closed_port() -> int:
+    """A local port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+class TestParseEndpoint:
+    """Tests for endpoint parsing."""
+
+    def test_formats(self) -> None:
+        """Test host:port strings, IPv6 brackets and tuples."""
+        assert parse_endpoint("gw.example.com:8080") == ("gw.example.com", 8080)
+        assert parse_endpoint("[::1]:8080") == ("::1", 8080)
+        assert parse_endpoint(("gw", "8443")) == ("gw", 8443)
+        with pytest.raises(ValueError):
+            parse_endpoint("gw.example.com")
+
+
+class TestGatewayPool:
+    """Tests for GatewayPool class."""
+
+    def test_validation(self) -> None:
+        """Test that empty pools and unknown strategies are rejected."""
+        with pytest.raises(ValueError):
+            GatewayPool([])
+        with pytest.raises(ValueError):
+            GatewayPool(["a:1"], strategy="random")
+
+    def test_unmeasured_then_fastest(self) -> None:
+        """Test that unmeasured endpoints go first, then the lowest EWMA wins."""
+        pool = GatewayPool(["a:1", "b:1"], probe_interval=None)
+        a, b = pool.endpoints
+        pool.record_success(a, 0.050)
+        assert pool.select() is b
+        pool.record_success(b, 0.200)
+        assert pool.select() is a
+
+        # Moving average: one fast connect does not erase b's history
+        pool.record_success(b, 0.010)
+        assert b.ewma == pytest.approx(0.3 * 0.010 + 0.7 * 0.200)
+
+    def test_ewma_weighs_pending(self) -> None:
+        """Test that a fast but busy endpoint loses to an idle slower one."""
+        pool = GatewayPool(["a:1", "b:1"], probe_interval=None)
+        a, b = pool.endpoints
+        pool.record_success(a, 0.010)
+        pool.record_success(b, 0.025)
+        for _ in range(3):
+            pool.begin(a)
+        assert pool.select() is b
+        for _ in range(3):
+            pool.end(a)
+        assert pool.select() is a
+
+    def test_least_pending(self) -> None:
+        """Test the least-pending strategy."""
+        pool = GatewayPool(["a:1", "b:1"], strategy="least_pending", probe_interval=None)
+        a, b = pool.endpoints
+        pool.record_success(a, 0.010)
+        pool.record_success(b, 0.500)
+        pool.begin(a)
+        assert pool.select() is b
+
+    def test_passive_failures_and_cooldown(self) -> None:
+        """Test that repeated failures take an endpoint out until it recovers."""
+        pool = GatewayPool(["a:1", "b:1"], probe_interval=None, failure_threshold=2, cooldown=60)
+        a, b = pool.endpoints
+        pool.record_success(b, 1.0)
+        pool.record_failure(a)
+        assert pool.select() is a  # Still up after one failure
+        pool.record_failure(a)
+        assert pool.select() is b
+        assert pool.select(exclude=[b]) is a  # Retried when nothing else is left
+        assert pool.select(exclude=[a, b]) is None
+
+        pool.record_failure(b)
+        pool.record_failure(b)
+        assert b.down_until > a.down_until
+        assert pool.select() is a  # All down: the one due back first
+
+        pool.record_success(a, 0.1)
+        assert a.is_up(time.monotonic()) and a.failures == 0
+
+    def test_probe(self, listener: int) -> None:
+        """Test that active probes measure live endpoints and mark dead ones."""
+        pool = GatewayPool(
+            [("127.0.0.1", listener), ("127.0.0.1", closed_port())],
+            probe_interval=None,
+            failure_threshold=1,
+        )
+        pool.probe()
+        live, dead = pool.get_stats()
+        assert live["up"] and live["connect_ms"] is not None
+        assert not dead["up"] and dead["failures"] == 1
+
+    def test_probe_thread(self, listener: int) -> None:
+        """Test that ensure_probing() starts one probe thread per process."""
+        pool = GatewayPool([("127.0.0.1", listener)], probe_interval=0.01)
+        pool.ensure_probing()
+        pool.ensure_probing()
+        try:
+            deadline = time.monotonic() + 2
+            while pool.endpoints[0].ewma is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert pool.endpoints[0].ewma is not None
+        finally:
+            pool.stop_probing()
@@ -0,0 +1,79 @@
+"""Tests for the geo catalogue."""
+
+from typing import Iterator
+
+import httpx
+import pytest
+import respx
+
+from aluvia_sdk import AluviaApi, AluviaClient
+from aluvia_sdk.api import geos
+from aluvia_sdk.api.geos import GeoCatalog
+from aluvia_sdk.errors import ApiError
+
+BASE_URL = "https://api.test/v1"
+GEOS = {"success": True, "data": [{"code": "us_ca", "name": "California"}, {"code": "gb"}]}
+
+
+@pytest.fixture(autouse=True)
+def clear_catalogs() -> Iterator[None]:
+    """Isolate the process-wide catalogue between tests."""
+    geos._catalogs.clear()
+    yield
+    geos._catalogs.clear()
+
+
+class TestGeoCatalog:
+    """Tests for GeoCatalog class."""
+
+    def test_lookup_by_code(self) -> None:
+        """Test case-insensitive lookups and validation."""
+        catalog = GeoCatalog([{"code": "us_ca", "name": "California"}, {"name": "no code"}])
+        assert catalog.get("US_CA") == {"code": "us_ca", "name": "California"}
+        assert catalog.validate(" us_ca ")
+        assert not catalog.validate("fr")
+        assert catalog.codes == ["us_ca"]
+
+
+class TestGeosApi:
+    """Tests for GeosApi caching."""
+
+    @respx.mock
+    async def test_catalogue_is_shared_across_instances(self) -> None:
+        """Test that a second AluviaApi reuses the fetched catalogue."""
+        route = respx.get(f"{BASE_URL}/geos").mock(return_value=httpx.Response(200, json=GEOS))
+        first = AluviaApi(api_key="a", api_base_url=BASE_URL)
+        second = AluviaApi(api_key="b", api_base_url=BASE_URL)
+
+        assert len(await first.geos.list()) == 2
+        assert len(await second.geos.list()) == 2
+        assert route.call_count == 1
+        assert second.geos.validate("gb") is True
+
+        await second.geos.list(refresh=True)
+        assert route.call_count == 2
+        await first.close()
+        await second.close()
+
+    @respx.mock
+    async def test_ttl_zero_disables_caching(self) -> None:
+        """Test that geos_ttl=0 fetches every time."""
+        route = respx.get(f"{BASE_URL}/geos").mock(return_value=httpx.Response(200, json=GEOS))
+        api = AluviaApi(api_key="a", api_base_url=BASE_URL, geos_ttl=0, response_cache=False)
+
+        await api.geos.list()
+        await api.geos.list()
+        assert route.call_count == 2
+        assert api.geos.validate("gb") is None
+        await api.close()
+
+    @respx.mock
+    async def test_update_target_geo_validates_offline(self) -> None:
+        """Test that unknown codes are rejected from the cached catalogue."""
+        respx.get(f"{BASE_URL}/geos").mock(return_value=httpx.Response(200, json=GEOS))
+        client = AluviaClient(api_key="a", api_base_url=BASE_URL, local_proxy=False)
+        await client.api.geos.catalog()
+
+        with pytest.raises(ApiError, match="Unknown target_geo"):
+            await client.update_target_geo("xx_invalid")
+        await client.api.close()
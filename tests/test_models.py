@@ -0,0 +1,117 @@
+"""Tests for API response models."""
+
+import copy
+import json
+import pickle
+
+import httpx
+import pytest
+import respx
+
+from aluvia_sdk import AluviaApi
+from aluvia_sdk.api.models import ConnectionRecord, GeoRecord
+from aluvia_sdk.client.config_manager import RawProxyConfig
+
+BASE_URL = "https://api.test/v1"
+
+CONNECTION = {
+    "connection_id": 7,
+    "proxy_username": "user",
+    "proxy_password": "pass",
+    "rules": ["*.example.com"],
+    "session_id": None,
+    "created_at": "2024-01-01",
+}
+
+
+class TestRecord:
+    """Tests for Record models."""
+
+    def test_attributes_and_mapping_view(self) -> None:
+        """Test attribute access and dict-compatible reads."""
+        record = ConnectionRecord.from_json(CONNECTION)
+        assert record.connection_id == 7
+        assert record.target_geo is None
+        assert record["proxy_username"] == "user"
+        assert record["created_at"] == "2024-01-01"
+        assert record.get("target_geo", "none") == "none"
+        assert "session_id" in record and "target_geo" not in record
+        assert record == CONNECTION
+        assert record.to_dict() == CONNECTION
+        assert list(record) == list(CONNECTION)
+        with pytest.raises(KeyError):
+            record["target_geo"]
+
+    def test_immutable_and_compact(self) -> None:
+        """Test that records reject writes and have no instance dict."""
+        record = ConnectionRecord.from_json(CONNECTION)
+        with pytest.raises(AttributeError):
+            record.rules = []  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            record["rules"] = []  # type: ignore[index]
+        assert not hasattr(record, "__dict__")
+        assert not hasattr(RawProxyConfig("http", "h", 1, "u", "p"), "__dict__")
+
+    def test_shapes_are_shared(self) -> None:
+        """Test that records with the same keys share one key tuple."""
+        first = GeoRecord.from_json({"code": "us", "name": "US"})
+        second = GeoRecord.from_json({"code": "de", "name": "Germany"})
+        assert first._keys is second._keys
+        assert first._extra is None
+
+    def test_copy_and_pickle(self) -> None:
+        """Test that records survive copying and pickling."""
+        record = ConnectionRecord.from_json(CONNECTION)
+        assert copy.deepcopy(record) == record
+        assert pickle.loads(pickle.dumps(record)) == record
+
+    def test_from_json_list(self) -> None:
+        """Test bulk construction skips non-objects."""
+        records = GeoRecord.from_json_list([{"code": "us"}, "bad", {"code": "de"}])
+        assert [r.code for r in records] == ["us", "de"]
+        assert GeoRecord.from_json_list(None) == []
+        with pytest.raises(TypeError):
+            GeoRecord.from_json("us")  # type: ignore[arg-type]
+
+
+class TestApiRecords:
+    """Tests for records returned by AluviaApi."""
+
+    @respx.mock
+    async def test_dicts_by_default(self) -> None:
+        """Test that endpoints return plain dicts unless records are enabled."""
+        respx.get(f"{BASE_URL}/account/connections/7").mock(
+            return_value=httpx.Response(200, json={"success": True, "data": CONNECTION})
+        )
+        respx.get(f"{BASE_URL}/geos").mock(
+            return_value=httpx.Response(200, json={"success": True, "data": [{"code": "us"}]})
+        )
+        api = AluviaApi(api_key="key", api_base_url=BASE_URL, geos_ttl=0)
+
+        connection = await api.account.connections.get(7)
+        assert isinstance(connection, dict)
+        connection["description"] = "edited"
+        assert json.loads(json.dumps(connection))["description"] == "edited"
+        geos = await api.geos.list()
+        assert geos == [{"code": "us"}] and isinstance(geos[0], dict)
+        await api.close()
+
+    @respx.mock
+    async def test_connections_return_records(self) -> None:
+        """Test that connection endpoints return ConnectionRecord when enabled."""
+        respx.get(f"{BASE_URL}/account/connections").mock(
+            return_value=httpx.Response(200, json={"success": True, "data": [CONNECTION]})
+        )
+        respx.get(f"{BASE_URL}/account/connections/7").mock(
+            return_value=httpx.Response(200, json={"success": True, "data": CONNECTION})
+        )
+        api = AluviaApi(api_key="key", api_base_url=BASE_URL, records=True)
+
+        listed = await api.account.connections.list()
+        assert isinstance(listed[0], ConnectionRecord)
+        fetched = await api.account.connections.get(7)
+        assert fetched.proxy_password == "pass"
+        streamed = [c async for c in api.account.iter_connections()]
+        assert streamed == [CONNECTION]
+        assert isinstance(streamed[0], ConnectionRecord)
+        await api.close()
@@ -0,0 +1,137 @@
+"""Tests for the Playwright browser-context pool."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from aluvia_sdk import BrowserContextPool
+
+
+class FakePage:
+    """Stand-in for a Playwright page."""
+
+    def __init__(self, context: "FakeContext") -> None:
+        self.context = context
+
+    async def close(self) -> None:
+        self.context.pages.remove(self)
+
+
+class FakeContext:
+    """Stand-in for a Playwright browser context."""
+
+    def __init__(self, options: Dict[str, Any]) -> None:
+        self.options = options
+        self.pages: List[FakePage] = []
+        self.cookies_cleared = 0
+        self.closed = False
+
+    async def new_page(self) -> FakePage:
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def clear_cookies(self) -> None:
+        self.cookies_cleared += 1
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeBrowser:
+    """Stand-in for a Playwright browser that records its contexts."""
+
+    def __init__(self) -> None:
+        self.contexts: List[FakeContext] = []
+
+    async def new_context(self, **options: Any) -> FakeContext:
+        context = FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+
+class FakeConnection:
+    """Connection whose proxy settings change like rotated gateway credentials."""
+
+    def __init__(self) -> None:
+        self.password = "one"
+
+    def as_playwright(self) -> Dict[str, str]:
+        return {"server": "http://127.0.0.1:8080", "username": "u", "password": self.password}
+
+
+async def make_pool(**kwargs: Any) -> BrowserContextPool:
+    """Started pool over a FakeBrowser."""
+    pool = BrowserContextPool(FakeConnection(), browser=FakeBrowser(), log_level="silent", **kwargs)
+    return await pool.start()
+
+
+class TestBrowserContextPool:
+    """Tests for BrowserContextPool class."""
+
+    async def test_warm_contexts_with_proxy(self) -> None:
+        """Test that start() opens warm contexts with the connection's proxy."""
+        pool = await make_pool(size=3, context_options={"locale": "en-US"})
+        browser = pool._browser
+        assert len(browser.contexts) == 3
+        assert browser.contexts[0].options["proxy"]["password"] == "one"
+        assert browser.contexts[0].options["locale"] == "en-US"
+        assert pool.get_stats()["idle"] == 3
+
+    async def test_checkout_and_checkin(self) -> None:
+        """Test that released contexts are reset and reused."""
+        pool = await make_pool(size=1)
+        async with pool.context() as context:
+            await context.new_page()
+            assert pool.get_stats()["in_use"] == 1
+        assert context.pages == [] and context.cookies_cleared == 1
+        async with pool.context() as again:
+            assert again is context
+        assert pool.get_stats()["contexts_created"] == 1
+
+    async def test_max_uses_recycling(self) -> None:
+        """Test that a context is replaced after max_uses checkouts."""
+        pool = await make_pool(size=1, max_uses=2)
+        first = await pool.acquire()
+        await pool.release(first)
+        assert await pool.acquire() is first
+        pool.connection.password = "two"
+        await pool.release(first)
+        await asyncio.sleep(0)  # Let the replacement open
+
+        assert first.closed
+        replacement = await pool.acquire()
+        assert replacement is not first
+        assert replacement.options["proxy"]["password"] == "two"
+        assert pool.get_stats()["contexts_recycled"] == 1
+
+    async def test_discard_on_error(self) -> None:
+        """Test that a context is discarded when its block raises."""
+        pool = await make_pool(size=1)
+        with pytest.raises(RuntimeError):
+            async with pool.context() as context:
+                raise RuntimeError("page crashed")
+        assert context.closed
+
+    async def test_concurrency_limit(self) -> None:
+        """Test that checkouts beyond max_concurrency wait."""
+        pool = await make_pool(size=1, max_concurrency=1)
+        context = await pool.acquire()
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.acquire(timeout=0.05)
+        waiter = asyncio.ensure_future(pool.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await pool.release(context)
+        assert await waiter is context
+
+    async def test_close(self) -> None:
+        """Test that close() closes idle contexts but not a browser passed in."""
+        pool = await make_pool(size=2)
+        contexts = list(pool._browser.contexts)
+        await pool.close()
+        assert all(context.closed for context in contexts)
+        assert pool._browser is not None
+        with pytest.raises(RuntimeError):
+            await pool.acquire()
@@ -0,0 +1,151 @@
+"""Tests for the API rate limiter."""
+
+import asyncio
+import time
+from typing import List
+
+import httpx
+import respx
+
+from aluvia_sdk import AluviaApi
+from aluvia_sdk.api.rate_limit import RateLimiter
+from aluvia_sdk.api.request import request_core
+from aluvia_sdk.api.retry import RetryPolicy
+
+BASE_URL = "https://api.test/v1"
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter class."""
+
+    async def test_rate_is_enforced(self) -> None:
+        """Test that requests beyond the burst wait for tokens."""
+        limiter = RateLimiter(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            async with limiter.slot():
+                pass
+        assert time.monotonic() - start >= 0.09
+
+    async def test_concurrency_cap(self) -> None:
+        """Test that no more than max_concurrency requests run at once."""
+        limiter = RateLimiter(rate=1000, burst=100, max_concurrency=3)
+        running = 0
+        peak = 0
+
+        async def request() -> None:
+            nonlocal running, peak
+            async with limiter.slot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(request() for _ in range(12)))
+        assert peak == 3
+
+    async def test_fifo_order(self) -> None:
+        """Test that waiters are served in arrival order."""
+        limiter = RateLimiter(rate=200, burst=1, max_concurrency=100)
+        order: List[int] = []
+
+        async def request(i: int) -> None:
+            async with limiter.slot():
+                order.append(i)
+
+        await asyncio.gather(*(request(i) for i in range(10)))
+        assert order == list(range(10))
+
+    def test_shared_across_event_loops(self) -> None:
+        """Test that one limiter serves requests from successive event loops."""
+        limiter = RateLimiter(rate=1000, burst=100, max_concurrency=2)
+
+        async def request() -> None:
+            async with limiter.slot():
+                await asyncio.sleep(0.001)
+
+        async def burst() -> None:
+            await asyncio.gather(*(request() for _ in range(4)))
+
+        asyncio.run(burst())
+        asyncio.run(burst())
+
+    def test_429_backs_off(self) -> None:
+        """Test that a 429 halves the rate and pauses requests."""
+        limiter = RateLimiter(rate=40, min_rate=5)
+        limiter.observe(429, {"Retry-After": "2"})
+        assert limiter.rate == 20
+        assert limiter.throttled == 1
+        assert limiter._blocked_until > time.monotonic() + 1
+        for _ in range(5):
+            limiter.observe(429, {})
+        assert limiter.rate == 5
+
+    def test_rate_limit_headers(self) -> None:
+        """Test that rate-limit headers cap the rate and exhaustion pauses."""
+        limiter = RateLimiter(rate=40)
+        limiter.observe(200, {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "2"})
+        assert limiter.rate == 5
+        limiter.observe(200, {"RateLimit-Remaining": "0", "RateLimit-Reset": "3"})
+        assert limiter._blocked_until > time.monotonic() + 2
+
+    def test_recovers_after_success(self) -> None:
+        """Test additive increase up to the configured rate."""
+        limiter = RateLimiter(rate=10, increase=2)
+        limiter.observe(429, {})
+        for _ in range(10):
+            limiter.observe(200, {})
+        assert limiter.rate == 10
+
+
+class TestAluviaApiRateLimiting:
+    """Tests for rate limiting in AluviaApi."""
+
+    @respx.mock
+    async def test_bulk_requests_are_capped(self) -> None:
+        """Test that concurrent creates respect the concurrency cap."""
+        running = 0
+        peak = 0
+
+        async def create(request: httpx.Request) -> httpx.Response:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.005)
+            running -= 1
+            return httpx.Response(201, json={"data": {"connection_id": 1}})
+
+        respx.post(f"{BASE_URL}/account/connections").mock(side_effect=create)
+        api = AluviaApi(
+            api_key="key",
+            api_base_url=BASE_URL,
+            rate_limiter=RateLimiter(rate=1000, burst=1000, max_concurrency=4),
+        )
+        results = await asyncio.gather(*(api.account.connections.create() for _ in range(20)))
+        assert len(results) == 20
+        assert peak <= 4
+        await api.close()
+
+    @respx.mock
+    async def test_retry_backoff_releases_slot(self) -> None:
+        """Test that a request backing off after a transport error frees its slot."""
+        respx.get(f"{BASE_URL}/down").mock(side_effect=httpx.ConnectError("down"))
+        respx.get(f"{BASE_URL}/up").mock(return_value=httpx.Response(200, json={"ok": True}))
+        limiter = RateLimiter(rate=1000, burst=1000, max_concurrency=1)
+        retry = RetryPolicy(max_attempts=2, base_delay=0.5)
+
+        async with httpx.AsyncClient() as client:
+            failing = asyncio.ensure_future(
+                request_core(
+                    BASE_URL, "key", "GET", "/down", client=client, retry=retry, limiter=limiter
+                )
+            )
+            await asyncio.sleep(0.05)
+            # Served while the first request sleeps before its retry
+            result = await asyncio.wait_for(
+                request_core(BASE_URL, "key", "GET", "/up", client=client, limiter=limiter),
+                timeout=0.3,
+            )
+            assert result["body"] == {"ok": True}
+            assert not failing.done()
+            failing.cancel()
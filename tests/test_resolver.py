@@ -0,0 +1,155 @@
+"""Tests for DNS caching and happy eyeballs."""
+
+import socket
+from typing import Any, Iterator, List
+
+import pytest
+
+from aluvia_sdk.client import resolver
+from aluvia_sdk.client.resolver import (
+    DnsCache,
+    HappyEyeballs,
+    connect_in_order,
+    interleave_addresses,
+    is_ip_address,
+    sort_addresses,
+)
+
+
+@pytest.fixture
+def lookups(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    """Replace the system resolver with a counting stub."""
+    calls: List[str] = []
+
+    def fake_getaddrinfo(host: str, port: int, *args: Any, **kwargs: Any) -> List[Any]:
+        calls.append(host)
+        if host == "missing.example":
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return [
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2001:db8::1", port, 0, 0)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", port)),
+        ]
+
+    monkeypatch.setattr(resolver, "_resolve_with_dnspython", lambda host: None)
+    monkeypatch.setattr(resolver.socket, "getaddrinfo", fake_getaddrinfo)
+    return calls
+
+
+@pytest.fixture
+def listener() -> Iterator[socket.socket]:
+    """TCP listener on 127.0.0.1."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(4)
+    yield sock
+    sock.close()
+
+
+class TestDnsCache:
+    """Tests for DnsCache class."""
+
+    def test_positive_answers_are_cached(self, lookups: List[str]) -> None:
+        """Test that repeated lookups hit the cache."""
+        cache = DnsCache()
+        first = cache.resolve("example.com", 443)
+        assert first == [(socket.AF_INET6, "2001:db8::1"), (socket.AF_INET, "192.0.2.1")]
+        assert cache.resolve("example.com", 443) == first
+        assert lookups == ["example.com"]
+        assert cache.is_cached("example.com")
+
+    def test_failures_are_cached(self, lookups: List[str]) -> None:
+        """Test negative caching of failed lookups."""
+        cache = DnsCache(negative_ttl=60)
+        for _ in range(3):
+            with pytest.raises(socket.gaierror):
+                cache.resolve("missing.example", 80)
+        assert lookups == ["missing.example"]
+
+    def test_expired_entries_are_resolved_again(self, lookups: List[str]) -> None:
+        """Test that entries expire after their TTL."""
+        cache = DnsCache(default_ttl=0, min_ttl=0)
+        cache.resolve("example.com", 80)
+        cache.resolve("example.com", 80)
+        assert lookups == ["example.com", "example.com"]
+
+    def test_max_entries(self, lookups: List[str]) -> None:
+        """Test that the oldest entry is evicted when the cache is full."""
+        cache = DnsCache(max_entries=2)
+        for host in ("a.example", "b.example", "c.example"):
+            cache.resolve(host, 80)
+        assert not cache.is_cached("a.example")
+        assert cache.is_cached("c.example")
+
+
+class TestHappyEyeballs:
+    """Tests for HappyEyeballs class."""
+
+    def test_interleave_addresses(self) -> None:
+        """Test that families alternate starting with IPv6."""
+        addresses = [
+            (socket.AF_INET, "192.0.2.1"),
+            (socket.AF_INET, "192.0.2.2"),
+            (socket.AF_INET6, "2001:db8::1"),
+        ]
+        assert interleave_addresses(addresses) == [
+            (socket.AF_INET6, "2001:db8::1"),
+            (socket.AF_INET, "192.0.2.1"),
+            (socket.AF_INET, "192.0.2.2"),
+        ]
+
+    def test_race_skips_unreachable_address(self, listener: socket.socket) -> None:
+        """Test that a refused address loses to a listening one, whose socket is returned."""
+        port = listener.getsockname()[1]
+        eyeballs = HappyEyeballs(attempt_delay=0.05, connect_timeout=2.0)
+        # 127.0.0.2 is loopback on Linux but nothing listens there
+        addresses = [(socket.AF_INET, "127.0.0.2"), (socket.AF_INET, "127.0.0.1")]
+        for _ in range(2):
+            conn = eyeballs.connect("local.test", port, addresses)
+            try:
+                assert conn.getpeername() == ("127.0.0.1", port)
+                accepted, _ = listener.accept()
+                accepted.close()
+            finally:
+                conn.close()
+        # The winner is remembered and tried first
+        assert eyeballs._winners[("local.test", port)][0] == "127.0.0.1"
+
+    def test_race_without_winner_raises(self) -> None:
+        """Test that a race where every attempt fails raises instead of guessing."""
+        eyeballs = HappyEyeballs(attempt_delay=0.05, connect_timeout=2.0)
+        addresses = [(socket.AF_INET, "127.0.0.2"), (socket.AF_INET, "127.0.0.3")]
+        with pytest.raises(OSError):
+            eyeballs.connect("local.test", 9, addresses)
+        with pytest.raises(OSError):
+            eyeballs.connect("local.test", 9, [])
+
+    def test_connect_in_order(self, listener: socket.socket) -> None:
+        """Test that sequential connects move past an unreachable first address."""
+        port = listener.getsockname()[1]
+        addresses = [(socket.AF_INET, "127.0.0.2"), (socket.AF_INET, "127.0.0.1")]
+        with connect_in_order(addresses, port, timeout=2.0) as conn:
+            assert conn.getpeername() == ("127.0.0.1", port)
+        with pytest.raises(OSError):
+            connect_in_order(addresses[:1], port, timeout=2.0)
+
+    def test_sort_addresses(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that addresses without a route move to the back, keeping their order."""
+        monkeypatch.setattr(resolver, "_has_route", lambda family, ip: family == socket.AF_INET)
+        addresses = [
+            (socket.AF_INET6, "2001:db8::1"),
+            (socket.AF_INET, "192.0.2.1"),
+            (socket.AF_INET6, "2001:db8::2"),
+            (socket.AF_INET, "192.0.2.2"),
+        ]
+        assert sort_addresses(addresses) == [
+            (socket.AF_INET, "192.0.2.1"),
+            (socket.AF_INET, "192.0.2.2"),
+            (socket.AF_INET6, "2001:db8::1"),
+            (socket.AF_INET6, "2001:db8::2"),
+        ]
+
+    def test_is_ip_address(self) -> None:
+        """Test IP literal detection."""
+        assert is_ip_address("127.0.0.1")
+        assert is_ip_address("[::1]")
+        assert not is_ip_address("example.com")
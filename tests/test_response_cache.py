@@ -0,0 +1,100 @@
+"""Tests for the local response cache."""
+
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from aluvia_sdk.client.response_cache import CacheEntry, ResponseCache, parse_cache_control
+
+URL = "http://example.com:80/app.js"
+
+
+def _store(
+    cache: ResponseCache,
+    headers: List[Tuple[bytes, bytes]],
+    request_headers: Optional[Dict[bytes, bytes]] = None,
+) -> Optional[CacheEntry]:
+    return cache.store(URL, request_headers or {}, 200, b"OK", headers, b"console.log(1)")
+
+
+class TestParseCacheControl:
+    """Tests for parse_cache_control function."""
+
+    def test_directives(self) -> None:
+        """Test parsing directives with and without arguments."""
+        cc = parse_cache_control(b'public, Max-Age=60, no-cache="set-cookie"')
+        assert cc == {"public": None, "max-age": "60", "no-cache": "set-cookie"}
+
+    def test_empty(self) -> None:
+        """Test empty header."""
+        assert parse_cache_control(None) == {}
+
+
+class TestResponseCache:
+    """Tests for ResponseCache class."""
+
+    def test_fresh_hit(self) -> None:
+        """Test that a max-age response is served while fresh."""
+        cache = ResponseCache()
+        _store(cache, [(b"Cache-Control", b"max-age=60")])
+        entry = cache.lookup(URL, {})
+        assert entry is not None
+        assert entry.is_fresh(time.time(), {})
+        assert not entry.is_fresh(time.time() + 61, {})
+        assert not entry.is_fresh(time.time(), {"no-cache": None})
+
+    def test_not_stored(self) -> None:
+        """Test responses that must not be cached."""
+        cache = ResponseCache()
+        assert _store(cache, [(b"Cache-Control", b"no-store, max-age=60")]) is None
+        assert _store(cache, [(b"Cache-Control", b"max-age=60"), (b"Set-Cookie", b"a=1")]) is None
+        assert _store(cache, [(b"Cache-Control", b"max-age=60"), (b"Vary", b"*")]) is None
+        assert _store(cache, []) is None  # no freshness and no validator
+        assert _store(cache, [(b"ETag", b'"v1"')], {b"authorization": b"Bearer x"}) is None
+        assert cache.lookup(URL, {}) is None
+
+    def test_validator_only(self) -> None:
+        """Test that a response with only an ETag is stored for revalidation."""
+        cache = ResponseCache()
+        entry = _store(cache, [(b"ETag", b'"v1"')])
+        assert entry is not None
+        assert not entry.is_fresh(time.time(), {})
+        assert entry.is_not_modified_for({b"if-none-match": b'W/"v1"'})
+
+    def test_vary(self) -> None:
+        """Test that Vary selects between stored variants."""
+        cache = ResponseCache()
+        headers = [(b"Cache-Control", b"max-age=60"), (b"Vary", b"Accept-Encoding")]
+        _store(cache, headers, {b"accept-encoding": b"gzip"})
+        assert cache.lookup(URL, {b"accept-encoding": b"gzip"}) is not None
+        assert cache.lookup(URL, {b"accept-encoding": b"br"}) is None
+
+    def test_refresh(self) -> None:
+        """Test that a 304 refreshes a stale entry."""
+        cache = ResponseCache()
+        entry = _store(cache, [(b"ETag", b'"v1"')])
+        assert entry is not None
+        refreshed = cache.refresh(entry, [(b"ETag", b'"v1"'), (b"Cache-Control", b"max-age=60")])
+        assert refreshed.is_fresh(time.time(), {})
+        assert refreshed.body == entry.body
+
+    def test_memory_lru_eviction(self) -> None:
+        """Test that the memory tier evicts least recently used URLs."""
+        cache = ResponseCache(max_memory_bytes=1000)
+        for i in range(10):
+            cache.store(
+                f"http://example.com:80/{i}", {}, 200, b"OK", [(b"ETag", b'"x"')], b"x" * 200
+            )
+        assert cache.lookup("http://example.com:80/0", {}) is None
+        assert cache.lookup("http://example.com:80/9", {}) is not None
+
+    def test_disk_tier(self, tmp_path: Path) -> None:
+        """Test that entries survive in the disk tier."""
+        cache = ResponseCache(disk_path=str(tmp_path))
+        _store(cache, [(b"Cache-Control", b"max-age=60")])
+
+        other_worker = ResponseCache(disk_path=str(tmp_path))
+        entry = other_worker.lookup(URL, {})
+        assert entry is not None
+        assert entry.body == b"console.log(1)"
+        assert entry.to_response(time.time()).startswith(b"HTTP/1.1 200 OK\r\n")
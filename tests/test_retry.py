@@ -0,0 +1,121 @@
+"""Tests for the API retry policy."""
+
+import httpx
+import pytest
+import respx
+
+from aluvia_sdk import AluviaApi, ApiError
+from aluvia_sdk.api.request import request_core
+from aluvia_sdk.api.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+BASE_URL = "https://api.test/v1"
+
+
+def fast_policy(max_attempts: int = 3) -> RetryPolicy:
+    """Build a policy with negligible delays."""
+    return RetryPolicy(max_attempts=max_attempts, base_delay=0.001, max_delay=0.002)
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy class."""
+
+    def test_parse_retry_after(self) -> None:
+        """Test delta-seconds and invalid values."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_retryable(self) -> None:
+        """Test which failures are retried per method."""
+        policy = RetryPolicy()
+        assert policy.is_retryable("GET", status=503)
+        assert not policy.is_retryable("POST", status=503)
+        assert policy.is_retryable("POST", status=429)
+        assert not policy.is_retryable("GET", status=404)
+        assert policy.is_retryable("POST", error=httpx.ConnectError("refused"))
+        assert not policy.is_retryable("POST", error=httpx.ReadTimeout("slow"))
+        assert policy.is_retryable("GET", error=httpx.ReadTimeout("slow"))
+
+    def test_decorrelated_jitter_bounds(self) -> None:
+        """Test that delays stay between the base and the cap."""
+        policy = RetryPolicy(max_attempts=100, base_delay=0.1, max_delay=1.0)
+        delay = None
+        for _ in range(8):
+            delay = policy.retry_delay("GET", 1, delay, status=503)
+            assert delay is not None and 0.1 <= delay <= 1.0
+
+    def test_retry_after(self) -> None:
+        """Test that Retry-After sets the delay and long waits give up."""
+        policy = RetryPolicy(max_retry_after=10)
+        assert policy.retry_delay("GET", 1, status=429, retry_after="2") == 2.0
+        assert policy.retry_delay("GET", 1, status=429, retry_after="60") is None
+
+    def test_max_attempts(self) -> None:
+        """Test that the last attempt is not retried."""
+        policy = RetryPolicy(max_attempts=2)
+        assert policy.retry_delay("GET", 1, status=503) is not None
+        assert policy.retry_delay("GET", 2, status=503) is None
+
+    def test_budget_limits_retries(self) -> None:
+        """Test that an exhausted budget stops retries."""
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.0, min_per_second=0.0, capacity=2))
+        assert policy.retry_delay("GET", 1, status=503) is not None
+        assert policy.retry_delay("GET", 1, status=503) is not None
+        assert policy.retry_delay("GET", 1, status=503) is None
+        assert policy.budget_exhausted == 1
+
+    def test_budget_deposits(self) -> None:
+        """Test that requests earn retry tokens."""
+        budget = RetryBudget(ratio=0.5, min_per_second=0.0, capacity=1)
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+
+
+class TestRequestCoreRetries:
+    """Tests for retries in request_core."""
+
+    @respx.mock
+    async def test_retries_5xx_then_succeeds(self) -> None:
+        """Test that a GET is retried after a 503."""
+        route = respx.get(f"{BASE_URL}/account").mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={"data": {}})]
+        )
+        result = await request_core(BASE_URL, "key", "GET", "/account", retry=fast_policy())
+        assert result["status"] == 200
+        assert result["attempts"] == 2
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_post_not_retried_on_5xx(self) -> None:
+        """Test that non-idempotent requests are not repeated after a 5xx."""
+        route = respx.post(f"{BASE_URL}/account/connections").mock(return_value=httpx.Response(502))
+        result = await request_core(
+            BASE_URL, "key", "POST", "/account/connections", body={}, retry=fast_policy()
+        )
+        assert result["status"] == 502
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_transport_errors_report_attempts(self) -> None:
+        """Test that exhausted retries raise ApiError with the attempt count."""
+        respx.get(f"{BASE_URL}/account").mock(side_effect=httpx.ConnectError("refused"))
+        with pytest.raises(ApiError) as exc_info:
+            await request_core(
+                BASE_URL, "key", "GET", "/account", retry=fast_policy(max_attempts=3)
+            )
+        assert exc_info.value.attempts == 3
+
+    @respx.mock
+    async def test_aluvia_api_uses_policy(self) -> None:
+        """Test that AluviaApi retries through its policy."""
+        respx.get(f"{BASE_URL}/account").mock(
+            side_effect=[httpx.Response(429), httpx.Response(200, json={"data": {"a": 1}})]
+        )
+        api = AluviaApi(api_key="key", api_base_url=BASE_URL, retry_policy=fast_policy())
+        assert await api.account.get() == {"a": 1}
+        assert api.retry_policy is not None and api.retry_policy.retries == 1
+        await api.close()
@@ -2,7 +2,14 @@
 
 import pytest
 
-from aluvia_sdk.client.rules import match_pattern, should_proxy
+from aluvia_sdk.client.rules import (
+    BlockRules,
+    CompiledRules,
+    host_key,
+    match_pattern,
+    should_proxy,
+    split_block_rules,
+)
 
 
 class TestMatchPattern:
@@ -89,3 +96,129 @@ class TestShouldProxy:
         assert not should_proxy("api.stripe.com", rules)
         assert not should_proxy("service.internal.com", rules)
         assert should_proxy("external.com", rules)
+
+
+class TestHostKey:
+    """Tests for host_key function."""
+
+    @pytest.mark.parametrize(
+        "authority,expected",
+        [
+            (b"example.com", "example.com"),
+            (b"Example.COM:443", "example.com"),
+            (b" api.example.com:8080 ", "api.example.com"),
+            (b"example.com.:80", "example.com"),
+            (b"[::1]:443", "::1"),
+            (b"[2001:DB8::1]", "2001:db8::1"),
+            (b"2001:db8::1", "2001:db8::1"),
+            (b"127.0.0.1:8080", "127.0.0.1"),
+        ],
+    )
+    def test_normalization(self, authority: bytes, expected: str) -> None:
+        """Test port, bracket, case and trailing dot handling."""
+        assert host_key(authority) == expected
+
+    @pytest.mark.parametrize("authority", [b"", b"  ", b":443", b"[::1", b"[]:443", b"."])
+    def test_invalid(self, authority: bytes) -> None:
+        """Test that empty or malformed authorities give no key."""
+        assert host_key(authority) is None
+
+    def test_feeds_compiled_rules(self) -> None:
+        """Test that keys match rules written for the bare host."""
+        compiled = CompiledRules(["*.example.com", "::1"])
+        assert compiled.should_proxy(host_key(b"API.Example.com:443") or "")
+        assert compiled.should_proxy(host_key(b"[::1]:443") or "")
+
+
+class TestCompiledRules:
+    """Tests for CompiledRules."""
+
+    RULE_SETS = [
+        [],
+        ["*"],
+        ["example.com"],
+        ["*", "-example.com"],
+        ["AUTO", "example.com"],
+        ["*.google.com"],
+        ["google.*", "-maps.google.com"],
+        ["*", "-api.stripe.com", "-*.internal.com"],
+        ["*.example.com", "!*.doubleclick.net"],
+    ]
+
+    HOSTNAMES = [
+        "example.com",
+        "EXAMPLE.COM",
+        "sub.example.com",
+        "google.com",
+        "google.co.uk",
+        "maps.google.com",
+        "googlex.com",
+        "api.stripe.com",
+        "service.internal.com",
+        "ad.doubleclick.net",
+        "",
+    ]
+
+    def test_matches_should_proxy(self) -> None:
+        """Test that compiled rules give the same decisions as should_proxy."""
+        for rules in self.RULE_SETS:
+            compiled = CompiledRules(rules)
+            for hostname in self.HOSTNAMES:
+                assert compiled.should_proxy(hostname) == should_proxy(hostname, rules), (
+                    hostname,
+                    rules,
+                )
+
+    def test_promote(self) -> None:
+        """Test promoting a hostname in place."""
+        compiled = CompiledRules(["*", "-internal.example.com"])
+        assert compiled.should_proxy("example.com")
+
+        compiled = CompiledRules(["-internal.example.com"])
+        assert not compiled.should_proxy("Blocked.com")
+        compiled.promote("Blocked.com")
+        assert compiled.should_proxy("Blocked.com")
+        assert compiled.should_proxy("blocked.com")
+        assert compiled.is_excluded("internal.example.com")
+
+    def test_block_rules_are_not_routing_rules(self) -> None:
+        """Test that '!' entries never cause proxying."""
+        compiled = CompiledRules(["!*.doubleclick.net"])
+        assert not compiled.should_proxy("ad.doubleclick.net")
+
+
+class TestBlockRules:
+    """Tests for BlockRules."""
+
+    def test_host_patterns(self) -> None:
+        """Test hostname block patterns."""
+        rules = BlockRules(["!*.doubleclick.net", "tracker.example.com"])
+        assert rules.is_blocked("ad.doubleclick.net")
+        assert rules.is_blocked("Tracker.Example.com")
+        assert not rules.is_blocked("doubleclick.net")
+        assert not rules.is_blocked("example.com")
+
+    def test_extension_patterns(self) -> None:
+        """Test path extension block patterns."""
+        rules = BlockRules(["ext:woff2", "ext:.mp4"])
+        assert rules.is_blocked("example.com", "/fonts/a.woff2")
+        assert rules.is_blocked("example.com", "/v/clip.MP4?t=1")
+        assert not rules.is_blocked("example.com", "/index.html")
+        assert not rules.is_blocked("cdn.woff2", None)
+
+    def test_single_label_wildcard_is_a_domain(self) -> None:
+        """Test that '*.cn' blocks the TLD, as it matches it in routing rules."""
+        rules = BlockRules(["!*.cn"])
+        assert rules.is_blocked("www.example.cn")
+        assert not rules.is_blocked("example.com", "/file.cn")
+
+    def test_path_patterns(self) -> None:
+        """Test path wildcard block patterns."""
+        rules = BlockRules(["/ads/*"])
+        assert rules.is_blocked("example.com", "/ads/banner.png")
+        assert not rules.is_blocked("example.com", "/news/ads")
+        assert not rules.is_blocked("example.com", None)
+
+    def test_split_block_rules(self) -> None:
+        """Test extracting block rules from a routing rules list."""
+        assert split_block_rules(["*", "!ext:woff2", "-example.com", "!"]) == ["ext:woff2"]
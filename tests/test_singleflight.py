@@ -0,0 +1,115 @@
+"""Tests for request coalescing."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+import respx
+
+from aluvia_sdk import AluviaApi
+from aluvia_sdk.api.singleflight import SingleFlight
+
+BASE_URL = "https://api.test/v1"
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight class."""
+
+    async def test_concurrent_calls_share_one_request(self) -> None:
+        """Test that callers of the same key share one call."""
+        flights = SingleFlight()
+        calls: List[int] = []
+
+        async def fetch() -> Dict[str, Any]:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"body": {"items": [1]}}
+
+        results = await asyncio.gather(*(flights.do("k", fetch) for _ in range(10)))
+        assert len(calls) == 1
+        assert all(r == {"body": {"items": [1]}} for r in results)
+        # Shared results are private copies
+        results[0]["body"]["items"].append(2)
+        assert results[1]["body"]["items"] == [1]
+        assert len(flights) == 0
+
+    async def test_sequential_calls_are_not_coalesced(self) -> None:
+        """Test that a finished call is not reused."""
+        flights = SingleFlight()
+        calls: List[int] = []
+
+        async def fetch() -> int:
+            calls.append(1)
+            return len(calls)
+
+        assert await flights.do("k", fetch) == 1
+        assert await flights.do("k", fetch) == 2
+
+    async def test_errors_are_shared(self) -> None:
+        """Test that every caller sees the error."""
+        flights = SingleFlight()
+
+        async def fail() -> None:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flights.do("k", fail), flights.do("k", fail), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_cancelling_one_caller_keeps_request(self) -> None:
+        """Test that other callers still get the result."""
+        flights = SingleFlight()
+
+        async def fetch() -> str:
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        first = asyncio.ensure_future(flights.do("k", fetch))
+        second = asyncio.ensure_future(flights.do("k", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == "ok"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_cancelling_last_caller_cancels_request(self) -> None:
+        """Test that the request stops when nobody waits for it."""
+        flights = SingleFlight()
+        finished: List[bool] = []
+
+        async def fetch() -> None:
+            await asyncio.sleep(0.05)
+            finished.append(True)
+
+        caller = asyncio.ensure_future(flights.do("k", fetch))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.sleep(0.08)
+        assert finished == []
+        assert len(flights) == 0
+
+
+class TestAluviaApiCoalescing:
+    """Tests for coalesced requests in AluviaApi."""
+
+    @respx.mock
+    async def test_coalesced_get(self) -> None:
+        """Test that concurrent opted-in GETs send one request."""
+
+        async def slow_account(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json={"success": True, "data": {"balance_gb": 5}})
+
+        route = respx.get(f"{BASE_URL}/account").mock(side_effect=slow_account)
+        api = AluviaApi(api_key="key", api_base_url=BASE_URL)
+
+        results = await asyncio.gather(*(api.account.get(coalesce=True) for _ in range(20)))
+        assert route.call_count == 1
+        assert all(r == {"balance_gb": 5} for r in results)
+
+        await asyncio.gather(*(api.account.get() for _ in range(3)))
+        assert route.call_count == 4
+        await api.close()
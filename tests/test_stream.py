@@ -0,0 +1,104 @@
+"""Tests for streaming list endpoints."""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, List
+
+import httpx
+import pytest
+import respx
+
+from aluvia_sdk import AluviaApi, ApiError, InvalidApiKeyError
+from aluvia_sdk.api.rate_limit import RateLimiter
+from aluvia_sdk.api.stream import iter_json_array
+
+BASE_URL = "https://api.test/v1"
+
+
+async def chunked(data: bytes, size: int) -> AsyncIterator[bytes]:
+    """Split data into fixed-size chunks."""
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+async def collect(data: bytes, size: int = 3) -> List[Any]:
+    """Parse data delivered in small chunks."""
+    return [item async for item in iter_json_array(chunked(data, size))]
+
+
+class TestIterJsonArray:
+    """Tests for iter_json_array function."""
+
+    async def test_envelope(self) -> None:
+        """Test the data member of the API envelope, split across chunks."""
+        items = [{"id": i, "name": f"conn-é-{i}"} for i in range(5)]
+        body = json.dumps({"success": True, "meta": {"x": [1, 2]}, "data": items}).encode()
+        for size in (1, 2, 7, 1000):
+            assert await collect(body, size) == items
+
+    async def test_top_level_array_with_numbers(self) -> None:
+        """Test that numbers split across chunks are not cut short."""
+        assert await collect(b"[12345, 678, 9]", size=2) == [12345, 678, 9]
+
+    async def test_empty_and_missing(self) -> None:
+        """Test empty arrays and envelopes without data."""
+        assert await collect(b'{"data": []}') == []
+        assert await collect(b'{"success": true}') == []
+
+    async def test_malformed(self) -> None:
+        """Test that malformed bodies raise ValueError."""
+        with pytest.raises(ValueError):
+            await collect(b'"text"')
+        with pytest.raises(ValueError):
+            await collect(b'{"data": [1 2]}')
+
+
+class TestIterEndpoints:
+    """Tests for iter_connections and iter_payments."""
+
+    @respx.mock
+    async def test_iter_connections(self) -> None:
+        """Test iterating over connections."""
+        items = [{"connection_id": i} for i in range(50)]
+        respx.get(f"{BASE_URL}/account/connections").mock(
+            return_value=httpx.Response(200, json={"success": True, "data": items})
+        )
+        api = AluviaApi(api_key="key", api_base_url=BASE_URL)
+        assert [c async for c in api.account.iter_connections()] == items
+        await api.close()
+
+    @respx.mock
+    async def test_errors(self) -> None:
+        """Test that error statuses raise before any item."""
+        respx.get(f"{BASE_URL}/account/payments").mock(return_value=httpx.Response(401))
+        respx.get(f"{BASE_URL}/account/connections").mock(return_value=httpx.Response(500))
+        api = AluviaApi(api_key="key", api_base_url=BASE_URL)
+        with pytest.raises(InvalidApiKeyError):
+            [p async for p in api.account.iter_payments()]
+        with pytest.raises(ApiError) as exc_info:
+            [c async for c in api.account.iter_connections()]
+        assert exc_info.value.status_code == 500
+        await api.close()
+
+    @respx.mock
+    async def test_open_stream_does_not_hold_slot(self) -> None:
+        """Test that a paused stream releases its concurrency slot once headers arrive."""
+        items = [{"connection_id": i} for i in range(3)]
+        respx.get(f"{BASE_URL}/account/connections").mock(
+            return_value=httpx.Response(200, json={"success": True, "data": items})
+        )
+        respx.get(f"{BASE_URL}/account/payments").mock(
+            return_value=httpx.Response(200, json={"success": True, "data": []})
+        )
+        api = AluviaApi(
+            api_key="key", api_base_url=BASE_URL, rate_limiter=RateLimiter(max_concurrency=1)
+        )
+        connections = api.account.iter_connections()
+        assert await connections.__anext__() == items[0]
+
+        async def drain() -> List[Any]:
+            return [p async for p in api.account.iter_payments()]
+
+        assert await asyncio.wait_for(drain(), timeout=1.0) == []
+        await connections.aclose()
+        await api.close()